@@ -9,17 +9,19 @@ import sys
 import streamlit as st
 from pathlib import Path
 
-# Set environment variables for Hugging Face Spaces
-os.environ["STREAMLIT_SERVER_HEADLESS"] = "true"
-os.environ["STREAMLIT_SERVER_ENABLE_CORS"] = "false"
-os.environ["STREAMLIT_SERVER_ENABLE_XSRF_PROTECTION"] = "false"
-os.environ["STREAMLIT_BROWSER_GATHER_USAGE_STATS"] = "false"
-
 # Add the src directory to Python path
 src_path = Path(__file__).parent / "src"
 if src_path.exists():
     sys.path.insert(0, str(src_path))
 
+# Server settings come from the committed .streamlit/config.toml (the prod profile), read before
+# this script runs; the profile's environment still has to be exported here
+try:
+    from server_profiles import apply_profile, profile_from_env
+    apply_profile(profile_from_env())
+except ImportError:
+    pass
+
 # Copy images to root level for Hugging Face Spaces
 def setup_assets():
     """Setup assets for Hugging Face Spaces deployment"""
@@ -0,0 +1,402 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for Bhumika's Portfolio deployment
+
+Usage:
+  python bench_portfolio.py docker     # image size and time to healthy, before vs after
+  python bench_portfolio.py profiles   # idle CPU, memory and rerun latency per server profile
+  python bench_portfolio.py pages      # per-page script time and payload vs the single-page layout
+  python bench_portfolio.py admission  # what a new visitor gets before, during and after overload
+  python bench_portfolio.py tokens     # per-rerun HTML payload before vs after the design-token classes
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from contextlib import ExitStack
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent
+sys.path.insert(0, str(REPO_ROOT / "src"))
+
+
+def run(cmd, **kwargs):
+    """Run a command, raising on failure, and return its stdout"""
+    return subprocess.run(cmd, check=True, capture_output=True, text=True, **kwargs).stdout.strip()
+
+
+def baseline_ref():
+    """The repository's first commit, used as the 'before' build"""
+    return run(["git", "rev-list", "--max-parents=0", "HEAD"], cwd=REPO_ROOT).splitlines()[0]
+
+
+def wait_until_healthy(url, timeout):
+    """Poll a health endpoint and return seconds until it answers 200, or None on timeout"""
+    start = time.perf_counter()
+    while time.perf_counter() - start < timeout:
+        try:
+            with urllib.request.urlopen(url, timeout=1) as response:
+                if response.status == 200:
+                    return time.perf_counter() - start
+        except OSError:
+            pass
+        time.sleep(0.1)
+    return None
+
+
+def measure_image(context_dir, tag, host_port, timeout):
+    """Build an image and measure its size, build time and time from start to healthy"""
+    start = time.perf_counter()
+    run(["docker", "build", "-q", "-t", tag, "."], cwd=context_dir)
+    build_seconds = time.perf_counter() - start
+    size_bytes = int(run(["docker", "image", "inspect", tag, "--format", "{{.Size}}"]))
+
+    container = run(["docker", "run", "-d", "--rm", "-p", f"{host_port}:8501", tag])
+    try:
+        healthy_seconds = wait_until_healthy(f"http://localhost:{host_port}/_stcore/health", timeout)
+    finally:
+        subprocess.run(["docker", "stop", container], capture_output=True)
+
+    return {"tag": tag, "size_mb": size_bytes / 1e6, "build_s": build_seconds, "healthy_s": healthy_seconds}
+
+
+def bench_docker(args):
+    """Compare the baseline single-stage image against the current multi-stage image"""
+    ref = args.before_ref or baseline_ref()
+    results = []
+
+    with tempfile.TemporaryDirectory() as before_dir:
+        # Export the 'before' tree so both builds start from a clean context
+        archive = subprocess.run(["git", "archive", ref], cwd=REPO_ROOT, check=True, capture_output=True).stdout
+        subprocess.run(["tar", "-x", "-C", before_dir], input=archive, check=True)
+        results.append(("before", measure_image(before_dir, "portfolio-bench:before", 18501, args.timeout)))
+
+    results.append(("after", measure_image(REPO_ROOT, "portfolio-bench:after", 18502, args.timeout)))
+
+    print(f"{'build':<8}{'image MB':>12}{'build s':>12}{'healthy s':>12}")
+    for label, result in results:
+        healthy = f"{result['healthy_s']:.2f}" if result["healthy_s"] is not None else "timeout"
+        print(f"{label:<8}{result['size_mb']:>12.1f}{result['build_s']:>12.1f}{healthy:>12}")
+
+    if args.json:
+        print(json.dumps(dict(results), indent=2))
+
+
+def process_usage(pid):
+    """CPU seconds used so far and resident memory in MB for a process (Linux /proc)"""
+    fields = Path(f"/proc/{pid}/stat").read_text().rsplit(")", 1)[1].split()
+    cpu_seconds = (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+    rss_pages = int(Path(f"/proc/{pid}/statm").read_text().split()[1])
+    return cpu_seconds, rss_pages * os.sysconf("SC_PAGE_SIZE") / 1e6
+
+
+def timed_reruns(port, reruns, page_name=""):
+    """Open a browser-like session and time full script reruns of one page, first (cold) one included
+
+    Returns (seconds, bytes sent to the browser) per rerun.
+    """
+    from websockets.sync.client import connect
+    from streamlit.proto.BackMsg_pb2 import BackMsg
+    from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+    runs = []
+    with connect(f"ws://localhost:{port}/_stcore/stream", subprotocols=["streamlit"], max_size=None) as ws:
+        for _ in range(reruns + 1):
+            message = BackMsg()
+            message.rerun_script.query_string = ""
+            message.rerun_script.page_name = page_name
+            start = time.perf_counter()
+            ws.send(message.SerializeToString())
+            payload = 0
+            while True:
+                data = ws.recv(timeout=60)
+                payload += len(data)
+                forward = ForwardMsg()
+                forward.ParseFromString(data)
+                if forward.WhichOneof("type") == "script_finished":
+                    break
+            runs.append((time.perf_counter() - start, payload))
+    return runs
+
+
+def start_app(port, env, flags=(), script="src/streamlit_app.py", root=REPO_ROOT):
+    """Start the app (from a checkout at root) on a port in the background and return its process"""
+    cmd = [sys.executable, "-m", "streamlit", "run", script,
+           f"--server.port={port}", *flags, "--server.headless=true"]
+    server = subprocess.Popen(cmd, cwd=root, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return server
+
+
+def measure_profile(profile, port, reruns, idle_seconds, timeout, data_dir):
+    """Start the app under a profile and measure startup, idle CPU, memory and rerun latency"""
+    from server_profiles import apply_profile, command_line_flags
+
+    env = apply_profile(profile, dict(os.environ))
+    # Benchmark traffic never touches the real analytics or contact outbox
+    env["PORTFOLIO_ANALYTICS_DB"] = str(Path(data_dir) / f"{profile}-analytics.sqlite3")
+    env["PORTFOLIO_CONTACT_DB"] = str(Path(data_dir) / f"{profile}-contact.sqlite3")
+    server = start_app(port, env, command_line_flags(profile))
+    try:
+        healthy_seconds = wait_until_healthy(f"http://localhost:{port}/_stcore/health", timeout)
+        if healthy_seconds is None:
+            raise RuntimeError(f"{profile} profile did not become healthy")
+
+        latencies = [seconds for seconds, _ in timed_reruns(port, reruns)]
+
+        # Idle after the session has been served, as between visitors in production
+        cpu_before, _ = process_usage(server.pid)
+        time.sleep(idle_seconds)
+        cpu_after, rss_mb = process_usage(server.pid)
+    finally:
+        server.terminate()
+        server.wait(timeout=10)
+
+    warm = sorted(latencies[1:])
+    return {
+        "healthy_s": healthy_seconds,
+        "idle_cpu_pct": 100 * (cpu_after - cpu_before) / idle_seconds,
+        "rss_mb": rss_mb,
+        "first_rerun_ms": 1000 * latencies[0],
+        "rerun_p50_ms": 1000 * statistics.median(warm),
+        "rerun_p95_ms": 1000 * warm[min(len(warm) - 1, int(0.95 * len(warm)))],
+    }
+
+
+def bench_profiles(args):
+    """Compare the server profiles under the same workload"""
+    from server_profiles import PROFILES
+
+    unknown = set(args.profiles) - set(PROFILES)
+    if unknown:
+        raise RuntimeError(f"unknown profiles: {', '.join(sorted(unknown))}")
+
+    results = {}
+    with tempfile.TemporaryDirectory() as data_dir:
+        for offset, profile in enumerate(args.profiles or PROFILES):
+            results[profile] = measure_profile(profile, args.port + offset, args.reruns, args.idle,
+                                               args.timeout, data_dir)
+
+    print(f"{'profile':<11}{'healthy s':>11}{'idle CPU %':>12}{'RSS MB':>9}"
+          f"{'1st rerun ms':>14}{'p50 ms':>9}{'p95 ms':>9}")
+    for profile, result in results.items():
+        print(f"{profile:<11}{result['healthy_s']:>11.2f}{result['idle_cpu_pct']:>12.2f}{result['rss_mb']:>9.1f}"
+              f"{result['first_rerun_ms']:>14.1f}{result['rerun_p50_ms']:>9.1f}{result['rerun_p95_ms']:>9.1f}")
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+
+
+# url_path of each page registered with st.navigation in src/streamlit_app.py
+PAGE_PATHS = ("home", "projects", "experience", "certifications", "contact")
+
+
+def measure_pages(port, reruns, timeout, env, page_paths, root=REPO_ROOT):
+    """Median warm rerun time and payload for each page of a running app"""
+    from server_profiles import command_line_flags
+
+    server = start_app(port, env, command_line_flags("prod"), root=root)
+    try:
+        if wait_until_healthy(f"http://localhost:{port}/_stcore/health", timeout) is None:
+            raise RuntimeError("app did not become healthy")
+        results = {}
+        for page_path in page_paths:
+            runs = timed_reruns(port, reruns, page_path)
+            results[page_path or "all"] = {
+                "first_ms": 1000 * runs[0][0],
+                "p50_ms": 1000 * statistics.median(seconds for seconds, _ in runs[1:]),
+                "payload_kb": statistics.median(payload for _, payload in runs[1:]) / 1024,
+            }
+    finally:
+        server.terminate()
+        server.wait(timeout=10)
+    return results
+
+
+def bench_pages(args):
+    """Compare each page under multipage navigation against the original single-page script"""
+    from server_profiles import apply_profile
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        env = apply_profile("prod", dict(os.environ))
+        env["PORTFOLIO_ANALYTICS_DB"] = str(Path(data_dir) / "analytics.sqlite3")
+        env["PORTFOLIO_CONTACT_DB"] = str(Path(data_dir) / "contact.sqlite3")
+
+        results = {"single page": measure_pages(args.port, args.reruns, args.timeout,
+                                                {**env, "PORTFOLIO_SINGLE_PAGE": "1"}, [""]),
+                   "multipage": measure_pages(args.port + 1, args.reruns, args.timeout,
+                                              {**env, "PORTFOLIO_SINGLE_PAGE": "0"}, PAGE_PATHS)}
+
+    print(f"{'layout':<13}{'page':<16}{'first ms':>10}{'p50 ms':>9}{'payload KB':>12}")
+    for layout, pages in results.items():
+        for page, result in pages.items():
+            print(f"{layout:<13}{page:<16}{result['first_ms']:>10.1f}{result['p50_ms']:>9.1f}"
+                  f"{result['payload_kb']:>12.1f}")
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+
+
+def page_load(port, path="/"):
+    """Load a page as a browser would; return seconds, final URL and bytes of HTML received"""
+    request = urllib.request.Request(f"http://localhost:{port}{path}", headers={"Accept": "text/html"})
+    start = time.perf_counter()
+    with urllib.request.urlopen(request, timeout=10) as response:
+        body = response.read()
+        return time.perf_counter() - start, response.url, len(body)
+
+
+def admission_status(port):
+    """The admission decision the static copy polls"""
+    with urllib.request.urlopen(f"http://localhost:{port}/_portfolio/admission", timeout=5) as response:
+        return json.loads(response.read())
+
+
+def bench_admission(args):
+    """Push a server past its session threshold and time diversion to the static copy and the hand-back"""
+    from websockets.sync.client import connect
+    from server_profiles import apply_profile, command_line_flags
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        env = apply_profile("prod", dict(os.environ))
+        env["PORTFOLIO_ANALYTICS_DB"] = str(Path(data_dir) / "analytics.sqlite3")
+        env["PORTFOLIO_CONTACT_DB"] = str(Path(data_dir) / "contact.sqlite3")
+        env["PORTFOLIO_ADMIT_MAX_SESSIONS"] = str(args.sessions)
+        server = start_app(args.port, env, command_line_flags("prod"), script="src/portfolio_server.py")
+        held = ExitStack()
+        try:
+            if wait_until_healthy(f"http://localhost:{args.port}/_stcore/health", args.timeout) is None:
+                raise RuntimeError("app did not become healthy")
+            results = {"normal": page_load(args.port, "/projects")}
+
+            for _ in range(args.sessions):
+                held.enter_context(connect(f"ws://localhost:{args.port}/_stcore/stream", subprotocols=["streamlit"]))
+            deadline = time.perf_counter() + args.timeout
+            while admission_status(args.port)["admit"]:
+                if time.perf_counter() > deadline:
+                    raise RuntimeError("server never reported overload")
+                time.sleep(0.1)
+            results["overloaded"] = page_load(args.port, "/projects")
+
+            held.close()
+            released = time.perf_counter()
+            while not admission_status(args.port)["admit"]:
+                if time.perf_counter() - released > args.timeout:
+                    raise RuntimeError("server never handed visitors back")
+                time.sleep(0.1)
+            handback_seconds = time.perf_counter() - released
+            results["recovered"] = page_load(args.port, "/projects")
+        finally:
+            held.close()
+            server.terminate()
+            server.wait(timeout=10)
+
+    print(f"{'state':<12}{'load ms':>9}{'HTML KB':>9}  served from")
+    for state, (seconds, url, size) in results.items():
+        print(f"{state:<12}{1000 * seconds:>9.1f}{size / 1024:>9.1f}  {url.split(str(args.port), 1)[1]}")
+    print(f"Visitors handed back {handback_seconds:.1f} s after load dropped "
+          f"(plus up to the static page's poll interval)")
+
+    if args.json:
+        print(json.dumps({"results": results, "handback_s": handback_seconds}, indent=2))
+
+
+def tokens_ref():
+    """The commit before design tokens were introduced, used as the 'before' tree"""
+    added = run(["git", "log", "--diff-filter=A", "--format=%H", "--", "src/design_tokens.py"], cwd=REPO_ROOT)
+    return f"{added.splitlines()[-1]}^" if added else "HEAD"
+
+
+def bench_tokens(args):
+    """Compare each page's per-rerun payload with inline styles against the design-token classes"""
+    from asset_pipeline import minify_css
+    from design_tokens import token_css
+    from server_profiles import apply_profile
+
+    ref = args.before_ref or tokens_ref()
+    # With PORTFOLIO_ASSET_URL the stylesheet comes from the asset server; without it, it is inlined every rerun
+    modes = {"asset server": f"http://localhost:{args.port + 9}", "inline CSS": ""}
+    results = {}
+    with tempfile.TemporaryDirectory() as before_dir, tempfile.TemporaryDirectory() as data_dir:
+        archive = subprocess.run(["git", "archive", ref], cwd=REPO_ROOT, check=True, capture_output=True).stdout
+        subprocess.run(["tar", "-x", "-C", before_dir], input=archive, check=True)
+        env = apply_profile("prod", dict(os.environ))
+        env["PORTFOLIO_ANALYTICS_DB"] = str(Path(data_dir) / "analytics.sqlite3")
+        env["PORTFOLIO_CONTACT_DB"] = str(Path(data_dir) / "contact.sqlite3")
+        port = args.port
+        for build, root in (("before", before_dir), ("after", REPO_ROOT)):
+            run([sys.executable, "src/asset_pipeline.py"], cwd=root)
+            for mode, asset_url in modes.items():
+                results[(mode, build)] = measure_pages(port, args.reruns, args.timeout,
+                                                       {**env, "PORTFOLIO_ASSET_URL": asset_url}, PAGE_PATHS, root)
+                port += 1
+
+    print(f"{'mode':<14}{'page':<16}{'before B':>10}{'after B':>10}{'saved B':>10}{'saved %':>9}")
+    for mode in modes:
+        for page in PAGE_PATHS:
+            old, new = (1024 * results[(mode, build)][page]["payload_kb"] for build in ("before", "after"))
+            print(f"{mode:<14}{page:<16}{old:>10.0f}{new:>10.0f}{old - new:>10.0f}{100 * (old - new) / old:>9.1f}")
+    print(f"Token stylesheet: {len(minify_css(token_css()).encode())} bytes minified, "
+          f"fetched once per browser from the asset server")
+
+    if args.json:
+        print(json.dumps({f"{mode} {build}": pages for (mode, build), pages in results.items()}, indent=2))
+
+
+def main():
+    """Parse arguments and run the selected benchmark"""
+    parser = argparse.ArgumentParser(description="Portfolio benchmarks")
+    subparsers = parser.add_subparsers(dest="benchmark", required=True)
+
+    docker = subparsers.add_parser("docker", help="image size and time to healthy, before vs after")
+    docker.add_argument("--before-ref", help="git ref for the 'before' image (default: first commit)")
+    docker.add_argument("--timeout", type=float, default=120, help="seconds to wait for health")
+    docker.add_argument("--json", action="store_true", help="also print raw results as JSON")
+    docker.set_defaults(func=bench_docker)
+
+    profiles = subparsers.add_parser("profiles", help="idle CPU, memory and rerun latency per server profile")
+    profiles.add_argument("profiles", nargs="*", help="profiles to compare (default: all)")
+    profiles.add_argument("--reruns", type=int, default=20, help="timed reruns after the first")
+    profiles.add_argument("--idle", type=float, default=10, help="seconds of idle CPU sampling")
+    profiles.add_argument("--port", type=int, default=18601, help="first port to run the app on")
+    profiles.add_argument("--timeout", type=float, default=60, help="seconds to wait for health")
+    profiles.add_argument("--json", action="store_true", help="also print raw results as JSON")
+    profiles.set_defaults(func=bench_profiles)
+
+    pages = subparsers.add_parser("pages", help="per-page script time and payload vs the single-page layout")
+    pages.add_argument("--reruns", type=int, default=20, help="timed reruns per page after the first")
+    pages.add_argument("--port", type=int, default=18651, help="first port to run the app on")
+    pages.add_argument("--timeout", type=float, default=60, help="seconds to wait for health")
+    pages.add_argument("--json", action="store_true", help="also print raw results as JSON")
+    pages.set_defaults(func=bench_pages)
+
+    admission = subparsers.add_parser("admission", help="page loads before, during and after overload")
+    admission.add_argument("--sessions", type=int, default=5, help="session threshold to push past")
+    admission.add_argument("--port", type=int, default=18671, help="port to run the app on")
+    admission.add_argument("--timeout", type=float, default=60, help="seconds to wait for each state")
+    admission.add_argument("--json", action="store_true", help="also print raw results as JSON")
+    admission.set_defaults(func=bench_admission)
+
+    tokens = subparsers.add_parser("tokens", help="per-rerun HTML payload before vs after design tokens")
+    tokens.add_argument("--before-ref", help="git ref for the 'before' tree (default: before design tokens)")
+    tokens.add_argument("--reruns", type=int, default=10, help="timed reruns per page after the first")
+    tokens.add_argument("--port", type=int, default=18681, help="first port to run the app on")
+    tokens.add_argument("--timeout", type=float, default=60, help="seconds to wait for health")
+    tokens.add_argument("--json", action="store_true", help="also print raw results as JSON")
+    tokens.set_defaults(func=bench_tokens)
+
+    args = parser.parse_args()
+    try:
+        args.func(args)
+    except (subprocess.CalledProcessError, RuntimeError, OSError) as e:
+        print(f"❌ Benchmark failed: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,12 +3,20 @@
 Enhanced startup script for Bhumika's Portfolio with comprehensive error handling
 """
 
+import argparse
 import os
 import sys
 import subprocess
 from pathlib import Path
 
-def setup_environment():
+# Make the app modules under src/ importable, mirroring app.py
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from server_profiles import PROFILES, apply_profile, command_line_flags, profile_from_env, write_config
+
+ASSET_PORT = int(os.environ.get("PORTFOLIO_ASSET_PORT", "8502"))
+
+def setup_environment(profile):
     """Setup environment variables to avoid permission issues"""
     # Set STREAMLIT_HOME to current directory to avoid permission issues
     os.environ['STREAMLIT_HOME'] = os.getcwd()
@@ -20,7 +28,10 @@ def setup_environment():
     os.environ['STREAMLIT_SERVER_ENABLE_CORS'] = 'false'
     os.environ['STREAMLIT_SERVER_ENABLE_XSRF_PROTECTION'] = 'false'
     
-    print("✅ Environment configured successfully")
+    # Profile settings (reload interval, data paths) apply to the app and the asset server alike
+    apply_profile(profile)
+    
+    print(f"✅ Environment configured successfully ({profile} profile)")
 
 def check_requirements():
     """Check if all requirements are installed"""
@@ -63,8 +74,29 @@ def check_files():
     print("✅ All required files are present")
     return True
 
-def run_streamlit():
-    """Run the Streamlit app with proper configuration"""
+def start_asset_server():
+    """Build hashed, precompressed assets and serve them from a companion server"""
+    # Visitors' browsers fetch assets from this URL, so it must be the server's public address;
+    # a default such as localhost would point every remote visitor at their own machine
+    asset_url = os.environ.get("PORTFOLIO_ASSET_URL", "")
+    if not asset_url:
+        print(f"ℹ️ PORTFOLIO_ASSET_URL not set; serving inline CSS and Streamlit media "
+              f"(set it to the public address of port {ASSET_PORT} to use the asset server)")
+        return False
+    try:
+        from asset_pipeline import ensure_assets
+        from asset_server import serve_in_background
+
+        manifest = ensure_assets()
+        serve_in_background(port=ASSET_PORT)
+        print(f"✅ Serving {len(manifest['files'])} immutable assets at {asset_url}")
+        return True
+    except Exception as e:
+        print(f"⚠️ Asset server unavailable, images will use Streamlit media: {e}")
+        return False
+
+def run_streamlit(profile):
+    """Run the Streamlit app with the selected server profile"""
     try:
         # Create .streamlit directory if it doesn't exist
         streamlit_dir = Path(".streamlit")
@@ -76,14 +108,14 @@ def run_streamlit():
         print("📍 URL: http://localhost:8501")
         print("⏹️  Press Ctrl+C to stop the server")
         
-        # Run streamlit with explicit configuration
+        # Run streamlit with the profile as flags, which override any config.toml on disk; the
+        # ASGI entry point puts admission control in front of src/streamlit_app.py
         cmd = [
             sys.executable, "-m", "streamlit", "run", 
-            "src/streamlit_app.py",
+            "src/portfolio_server.py",
             "--server.port=8501",
-            "--server.address=localhost",
-            "--browser.gatherUsageStats=false",
-            "--global.developmentMode=false"
+            f"--server.address={os.environ.get('PORTFOLIO_ADDRESS', 'localhost')}",
+            *command_line_flags(profile)
         ]
         
         subprocess.run(cmd, check=True)
@@ -92,17 +124,31 @@ def run_streamlit():
         print("\n✅ Portfolio stopped by user")
     except subprocess.CalledProcessError as e:
         print(f"❌ Error running Streamlit: {e}")
-        print("Try running manually: streamlit run src/streamlit_app.py")
+        print("Try running manually: streamlit run src/portfolio_server.py")
     except Exception as e:
         print(f"❌ Unexpected error: {e}")
 
+def parse_args():
+    """Parse the launcher's command line"""
+    parser = argparse.ArgumentParser(description="Run Bhumika's Portfolio")
+    parser.add_argument("--profile", choices=sorted(PROFILES), default=profile_from_env(),
+                        help="server profile (default: $PORTFOLIO_PROFILE or prod)")
+    parser.add_argument("--write-config", action="store_true",
+                        help="write the profile to .streamlit/config.toml and exit")
+    return parser.parse_args()
+
 def main():
     """Main function to run the portfolio"""
+    args = parse_args()
+    if args.write_config:
+        print(f"✅ Wrote {write_config(args.profile)}")
+        return
+    
     print("🎨 Bhumika's Portfolio Launcher")
     print("=" * 40)
     
     # Setup environment
-    setup_environment()
+    setup_environment(args.profile)
     
     # Check requirements
     if not check_requirements():
@@ -112,8 +158,11 @@ def main():
     if not check_files():
         sys.exit(1)
     
+    # Serve immutable assets alongside the app when a public asset URL is configured
+    start_asset_server()
+    
     # Run the portfolio
-    run_streamlit()
+    run_streamlit(args.profile)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
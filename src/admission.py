@@ -0,0 +1,232 @@
+"""
+Admission control: past a session or event-loop lag threshold, new visitors get the static prerendered page
+"""
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from urllib.parse import parse_qs, quote
+
+from asset_pipeline import BUILD_DIR
+from content import content_version
+from diagnostics import active_session_count
+from static_export import export_site
+from tenants import DEFAULT_TENANT, tenant_id_from
+
+ADMIT_MAX_SESSIONS = 150
+ADMIT_MAX_LAG_MS = 250
+# Load must fall this far below both thresholds before visitors are handed back (hysteresis)
+RESUME_FRACTION = 0.7
+SAMPLE_INTERVAL_SECONDS = 1.0
+# Weight of the newest lag sample, so a single slow callback does not flip the state
+LAG_SMOOTHING = 0.3
+# How often the static page asks whether the live app is accepting visitors again
+HANDBACK_POLL_SECONDS = 15
+
+STATIC_COPY_DIR = BUILD_DIR / "static"
+STATIC_PATH = "/_portfolio/static"
+STATUS_PATH = "/_portfolio/admission"
+# Streamlit's own endpoints and ours; only page loads are ever diverted
+PASSTHROUGH_PREFIXES = ("/_stcore/", "/static/", "/media/", "/component/", "/app/static/", "/_portfolio/")
+
+HANDBACK = """\
+<div class="admission-banner" style="position: fixed; bottom: 0; left: 0; right: 0; padding: 10px;
+     text-align: center; background: rgba(10, 25, 47, 0.95); color: #ccd6f6; border-top: 1px solid #64ffda;">
+⚡ The portfolio is very busy, so this is a lightweight copy. The interactive version returns automatically.
+</div>
+<script>
+(function () {
+    var next = new URLSearchParams(location.search).get("next") || "/";
+    if (next.charAt(0) !== "/" || next.charAt(1) === "/") {
+        next = "/";
+    }
+    function poll() {
+        fetch("%(status_path)s", {cache: "no-store"})
+            .then(function (response) { return response.json(); })
+            .then(function (status) {
+                if (status.admit) {
+                    location.replace(next);
+                } else {
+                    setTimeout(poll, %(poll_ms)d);
+                }
+            })
+            .catch(function () { setTimeout(poll, %(poll_ms)d); });
+    }
+    setTimeout(poll, %(poll_ms)d);
+})();
+</script>"""
+
+
+def handback_markup(status_path=STATUS_PATH, poll_seconds=HANDBACK_POLL_SECONDS):
+    """Banner and script that send a visitor back to the live app once it admits them"""
+    return HANDBACK % {"status_path": status_path, "poll_ms": int(poll_seconds * 1000)}
+
+
+def ensure_static_copy(out_dir=STATIC_COPY_DIR):
+    """Reuse the prerendered copy while it still matches the content, else export it again"""
+    out_dir = Path(out_dir)
+    try:
+        if json.loads((out_dir / "manifest.json").read_text(encoding="utf-8"))["content_version"] == content_version():
+            return out_dir
+    except (OSError, ValueError, KeyError):
+        pass
+    export_site(out_dir, handback_markup())
+    return out_dir
+
+
+class LoadMonitor:
+    """Samples concurrent sessions and event-loop lag and decides whether new visitors are admitted"""
+
+    def __init__(self, max_sessions=ADMIT_MAX_SESSIONS, max_lag_ms=ADMIT_MAX_LAG_MS,
+                 interval=SAMPLE_INTERVAL_SECONDS, session_count=active_session_count):
+        self.max_sessions = max_sessions
+        self.max_lag_ms = max_lag_ms
+        self.interval = interval
+        self.session_count = session_count
+        self.overloaded = False
+        self.sessions = 0
+        self.lag_ms = 0.0
+        self.diverted = 0
+        self.episodes = 0
+        self.changed_at = time.time()
+        self._loop = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._worker = None
+
+    def sample(self, sessions, lag_ms):
+        """Fold in one measurement and return whether new visitors are now admitted"""
+        with self._lock:
+            self.sessions = sessions
+            self.lag_ms = LAG_SMOOTHING * lag_ms + (1 - LAG_SMOOTHING) * self.lag_ms
+            if self.overloaded:
+                recovered = (self.sessions <= RESUME_FRACTION * self.max_sessions
+                             and self.lag_ms <= RESUME_FRACTION * self.max_lag_ms)
+                if recovered:
+                    self.overloaded = False
+                    self.changed_at = time.time()
+            elif self.sessions >= self.max_sessions or self.lag_ms >= self.max_lag_ms:
+                self.overloaded = True
+                self.episodes += 1
+                self.changed_at = time.time()
+            return not self.overloaded
+
+    def measure_lag(self):
+        """Milliseconds the server's event loop took to run a callback posted from this thread"""
+        if self._loop is None:
+            return 0.0
+        ran = threading.Event()
+        started = time.perf_counter()
+        try:
+            self._loop.call_soon_threadsafe(ran.set)
+        except RuntimeError:
+            # The loop has closed; the server is shutting down
+            return 0.0
+        # A loop blocked for longer than the timeout counts as lagging by the timeout
+        ran.wait(max(1.0, 4 * self.max_lag_ms / 1000))
+        return 1000 * (time.perf_counter() - started)
+
+    def admit(self):
+        """Whether a new visitor gets a live session; counts those sent to the static copy"""
+        with self._lock:
+            if self.overloaded:
+                self.diverted += 1
+            return not self.overloaded
+
+    def status(self):
+        """Current load and decision, as served to the static page's hand-back poll"""
+        with self._lock:
+            return {"admit": not self.overloaded, "sessions": self.sessions, "lag_ms": round(self.lag_ms, 1),
+                    "max_sessions": self.max_sessions, "max_lag_ms": self.max_lag_ms,
+                    "diverted": self.diverted, "episodes": self.episodes, "since": self.changed_at,
+                    "running": self._worker is not None and self._worker.is_alive()}
+
+    def run(self):
+        """Sample until stopped"""
+        while not self._stop.wait(self.interval):
+            lag_ms = self.measure_lag()
+            sessions = self.session_count()
+            self.sample(sessions if sessions is not None else 0, lag_ms)
+
+    def start(self, loop):
+        """Start sampling the given event loop unless already running"""
+        with self._lock:
+            if self._worker is not None and self._worker.is_alive():
+                return False
+            self._loop = loop
+            self._stop.clear()
+            self._worker = threading.Thread(target=self.run, name="load-monitor", daemon=True)
+            self._worker.start()
+        return True
+
+    def stop(self):
+        """Ask the sampling thread to exit"""
+        self._stop.set()
+
+
+_monitor = None
+_monitor_lock = threading.Lock()
+
+
+def get_monitor(environ=os.environ):
+    """Return the process-wide load monitor, configured from the environment on first use"""
+    global _monitor
+    with _monitor_lock:
+        if _monitor is None:
+            _monitor = LoadMonitor(max_sessions=int(environ.get("PORTFOLIO_ADMIT_MAX_SESSIONS", ADMIT_MAX_SESSIONS)),
+                                   max_lag_ms=float(environ.get("PORTFOLIO_ADMIT_MAX_LAG_MS", ADMIT_MAX_LAG_MS)))
+        return _monitor
+
+
+def header(scope, name):
+    """A request header from an ASGI scope, decoded, or an empty string"""
+    for key, value in scope.get("headers", []):
+        if key == name:
+            return value.decode("latin-1")
+    return ""
+
+
+def request_tenant(scope):
+    """The tenant a request selects with ?tenant=, or the built-in portfolio"""
+    params = parse_qs(scope.get("query_string", b"").decode("latin-1"))
+    return tenant_id_from({key: values[0] for key, values in params.items()})
+
+
+def is_page_load(scope):
+    """Whether a request is a browser loading an app page, the one request that leads to a new session"""
+    return (scope["type"] == "http" and scope["method"] in ("GET", "HEAD")
+            and not scope["path"].startswith(PASSTHROUGH_PREFIXES)
+            and "text/html" in header(scope, b"accept"))
+
+
+async def send_response(send, status, headers, body=b""):
+    """Send a complete ASGI HTTP response"""
+    await send({"type": "http.response.start", "status": status,
+                "headers": [(key.encode("latin-1"), value.encode("latin-1")) for key, value in headers]})
+    await send({"type": "http.response.body", "body": body})
+
+
+class AdmissionMiddleware:
+    """ASGI middleware in front of Streamlit: diverts new page loads to the static copy while overloaded
+
+    The static copy is the built-in portfolio, so tenant page loads (?tenant=) always reach the app.
+    """
+
+    def __init__(self, app, monitor=None, static_path=STATIC_PATH):
+        self.app = app
+        self.monitor = monitor or get_monitor()
+        self.static_path = static_path
+
+    async def __call__(self, scope, receive, send):
+        if is_page_load(scope) and request_tenant(scope) == DEFAULT_TENANT and not self.monitor.admit():
+            target = scope["path"]
+            if scope.get("query_string"):
+                target += "?" + scope["query_string"].decode("latin-1")
+            # Temporary and uncached, so the same URL reaches the live app again once load drops
+            await send_response(send, 307, [("location", f"{self.static_path}/?next={quote(target, safe='')}"),
+                                            ("cache-control", "no-store"),
+                                            ("retry-after", str(HANDBACK_POLL_SECONDS))])
+            return
+        await self.app(scope, receive, send)
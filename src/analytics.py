@@ -0,0 +1,174 @@
+"""
+Visitor analytics: a queue drained in batches into SQLite (WAL) and vectorized aggregation for the dashboard
+"""
+
+import os
+import queue
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from content import default_bundle
+
+ANALYTICS_DB_PATH = Path(os.environ.get(
+    "PORTFOLIO_ANALYTICS_DB", Path(__file__).resolve().parent.parent / "data" / "analytics.sqlite3"))
+SECONDS_PER_DAY = 86400
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    ts REAL NOT NULL,
+    kind TEXT NOT NULL,
+    target TEXT NOT NULL,
+    session TEXT NOT NULL DEFAULT ''
+)
+"""
+
+
+def connect(path=ANALYTICS_DB_PATH):
+    """Open the events database in WAL mode so the dashboard can read while the writer appends"""
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    connection = sqlite3.connect(path, timeout=5)
+    connection.execute("PRAGMA journal_mode=WAL")
+    # NORMAL is durable across application crashes in WAL mode and avoids an fsync per commit
+    connection.execute("PRAGMA synchronous=NORMAL")
+    connection.execute(SCHEMA)
+    return connection
+
+
+def tracked_links(bundle=None):
+    """Map (kind, id) to the outbound URL a click redirect may send visitors to"""
+    bundle = bundle or default_bundle()
+    links = {("project", project["id"]): project["demo_url"] for project in bundle["projects"]}
+    links.update({("certificate", course["id"]): course["certificate_url"] for course in bundle["courses"]})
+    return links
+
+
+class AnalyticsRecorder:
+    """Non-blocking event sink: record() only enqueues, a writer thread inserts in batches"""
+
+    def __init__(self, path=ANALYTICS_DB_PATH, batch_size=500, flush_interval=1.0, max_queue=10000):
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.dropped = 0
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._worker = None
+        self._lock = threading.Lock()
+
+    def record(self, kind, target, session=""):
+        """Enqueue one event; drops it rather than blocking when the writer has fallen behind"""
+        try:
+            self._queue.put_nowait((time.time(), kind, target, session))
+        except queue.Full:
+            self.dropped += 1
+
+    def start(self):
+        """Start the writer thread unless it is already running"""
+        with self._lock:
+            if self._worker is not None and self._worker.is_alive():
+                return False
+            self._worker = threading.Thread(target=self.run, name="analytics-writer", daemon=True)
+            self._worker.start()
+        return True
+
+    def run(self):
+        """Drain the queue in batches, one transaction per batch"""
+        connection = connect(self.path)
+        while True:
+            try:
+                batch = [self._queue.get(timeout=self.flush_interval)]
+            except queue.Empty:
+                continue
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            events = [event for event in batch if event is not None]
+            try:
+                with connection:
+                    connection.executemany("INSERT INTO events (ts, kind, target, session) VALUES (?, ?, ?, ?)",
+                                           events)
+            except sqlite3.Error:
+                self.dropped += len(events)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+            if len(events) < len(batch):
+                connection.close()
+                return
+
+    def flush(self):
+        """Block until every queued event has been written"""
+        self._queue.join()
+
+    def close(self):
+        """Write what is queued, then stop the writer thread"""
+        self._queue.put(None)
+        if self._worker is not None:
+            self._worker.join()
+
+
+_recorder = None
+_recorder_lock = threading.Lock()
+
+
+def get_recorder():
+    """Return the process-wide analytics recorder, starting its writer on first use"""
+    global _recorder
+    with _recorder_lock:
+        if _recorder is None:
+            _recorder = AnalyticsRecorder()
+            _recorder.start()
+        return _recorder
+
+
+def load_events(path=ANALYTICS_DB_PATH, since=None):
+    """Load events into a DataFrame with categorical kind/target columns"""
+    connection = connect(path)
+    try:
+        events = pd.read_sql_query("SELECT ts, kind, target, session FROM events WHERE ts >= ?",
+                                   connection, params=(since or 0,))
+    finally:
+        connection.close()
+    return events.astype({"kind": "category", "target": "category", "session": "category"})
+
+
+def summarize(events):
+    """Aggregate events into totals, per-target counts and a daily series without Python loops"""
+    if events.empty:
+        return {"total": 0, "sessions": 0, "by_target": pd.DataFrame(columns=["kind", "target", "events"]),
+                "daily": pd.DataFrame(columns=["day", "events", "sessions"])}
+
+    by_target = (events.groupby(["kind", "target"], observed=True).size()
+                 .rename("events").reset_index().sort_values("events", ascending=False, ignore_index=True))
+
+    days = (events["ts"].to_numpy() // SECONDS_PER_DAY).astype(np.int64)
+    first_day = days.min()
+    counts = np.bincount(days - first_day)
+
+    # Distinct (day, session) pairs give unique visitors per day; '' marks events without a session
+    codes = events["session"].cat.codes.to_numpy().astype(np.int64)
+    categories = events["session"].cat.categories
+    named = codes != (categories.get_loc("") if "" in categories else -1)
+    width = codes.max() + 1
+    pairs = np.unique((days[named] - first_day) * width + codes[named])
+
+    daily = pd.DataFrame({
+        "day": pd.to_datetime((first_day + np.arange(len(counts))) * SECONDS_PER_DAY, unit="s"),
+        "events": counts,
+        "sessions": np.bincount(pairs // width, minlength=len(counts)),
+    })
+
+    return {
+        "total": len(events),
+        "sessions": len(np.unique(codes[named])),
+        "by_target": by_target,
+        "daily": daily,
+    }
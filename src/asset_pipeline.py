@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Content-hashed, precompressed asset builds shared by the asset server and the static export
+
+Usage: python src/asset_pipeline.py [--index-only]  (builds every derived artifact into build/)
+"""
+
+import argparse
+import base64
+import gzip
+import hashlib
+import io
+import json
+import os
+import re
+from pathlib import Path
+
+from content import PROFILE, SHOWCASE
+from templates import stylesheet
+from search_index import build_index, save_index
+from image_service import resize_image, variant_name
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    from PIL import Image, ImageFilter
+except ImportError:
+    Image = None
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+# PORTFOLIO_BUILD_DIR moves every derived artifact and runtime cache, e.g. into a temporary directory for tests
+BUILD_DIR = Path(os.environ.get("PORTFOLIO_BUILD_DIR", REPO_ROOT / "build"))
+ASSET_DIR = BUILD_DIR / "assets"
+SEARCH_INDEX_PATH = BUILD_DIR / "search_index.pickle"
+# Widths outside PREBUILT_WIDTHS are resized on demand into this size-bounded cache
+VARIANT_CACHE_DIR = BUILD_DIR / "variants"
+# Certificate previews generated by a background worker, with an index from certificate to file
+THUMBNAIL_CACHE_DIR = BUILD_DIR / "thumbnails"
+THUMBNAIL_INDEX_PATH = BUILD_DIR / "thumbnails.json"
+MANIFEST_NAME = "manifest.json"
+COMPRESSIBLE_SUFFIXES = {".html", ".css", ".js", ".json", ".svg"}
+# Browsers and static servers only know .jfif files as JPEG under the .jpg extension
+IMAGE_SUFFIXES = {".jfif": ".jpg"}
+STYLESHEET_KEY = "portfolio.css"
+# Placeholders are tiny blurred thumbnails, a few hundred bytes once base64-encoded
+PLACEHOLDER_WIDTH = 16
+# Display widths the page uses, at 1x and 2x
+PREBUILT_WIDTHS = (300, 600)
+
+
+def content_hash(data):
+    """Short content hash used in immutable asset file names"""
+    return hashlib.sha256(data).hexdigest()[:12]
+
+
+def minify_css(css):
+    """Strip comments and redundant whitespace from a stylesheet"""
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{};,>])\s*", r"\1", css)
+    css = re.sub(r":\s+", ":", css)
+    return css.replace(" !important", "!important").replace(";}", "}").strip()
+
+
+def write_hashed(data, stem, suffix, out_dir):
+    """Write data under a content-hashed name and return that file name"""
+    name = f"{stem}.{content_hash(data)}{suffix}"
+    (out_dir / name).write_bytes(data)
+    return name
+
+
+def precompress_file(path):
+    """Write gzip (and brotli, when available) copies next to a text file"""
+    data = path.read_bytes()
+    # mtime=0 keeps the .gz output byte-identical across builds
+    path.with_name(path.name + ".gz").write_bytes(gzip.compress(data, compresslevel=9, mtime=0))
+    if brotli is not None:
+        path.with_name(path.name + ".br").write_bytes(brotli.compress(data, quality=11))
+
+
+def precompress(out_dir):
+    """Precompress every text file in a build directory"""
+    for path in sorted(Path(out_dir).rglob("*")):
+        if path.is_file() and path.suffix in COMPRESSIBLE_SUFFIXES:
+            precompress_file(path)
+
+
+def image_sources():
+    """Return the repo-relative paths of every image the page shows"""
+    return list(dict.fromkeys([PROFILE["photo"]] + [item["image"] for item in SHOWCASE]))
+
+
+def image_metadata(source):
+    """Intrinsic size, dominant color and a blurred data-URI placeholder for an image"""
+    if Image is None:
+        return None
+
+    with Image.open(source) as image:
+        image = image.convert("RGB")
+        width, height = image.size
+
+        red, green, blue = image.resize((1, 1), Image.Resampling.BOX).getpixel((0, 0))
+
+        thumb_height = max(1, round(height * PLACEHOLDER_WIDTH / width))
+        thumb = image.resize((PLACEHOLDER_WIDTH, thumb_height), Image.Resampling.BILINEAR)
+        thumb = thumb.filter(ImageFilter.GaussianBlur(1))
+        buffer = io.BytesIO()
+        thumb.save(buffer, format="JPEG", quality=40, optimize=True)
+
+    return {
+        "width": width,
+        "height": height,
+        "color": f"#{red:02x}{green:02x}{blue:02x}",
+        "placeholder": "data:image/jpeg;base64," + base64.b64encode(buffer.getvalue()).decode("ascii"),
+    }
+
+
+def source_version():
+    """Hash of every asset source, so a build can tell whether it is current"""
+    digest = hashlib.sha256(stylesheet().encode("utf-8"))
+    for image_path in image_sources():
+        digest.update((REPO_ROOT / image_path).read_bytes())
+    return digest.hexdigest()[:12]
+
+
+def build_assets(out_dir=ASSET_DIR):
+    """Write hashed, precompressed copies of the stylesheet and images and return the manifest"""
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    css = minify_css(stylesheet())
+    files = {STYLESHEET_KEY: write_hashed(css.encode("utf-8"), "portfolio", ".css", out_dir)}
+    images = {}
+    variants = {}
+    for image_path in image_sources():
+        source = REPO_ROOT / image_path
+        suffix = IMAGE_SUFFIXES.get(source.suffix.lower(), source.suffix.lower())
+        files[image_path] = write_hashed(source.read_bytes(), source.stem, suffix, out_dir)
+        metadata = image_metadata(source)
+        if metadata is not None:
+            images[image_path] = metadata
+            variants[image_path] = {}
+            for width in PREBUILT_WIDTHS:
+                if width < metadata["width"]:
+                    name = variant_name(source, width)
+                    (out_dir / name).write_bytes(resize_image(source, width))
+                    variants[image_path][str(width)] = name
+
+    precompress(out_dir)
+
+    manifest = {
+        "version": content_hash(json.dumps(files, sort_keys=True).encode("utf-8")),
+        "source_version": source_version(),
+        "files": files,
+        "images": images,
+        "variants": variants,
+    }
+    (out_dir / MANIFEST_NAME).write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    return manifest
+
+
+def load_manifest(out_dir=ASSET_DIR):
+    """Return the manifest of a previous build, or None when assets have not been built"""
+    try:
+        return json.loads((Path(out_dir) / MANIFEST_NAME).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def ensure_assets(out_dir=ASSET_DIR):
+    """Reuse assets prebuilt into the image when their sources are unchanged, else rebuild"""
+    manifest = load_manifest(out_dir)
+    if manifest is not None and manifest.get("source_version") == source_version():
+        return manifest
+    return build_assets(out_dir)
+
+
+def build_all(assets=True):
+    """Build every derived artifact: hashed assets (unless assets is False) and the prebuilt search index"""
+    manifest = build_assets() if assets else None
+    save_index(build_index(), SEARCH_INDEX_PATH)
+    return manifest
+
+
+def main():
+    """Build the derived artifacts"""
+    parser = argparse.ArgumentParser(description="Build hashed assets and the search index")
+    parser.add_argument("--index-only", action="store_true",
+                        help="skip the hashed assets, which only the asset server uses")
+    args = parser.parse_args()
+
+    manifest = build_all(assets=not args.index_only)
+    if manifest is None:
+        print(f"✅ Built the search index into {BUILD_DIR}")
+    else:
+        print(f"✅ Built {len(manifest['files'])} assets and the search index into {BUILD_DIR}")
+
+
+if __name__ == "__main__":
+    main()
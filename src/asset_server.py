@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Companion server for immutable, precompressed portfolio assets
+
+Usage: python src/asset_server.py --port 8502
+"""
+
+import argparse
+import mimetypes
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from asset_pipeline import ASSET_DIR, MANIFEST_NAME, THUMBNAIL_CACHE_DIR, VARIANT_CACHE_DIR, ensure_assets
+from analytics import get_recorder, tracked_links
+from hot_reload import file_mtimes, load_module_bundle
+from tenants import CONTENT_MODULE_PATH
+
+IMMUTABLE_CACHE = "public, max-age=31536000, immutable"
+# Preferred first; identity is always available
+ENCODINGS = [("br", ".br"), ("gzip", ".gz")]
+
+mimetypes.add_type("text/css", ".css")
+mimetypes.add_type("image/jpeg", ".jpg")
+
+
+def index_assets(asset_dir):
+    """Map every served file name to its encoded variants, computed once at startup"""
+    asset_dir = Path(asset_dir)
+    index = {}
+    for path in asset_dir.iterdir():
+        if not path.is_file() or path.suffix in (".br", ".gz") or path.name == MANIFEST_NAME:
+            continue
+        # Hashed names are <stem>.<hash>.<ext>, so the hash doubles as a strong validator
+        digest = path.name.rsplit(".", 2)[-2]
+        variants = {"identity": (path, f'"{digest}"')}
+        for encoding, suffix in ENCODINGS:
+            encoded = path.with_name(path.name + suffix)
+            if encoded.exists():
+                variants[encoding] = (encoded, f'"{digest}-{encoding}"')
+        index[path.name] = {
+            "content_type": mimetypes.guess_type(path.name)[0] or "application/octet-stream",
+            "variants": variants,
+        }
+    return index
+
+
+def variant_asset(variant_dir, name):
+    """Look up an on-demand resized variant or thumbnail, which may appear after startup"""
+    if variant_dir is None or "/" in name or name.startswith(".") or name.endswith(".tmp"):
+        return None
+    path = Path(variant_dir) / name
+    if not path.is_file():
+        return None
+    return {
+        "content_type": mimetypes.guess_type(path.name)[0] or "application/octet-stream",
+        # Variant names embed the source hash and width, so the stem is a strong validator
+        "variants": {"identity": (path, f'"{path.stem}"')},
+    }
+
+
+def accepted_encodings(header):
+    """Parse Accept-Encoding into the set of codings the client will take"""
+    accepted = set()
+    for part in (header or "").split(","):
+        coding, _, params = part.strip().partition(";")
+        if coding and params.strip().replace(" ", "") not in ("q=0", "q=0.0"):
+            accepted.add(coding.strip().lower())
+    return accepted
+
+
+class ContentLinks:
+    """The click-redirect allow-list, rebuilt when the content module changes on disk
+
+    The asset server runs outside the Streamlit process, so it follows content edits itself rather than
+    through the app's hot reload.
+    """
+
+    def __init__(self, path=CONTENT_MODULE_PATH):
+        self.path = str(path)
+        self._links = tracked_links()
+        self._mtimes = file_mtimes([self.path])
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """The outbound URL for a (kind, id) in the current content, or None"""
+        with self._lock:
+            mtimes = file_mtimes([self.path])
+            if mtimes != self._mtimes:
+                try:
+                    self._links = tracked_links(load_module_bundle(self.path))
+                    self._mtimes = mtimes
+                except Exception:
+                    # A half-saved content file keeps the old links; the next click retries it
+                    pass
+            return self._links.get(key)
+
+
+class AssetHandler(BaseHTTPRequestHandler):
+    """Serves hashed assets with strong ETags, immutable caching and sendfile"""
+
+    assets = {}
+    variant_dir = None
+    thumbnail_dir = None
+    links = ContentLinks()
+
+    def do_HEAD(self):
+        self.serve(send_body=False)
+
+    def do_GET(self):
+        if self.path.startswith("/go/"):
+            self.redirect()
+        else:
+            self.serve(send_body=True)
+
+    def redirect(self):
+        """Record an outbound click and send the visitor on; only known content links are allowed"""
+        kind, _, target = self.path.split("?", 1)[0][len("/go/"):].partition("/")
+        url = self.links.get((kind, target))
+        if url is None:
+            self.send_error(404)
+            return
+        get_recorder().record("click", f"{kind}:{target}")
+        self.send_response(302)
+        self.send_header("Location", url)
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+
+    def serve(self, send_body):
+        name = self.path.split("?", 1)[0].rsplit("/", 1)[-1]
+        asset = (self.assets.get(name) or variant_asset(self.variant_dir, name)
+                 or variant_asset(self.thumbnail_dir, name))
+        if asset is None:
+            self.send_error(404)
+            return
+
+        accepted = accepted_encodings(self.headers.get("Accept-Encoding"))
+        encoding = next((coding for coding, _ in ENCODINGS
+                         if coding in accepted and coding in asset["variants"]), "identity")
+        path, etag = asset["variants"][encoding]
+
+        if etag in [tag.strip() for tag in self.headers.get("If-None-Match", "").split(",")]:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", IMMUTABLE_CACHE)
+            self.end_headers()
+            return
+
+        size = path.stat().st_size
+        self.send_response(200)
+        self.send_header("Content-Type", asset["content_type"])
+        self.send_header("Content-Length", str(size))
+        self.send_header("ETag", etag)
+        self.send_header("Cache-Control", IMMUTABLE_CACHE)
+        self.send_header("Vary", "Accept-Encoding")
+        self.send_header("Access-Control-Allow-Origin", "*")
+        if encoding != "identity":
+            self.send_header("Content-Encoding", encoding)
+        self.end_headers()
+
+        if send_body:
+            with open(path, "rb") as f:
+                # socket.sendfile uses os.sendfile, so the kernel copies file pages straight to the socket
+                self.connection.sendfile(f)
+
+    def log_message(self, *args):
+        pass
+
+
+def make_server(asset_dir=ASSET_DIR, host="0.0.0.0", port=8502, variant_dir=VARIANT_CACHE_DIR,
+                thumbnail_dir=THUMBNAIL_CACHE_DIR):
+    """Create an asset server for a built asset directory and the resized-variant and thumbnail caches"""
+    handler = type("BoundAssetHandler", (AssetHandler,),
+                   {"assets": index_assets(asset_dir), "variant_dir": variant_dir, "thumbnail_dir": thumbnail_dir})
+    return ThreadingHTTPServer((host, port), handler)
+
+
+def serve_in_background(asset_dir=ASSET_DIR, host="0.0.0.0", port=8502, variant_dir=VARIANT_CACHE_DIR,
+                        thumbnail_dir=THUMBNAIL_CACHE_DIR):
+    """Start an asset server on a daemon thread and return it"""
+    server = make_server(asset_dir, host, port, variant_dir, thumbnail_dir)
+    threading.Thread(target=server.serve_forever, name="asset-server", daemon=True).start()
+    return server
+
+
+def main():
+    """Build the assets and serve them until interrupted"""
+    parser = argparse.ArgumentParser(description="Serve precompressed portfolio assets")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8502)
+    args = parser.parse_args()
+
+    ensure_assets()
+    server = make_server(host=args.host, port=args.port)
+    print(f"✅ Serving assets from {ASSET_DIR} on http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n✅ Asset server stopped")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""
+Certificate thumbnails: rendered once by a background worker into a bounded disk cache of immutable files
+"""
+
+import hashlib
+import io
+import json
+import os
+import queue
+import re
+import threading
+import time
+from pathlib import Path
+from urllib.parse import urlparse
+
+from http_client import get_client
+from image_service import DiskCache, resize_image
+
+THUMBNAIL_WIDTH = 480
+THUMBNAIL_FORMAT = "webp"
+RETRY_AFTER_SECONDS = 60 * 60
+
+# Certificate links come from tenant bundles, so previews are only ever fetched from Drive's thumbnail endpoint
+DRIVE_HOST = "drive.google.com"
+DRIVE_FILE_PATTERN = re.compile(r"^/file/d/([\w-]+)")
+DRIVE_THUMBNAIL_URL = "https://drive.google.com/thumbnail?id={file_id}&sz=w{width}"
+
+
+def source_url(certificate_url, width=THUMBNAIL_WIDTH):
+    """Drive's thumbnail endpoint for a Drive certificate link, or None for any other link"""
+    parsed = urlparse(certificate_url)
+    match = DRIVE_FILE_PATTERN.match(parsed.path)
+    if parsed.scheme not in ("http", "https") or parsed.hostname != DRIVE_HOST or not match:
+        return None
+    # Twice the display width keeps the downscaled result sharp on high-density screens
+    return DRIVE_THUMBNAIL_URL.format(file_id=match.group(1), width=2 * width)
+
+
+def fetch_source(certificate_url, width=THUMBNAIL_WIDTH, timeout=15):
+    """Download a certificate's preview image from Drive"""
+    url = source_url(certificate_url, width)
+    if url is None:
+        raise ValueError(f"No thumbnail source for {certificate_url!r}")
+    response = get_client().get(url, deadline=timeout)
+    response.raise_for_status()
+    return response.content
+
+
+def cache_key(certificate_url, width=THUMBNAIL_WIDTH):
+    """Stable key for one certificate at one width"""
+    return hashlib.sha256(f"{certificate_url}|{width}".encode()).hexdigest()[:16]
+
+
+class ThumbnailWorker:
+    """Generates missing thumbnails off the script thread; lookups never wait on the network"""
+
+    def __init__(self, cache_dir, index_path, max_bytes=16 * 1024 * 1024, width=THUMBNAIL_WIDTH,
+                 timeout=15, retry_after=RETRY_AFTER_SECONDS, fetch=fetch_source):
+        self.cache = DiskCache(cache_dir, max_bytes)
+        self.index_path = Path(index_path)
+        self.width = width
+        self.timeout = timeout
+        self.retry_after = retry_after
+        self.fetch = fetch
+        self.failures = {}
+        self._index = self.load_index()
+        self._pending = set()
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._worker = None
+
+    def load_index(self):
+        """Read the certificate-to-file index kept beside the cache, so thumbnails survive restarts"""
+        try:
+            return json.loads(self.index_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+
+    def save_index(self):
+        """Atomically write the index"""
+        with self._lock:
+            data = json.dumps(self._index, sort_keys=True)
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.index_path.with_name(self.index_path.name + ".tmp")
+        temp_path.write_text(data, encoding="utf-8")
+        os.replace(temp_path, self.index_path)
+
+    def lookup(self, certificate_url):
+        """Return the cached thumbnail's file name, queueing generation on a miss"""
+        key = cache_key(certificate_url, self.width)
+        with self._lock:
+            name = self._index.get(key)
+        if name and self.cache.get(name) is not None:
+            return name
+
+        with self._lock:
+            failed_at = self.failures.get(key)
+            if key in self._pending or (failed_at and time.time() - failed_at < self.retry_after):
+                return None
+            self._pending.add(key)
+        self._queue.put(certificate_url)
+        return None
+
+    def generate(self, certificate_url):
+        """Fetch, downscale and cache one thumbnail; the file name embeds a hash of its bytes"""
+        thumbnail = resize_image(io.BytesIO(self.fetch(certificate_url, self.width, self.timeout)),
+                                 self.width, THUMBNAIL_FORMAT)
+        name = f"certificate-{self.width}w.{hashlib.sha256(thumbnail).hexdigest()[:12]}.{THUMBNAIL_FORMAT}"
+        self.cache.put(name, thumbnail)
+        with self._lock:
+            self._index[cache_key(certificate_url, self.width)] = name
+        self.save_index()
+        return name
+
+    def run(self):
+        """Generate queued thumbnails one at a time"""
+        while True:
+            certificate_url = self._queue.get()
+            if certificate_url is None:
+                self._queue.task_done()
+                return
+            key = cache_key(certificate_url, self.width)
+            try:
+                self.generate(certificate_url)
+            except Exception:
+                # Unreachable or non-image sources keep the placeholder and are retried later
+                with self._lock:
+                    self.failures[key] = time.time()
+            finally:
+                with self._lock:
+                    self._pending.discard(key)
+                self._queue.task_done()
+
+    def start(self):
+        """Start the worker thread unless it is already running"""
+        with self._lock:
+            if self._worker is not None and self._worker.is_alive():
+                return False
+            self._worker = threading.Thread(target=self.run, name="certificate-thumbnails", daemon=True)
+            self._worker.start()
+        return True
+
+    def flush(self):
+        """Block until every queued thumbnail has been generated or has failed"""
+        self._queue.join()
+
+    def stop(self):
+        """Stop the worker thread after the thumbnails already queued"""
+        self._queue.put(None)
@@ -0,0 +1,300 @@
+"""
+Contact form submissions: validated, queued durably in SQLite and delivered over SMTP in the background
+"""
+
+import os
+import random
+import re
+import smtplib
+import sqlite3
+import threading
+import time
+import uuid
+from email.message import EmailMessage
+from pathlib import Path
+
+from content import CONTACTS
+
+CONTACT_DB_PATH = Path(os.environ.get(
+    "PORTFOLIO_CONTACT_DB", Path(__file__).resolve().parent.parent / "data" / "contact.sqlite3"))
+CONTACT_EMAIL = next(contact["text"] for contact in CONTACTS if contact["id"] == "email")
+
+EMAIL_PATTERN = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+MAX_NAME_LENGTH = 100
+MAX_MESSAGE_LENGTH = 5000
+# Per sender (client IP, else session): at most this many submissions per window
+RATE_LIMIT = 3
+RATE_WINDOW_SECONDS = 60 * 60
+# Undelivered submissions kept at most; the form refuses new ones beyond this
+MAX_OUTBOX_ROWS = 1000
+# Delivery attempts before a submission is set aside as failed
+MAX_ATTEMPTS = 8
+# A row claimed by a worker that died mid-send becomes claimable again after this long
+CLAIM_TIMEOUT_SECONDS = 15 * 60
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    created_at REAL NOT NULL,
+    name TEXT NOT NULL,
+    email TEXT NOT NULL,
+    message TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at REAL NOT NULL DEFAULT 0,
+    sent_at REAL,
+    last_error TEXT,
+    status TEXT NOT NULL DEFAULT 'pending',
+    claimed_by TEXT,
+    claimed_at REAL,
+    sender TEXT
+)
+"""
+# Columns added after the first release, for outboxes created before them
+MIGRATIONS = {
+    "status": "ALTER TABLE outbox ADD COLUMN status TEXT NOT NULL DEFAULT 'pending'",
+    "claimed_by": "ALTER TABLE outbox ADD COLUMN claimed_by TEXT",
+    "claimed_at": "ALTER TABLE outbox ADD COLUMN claimed_at REAL",
+    "sender": "ALTER TABLE outbox ADD COLUMN sender TEXT",
+}
+
+
+def connect(path=CONTACT_DB_PATH):
+    """Open the outbox in WAL mode so the form and the mail worker do not block each other"""
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    connection = sqlite3.connect(path, timeout=5)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute(SCHEMA)
+    columns = {row[1] for row in connection.execute("PRAGMA table_info(outbox)")}
+    for column, statement in MIGRATIONS.items():
+        if column not in columns:
+            connection.execute(statement)
+    if "status" not in columns:
+        connection.execute("UPDATE outbox SET status = 'sent' WHERE sent_at IS NOT NULL")
+        connection.execute("UPDATE outbox SET status = 'failed' WHERE sent_at IS NULL AND attempts >= ?",
+                           (MAX_ATTEMPTS,))
+    connection.commit()
+    return connection
+
+
+def validate(name, email, message):
+    """Return a list of problems with a submission (empty when it is valid)"""
+    errors = []
+    if not name.strip():
+        errors.append("Please enter your name.")
+    elif len(name) > MAX_NAME_LENGTH:
+        errors.append(f"Name must be at most {MAX_NAME_LENGTH} characters.")
+    if not EMAIL_PATTERN.match(email.strip()):
+        errors.append("Please enter a valid email address.")
+    if not message.strip():
+        errors.append("Please enter a message.")
+    elif len(message) > MAX_MESSAGE_LENGTH:
+        errors.append(f"Message must be at most {MAX_MESSAGE_LENGTH} characters.")
+    return errors
+
+
+def enqueue(name, email, message, path=CONTACT_DB_PATH, sender=None, rate_limit=RATE_LIMIT,
+            rate_window=RATE_WINDOW_SECONDS, max_rows=MAX_OUTBOX_ROWS):
+    """Durably store a validated submission and return its id; delivery happens later
+
+    Raises ValueError with a message for the visitor when sender is over its rate limit or the outbox is full.
+    """
+    connection = connect(path)
+    try:
+        now = time.time()
+        # IMMEDIATE takes the write lock first, so concurrent submissions cannot both pass the checks
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            if sender is not None and connection.execute(
+                    "SELECT COUNT(*) FROM outbox WHERE sender = ? AND created_at > ?",
+                    (sender, now - rate_window)).fetchone()[0] >= rate_limit:
+                raise ValueError("You have sent several messages recently. Please try again later.")
+            if connection.execute("SELECT COUNT(*) FROM outbox WHERE sent_at IS NULL").fetchone()[0] >= max_rows:
+                raise ValueError("The message queue is full right now. Please try again later.")
+            cursor = connection.execute(
+                "INSERT INTO outbox (created_at, name, email, message, sender) VALUES (?, ?, ?, ?, ?)",
+                (now, name.strip(), email.strip(), message.strip(), sender))
+        except BaseException:
+            connection.rollback()
+            raise
+        connection.commit()
+        return cursor.lastrowid
+    finally:
+        connection.close()
+
+
+def pending_count(path=CONTACT_DB_PATH):
+    """Number of submissions not yet delivered"""
+    connection = connect(path)
+    try:
+        return connection.execute("SELECT COUNT(*) FROM outbox WHERE sent_at IS NULL").fetchone()[0]
+    finally:
+        connection.close()
+
+
+def build_message(row, sender, recipient):
+    """Turn an outbox row into the email sent to the portfolio owner"""
+    created_at, name, email, message = row
+    mail = EmailMessage()
+    mail["Subject"] = f"Portfolio contact from {name}"
+    mail["From"] = sender
+    mail["To"] = recipient
+    mail["Reply-To"] = email
+    mail.set_content(f"{message}\n\n-- \n{name} <{email}>\n"
+                     f"Sent {time.strftime('%Y-%m-%d %H:%M UTC', time.gmtime(created_at))}")
+    return mail
+
+
+class MailWorker:
+    """Delivers queued submissions in batches over one SMTP connection, backing off on failures"""
+
+    def __init__(self, host, port=587, username=None, password=None, starttls=True,
+                 sender=None, recipient=CONTACT_EMAIL, path=CONTACT_DB_PATH, batch_size=20,
+                 interval=30.0, max_attempts=MAX_ATTEMPTS, backoff_base=30.0, backoff_cap=3600.0, timeout=30):
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.starttls = starttls
+        self.sender = sender or username or recipient
+        self.recipient = recipient
+        self.path = path
+        self.batch_size = batch_size
+        self.interval = interval
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.timeout = timeout
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._worker = None
+        self._lock = threading.Lock()
+
+    def backoff(self, attempt):
+        """Full-jitter exponential backoff delay for the given retry attempt"""
+        return random.uniform(0, min(self.backoff_cap, self.backoff_base * (2 ** attempt)))
+
+    def open_connection(self):
+        """Connect (and authenticate) to the SMTP server"""
+        smtp = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        if self.starttls:
+            smtp.starttls()
+        if self.username:
+            smtp.login(self.username, self.password or "")
+        return smtp
+
+    def record_failure(self, connection, row_id, error, give_up=False):
+        """Schedule a retry of one submission with backoff, or with give_up stop retrying it for good"""
+        with connection:
+            attempts = connection.execute("SELECT attempts FROM outbox WHERE id = ?", (row_id,)).fetchone()[0] + 1
+            if give_up:
+                attempts = max(attempts, self.max_attempts)
+            # Failed rows are never claimed again; last_error says why
+            connection.execute(
+                "UPDATE outbox SET status = ?, claimed_by = NULL, attempts = ?, next_attempt_at = ?, last_error = ? "
+                "WHERE id = ?",
+                ("failed" if attempts >= self.max_attempts else "pending", attempts,
+                 time.time() + self.backoff(attempts), str(error)[:500], row_id))
+
+    def claim(self, connection):
+        """Mark up to batch_size due submissions as this round's, so no other worker sends them too"""
+        token = uuid.uuid4().hex
+        now = time.time()
+        with connection:
+            connection.execute(
+                "UPDATE outbox SET status = 'sending', claimed_by = ?, claimed_at = ? WHERE id IN ("
+                "SELECT id FROM outbox WHERE (status = 'pending' AND attempts < ? AND next_attempt_at <= ?) "
+                "OR (status = 'sending' AND claimed_at <= ?) ORDER BY id LIMIT ?)",
+                (token, now, self.max_attempts, now, now - CLAIM_TIMEOUT_SECONDS, self.batch_size))
+        return connection.execute(
+            "SELECT id, created_at, name, email, message FROM outbox WHERE claimed_by = ? AND status = 'sending' "
+            "ORDER BY id", (token,)).fetchall()
+
+    def deliver_batch(self):
+        """Send up to batch_size due submissions; return how many were delivered"""
+        connection = connect(self.path)
+        try:
+            rows = self.claim(connection)
+            if not rows:
+                return 0
+
+            delivered = 0
+            pending = list(rows)
+            smtp = None
+            try:
+                smtp = self.open_connection()
+                while pending:
+                    row = pending[0]
+                    try:
+                        smtp.send_message(build_message(row[1:], self.sender, self.recipient))
+                    except smtplib.SMTPDataError as e:
+                        # The server refused this message only; the connection is still usable
+                        self.record_failure(connection, row[0], e)
+                    except OSError:
+                        # Connection-level (SMTPException is an OSError): the rest of the batch is retried
+                        raise
+                    except Exception as e:
+                        # e.g. a header with a line break: retrying cannot fix it, and it must not block the queue
+                        self.record_failure(connection, row[0], e, give_up=True)
+                    else:
+                        with connection:
+                            connection.execute("UPDATE outbox SET status = 'sent', sent_at = ? WHERE id = ?",
+                                               (time.time(), row[0]))
+                        delivered += 1
+                    pending.pop(0)
+            except (smtplib.SMTPException, OSError) as e:
+                # Everything not yet sent in this batch is retried later with its own backoff
+                for row in pending:
+                    self.record_failure(connection, row[0], e)
+            finally:
+                if smtp is not None:
+                    try:
+                        smtp.quit()
+                    except (smtplib.SMTPException, OSError):
+                        pass
+            return delivered
+        finally:
+            connection.close()
+
+    def notify(self):
+        """Wake the worker early because a new submission was queued"""
+        self._wake.set()
+
+    def run(self):
+        """Deliver batches until stopped, sleeping between rounds unless notified"""
+        while not self._stop.is_set():
+            try:
+                while self.deliver_batch() == self.batch_size:
+                    pass
+            except Exception:
+                # Database or unexpected errors end this round only; the thread must outlive them
+                pass
+            self._wake.wait(self.interval)
+            self._wake.clear()
+
+    def start(self):
+        """Start the delivery thread unless it is already running"""
+        with self._lock:
+            if self._worker is not None and self._worker.is_alive():
+                return False
+            self._stop.clear()
+            self._worker = threading.Thread(target=self.run, name="contact-mail-worker", daemon=True)
+            self._worker.start()
+        return True
+
+    def stop(self):
+        """Ask the delivery thread to exit after its current round"""
+        self._stop.set()
+        self._wake.set()
+
+
+def worker_from_env():
+    """Build a MailWorker from PORTFOLIO_SMTP_* settings, or None when SMTP is not configured"""
+    host = os.environ.get("PORTFOLIO_SMTP_HOST")
+    if not host:
+        return None
+    return MailWorker(host,
+                      port=int(os.environ.get("PORTFOLIO_SMTP_PORT", "587")),
+                      username=os.environ.get("PORTFOLIO_SMTP_USER"),
+                      password=os.environ.get("PORTFOLIO_SMTP_PASSWORD"),
+                      starttls=os.environ.get("PORTFOLIO_SMTP_STARTTLS", "1") != "0",
+                      recipient=os.environ.get("PORTFOLIO_CONTACT_TO", CONTACT_EMAIL))
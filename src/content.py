@@ -0,0 +1,402 @@
+"""
+Structured portfolio content shared by the page, the static export, the search index and the tag filter
+"""
+
+import hashlib
+import json
+
+from resume import load_resume, resume_documents
+
+PROFILE = {
+    "name": "Bhumika Patel",
+    "first_name": "BHUMIKA",
+    "last_name": "PATEL",
+    "page_title": "Bhumika Patel | Software Developer & Data Analyst",
+    "page_icon": "👩‍💻",
+    "tagline": "Software Developer | Data Analyst | Problem Solver",
+    "intro": (
+        'A dedicated software developer specializing in <span style="color: #64ffda; font-weight: 600;">data-driven solutions</span> and '
+        '<span style="color: #667eea; font-weight: 600;">innovative applications</span>. Passionate about leveraging technology to solve '
+        'complex problems and create impactful solutions that drive business growth and user engagement.'
+    ),
+    "about": "A dedicated software developer and data analyst with expertise in AI/ML, hackathon winner, and technical leader passionate about creating innovative solutions.",
+    "quote": "Passionate about creating innovative solutions that make a difference",
+    "photo": "src/assets/Bhumika_Photo.jfif",
+}
+
+SECTION_HEADERS = {
+    "skills": {"icon": "🛠", "title": "Technical Skills", "accent": "#64ffda"},
+    "projects": {"icon": "🏆", "title": "Award-Winning Projects & Innovations", "accent": "#667eea"},
+    "showcase": {"icon": "🏆", "title": "Leadership & Innovation Showcase", "accent": "#f093fb"},
+    "experience": {"icon": "💼", "title": "Professional Experience", "accent": "#f093fb"},
+    "courses": {"icon": "📚", "title": "Courses & Certifications", "accent": "#00f2fe"},
+    "resume": {"icon": "📄", "title": "Resume", "accent": "#667eea"},
+    "contact": {"icon": "📞", "title": "Let's Connect", "accent": "#64ffda"},
+}
+
+SKILL_GROUPS = [
+    {
+        "id": "software-development",
+        "title": "💻 Software Development",
+        "items": [
+            "<b>Full-Stack Development</b> (Frontend & Backend)",
+            "<b>Web Application Development</b> with modern frameworks",
+            "<b>Database Design & Management</b> (SQL & NoSQL)",
+            "<b>RESTful API Development</b> & Integration",
+            "<b>Version Control</b> with Git & GitHub",
+            "<b>Agile Development</b> methodologies",
+        ],
+    },
+    {
+        "id": "data-analytics",
+        "title": "📊 Data Analytics",
+        "items": [
+            "<b>Data Analysis & Visualization</b> with Python/R",
+            "<b>Statistical Analysis</b> & Business Intelligence",
+            "<b>Machine Learning</b> & Predictive Modeling",
+            "<b>SQL Database Querying</b> & Data Mining",
+            "<b>Dashboard Creation</b> with Power BI/Tableau",
+            "<b>Data Cleaning</b> & ETL processes",
+        ],
+    },
+    {
+        "id": "tools-technologies",
+        "title": "🔧 Tools & Technologies",
+        "items": [
+            "<b>Languages:</b> Python, Java, JavaScript, SQL, R",
+            "<b>Frameworks:</b> React, Node.js, Django, Flask",
+            "<b>Tools:</b> VS Code, Git, Docker, Jupyter, Power BI",
+            "<b>Libraries:</b> Pandas, NumPy, Scikit-learn, TensorFlow",
+            "<b>Databases:</b> MySQL, PostgreSQL, MongoDB",
+            "<b>Cloud:</b> AWS, Azure, Google Cloud Platform",
+        ],
+    },
+]
+
+SKILL_LEVELS = [
+    {"label": "🐍 Python", "level": 0.85, "column": 0},
+    {"label": "☕ Java", "level": 0.75, "column": 0},
+    {"label": "📊 Data Analysis", "level": 0.80, "column": 1},
+    {"label": "💾 SQL", "level": 0.78, "column": 1},
+    {"label": "⚙️ Machine Learning", "level": 0.72, "column": 2},
+    {"label": "🌐 Web Development", "level": 0.75, "column": 2},
+    {"label": "📚 Git/GitHub", "level": 0.70, "column": 3},
+    {"label": "☁️ Cloud Platforms", "level": 0.68, "column": 3},
+]
+
+PROJECTS = [
+    {
+        "id": "fraud-detection",
+        "title": "Financial Fraud Detection API",
+        "icon": "🔒",
+        "accent": "#64ffda",
+        "headline": "🏆 TOP 6 Achievement in Execute 4.0 Hackathon, Delhi Technical University (DTU)",
+        "summary": "Advanced machine learning-powered API for real-time financial fraud detection and risk assessment.",
+        "tags": ["Machine Learning", "Python", "API Development", "Fraud Detection", "Hugging Face"],
+        "features": [
+            "🔍 Real-time fraud detection algorithms",
+            "📊 Advanced risk scoring system",
+            "⚡ High-performance API endpoints",
+            "🎯 Precision-focused ML models",
+            "📈 Interactive fraud analytics dashboard",
+            "🏆 Award-winning solution architecture",
+        ],
+        "demo_url": "https://huggingface.co/spaces/bhumika007/Fraud_Detection_API_excecute4_Part2",
+    },
+    {
+        "id": "ai-health",
+        "title": "AI Health Assistant",
+        "icon": "🏥",
+        "accent": "#667eea",
+        "headline": "🚀 HACK SRIT 2025 Project - SRIT Jabalpur (May 10-11, 2025)",
+        "summary": "Intelligent healthcare AI assistant providing personalized medical insights and health recommendations.",
+        "tags": ["Artificial Intelligence", "Healthcare", "Machine Learning", "NLP", "Hugging Face"],
+        "features": [
+            "🧠 AI-powered health diagnostics",
+            "📊 Personalized health recommendations",
+            "💬 Natural language processing interface",
+            "📈 Health data visualization",
+            "⚡ Real-time symptom analysis",
+            "🏆 Hackathon innovation showcase",
+        ],
+        "demo_url": "https://huggingface.co/spaces/bhumika007/AI_health",
+    },
+    {
+        "id": "helmet-plate-detection",
+        "title": "Helmet & License Plate Detection",
+        "icon": "🏏",
+        "accent": "#f093fb",
+        "headline": "🎓 Major College Project",
+        "summary": "Advanced computer vision system for automated traffic safety monitoring and license plate recognition using deep learning.",
+        "tags": ["Computer Vision", "Deep Learning", "YOLO", "OpenCV", "Hugging Face"],
+        "features": [
+            "🎯 Real-time helmet detection for riders",
+            "📷 Automated license plate recognition",
+            "🚦 Traffic safety compliance monitoring",
+            "📊 Advanced object detection algorithms",
+            "⚡ High-accuracy YOLO implementation",
+            "🎓 Academic excellence demonstration",
+        ],
+        "demo_url": "https://huggingface.co/spaces/bhumika007/Helmet-License-Plate-Detection",
+    },
+]
+
+SHOWCASE = [
+    {
+        "id": "professional-profile",
+        "title": "👩‍💼 Professional Profile",
+        "accent": "#64ffda",
+        "image": "src/assets/Bhumika_Photo.jfif",
+        "caption": "Bhumika Patel - Software Developer & Data Analyst",
+        "items": [
+            "✅ <strong>Passionate technologist</strong> with expertise in AI/ML",
+            "✅ <strong>Award-winning developer</strong> in competitive hackathons",
+            "✅ <strong>Technical leader</strong> driving innovation in healthcare and fintech",
+            "✅ <strong>Problem solver</strong> with focus on real-world impact",
+        ],
+    },
+    {
+        "id": "leadership-in-action",
+        "title": "🎤 Leadership in Action",
+        "accent": "#667eea",
+        "image": "src/assets/Presentation_Leadership_hackSRIT.jfif",
+        "caption": "Presenting at HACK SRIT 2025 - Technical Leadership",
+        "items": [
+            "✅ <strong>Public speaking</strong> and technical presentation skills",
+            "✅ <strong>Team leadership</strong> in competitive hackathon environments",
+            "✅ <strong>Project management</strong> and stakeholder communication",
+            "✅ <strong>Innovation showcase</strong> with live demonstrations",
+        ],
+    },
+]
+
+EXPERIENCE = [
+    {
+        "id": "techcorp",
+        "title": "TechCorp Solutions | Software Developer",
+        "accent": "#667eea",
+        "period": "Jan 2023 - Present",
+        "location": "Mumbai, India",
+        "heading": "🎯 Key Responsibilities",
+        "column": 0,
+        "items": [
+            "Developed and maintained <strong>full-stack web applications</strong> using modern frameworks",
+            "Implemented <strong>data analytics solutions</strong> for business intelligence",
+            "Collaborated with <strong>cross-functional teams</strong> to deliver high-quality software",
+            "Optimized <strong>database performance</strong> and reduced query execution time by 40%",
+            "Led <strong>code reviews</strong> and mentored junior developers",
+        ],
+    },
+    {
+        "id": "datainsights",
+        "title": "DataInsights Analytics | Data Analyst",
+        "accent": "#64ffda",
+        "period": "Jun 2021 - Dec 2022",
+        "location": "Pune, India",
+        "heading": "🎯 Key Achievements",
+        "column": 0,
+        "items": [
+            "Analyzed <strong>large datasets</strong> to identify business trends and insights",
+            "Created <strong>interactive dashboards</strong> using Power BI and Tableau",
+            "Implemented <strong>predictive models</strong> for customer behavior analysis",
+            "Automated <strong>data processing workflows</strong> reducing manual effort by 60%",
+            "Collaborated with <strong>stakeholders</strong> to translate business requirements into technical solutions",
+        ],
+    },
+    {
+        "id": "innovatetech",
+        "title": "InnovateTech | Junior Software Engineer",
+        "accent": "#64ffda",
+        "period": "Aug 2020 - May 2021",
+        "location": "Bangalore, India",
+        "heading": "🎯 Key Responsibilities",
+        "column": 1,
+        "items": [
+            "Developed <strong>web applications</strong> using Java Spring Boot and React",
+            "Designed and implemented <strong>RESTful APIs</strong> for mobile and web clients",
+            "Participated in <strong>agile development</strong> processes and daily standups",
+            "Conducted <strong>unit testing</strong> and debugging to ensure code quality",
+            "Collaborated with <strong>senior engineers</strong> on architecture decisions",
+        ],
+    },
+]
+
+COURSES = [
+    {
+        "id": "python-basics",
+        "title": "🐍 Basics of Python",
+        "accent": "#64ffda",
+        "issuer": "Springboard",
+        "tags": ["Python", "Programming Fundamentals", "Coding", "Development"],
+        "column": 0,
+        "items": [
+            "✅ Successfully completed <strong>comprehensive Python course</strong>",
+            "✅ Mastered <strong>Python fundamentals</strong> and syntax",
+            "✅ Hands-on experience with <strong>practical coding exercises</strong>",
+            "✅ Built strong foundation for <strong>advanced programming</strong>",
+        ],
+        "certificate_url": "https://drive.google.com/file/d/1PPBFguEliZgMx81E7I4dTkk9-OwWte2W/view?usp=drive_link",
+    },
+    {
+        "id": "python-oop",
+        "title": "⚙️ Object Oriented Programming using Python",
+        "accent": "#667eea",
+        "issuer": "Professional Certification",
+        "tags": ["Python", "OOP", "Programming", "Software Design"],
+        "column": 0,
+        "items": [
+            "✅ Advanced <strong>Object-Oriented Programming</strong> concepts",
+            "✅ Expertise in <strong>Python class design</strong> patterns",
+            "✅ Proficiency in <strong>inheritance and polymorphism</strong>",
+            "✅ Enhanced <strong>software architecture</strong> skills",
+        ],
+        "certificate_url": "https://drive.google.com/file/d/1VpakzRDauRF3-f-yoe5p3iixysP6ruQN/view?usp=sharing",
+    },
+    {
+        "id": "e-summit-25",
+        "title": "🏆 E-SUMMIT '25 TOP 6 Achievement",
+        "accent": "#f093fb",
+        "issuer": "E-Cell DTU, SabPaisa, and cellDTU",
+        "tags": ["Entrepreneurship", "Innovation", "Competition", "Leadership"],
+        "column": 1,
+        "items": [
+            "✅ Achieved <strong>TOP 6 position</strong> in prestigious E-SUMMIT '25",
+            "✅ Demonstrated <strong>innovative thinking</strong> and problem-solving",
+            "✅ Competed with <strong>top entrepreneurial talent</strong> nationwide",
+            "✅ Recognition from <strong>leading industry partners</strong>",
+            "✅ Enhanced <strong>business development</strong> and pitching skills",
+        ],
+        "certificate_url": "https://drive.google.com/file/d/1JtOSuIYjJaL_yyehXujJXqjqbYbP-AiR/view?usp=drive_link",
+    },
+    {
+        "id": "hack-srit-2025",
+        "title": "🚀 HACK SRIT 2025 Participant",
+        "accent": "#00f2fe",
+        "issuer": "SRIT Jabalpur",
+        "tags": ["Hackathon", "Coding", "Innovation", "Team Work"],
+        "column": 1,
+        "items": [
+            "✅ Participated in <strong>prestigious hackathon</strong> competition",
+            "✅ Developed <strong>innovative tech solutions</strong> under time pressure",
+            "✅ Collaborated with <strong>skilled development teams</strong>",
+            "✅ Enhanced <strong>rapid prototyping</strong> abilities",
+            "✅ Demonstrated <strong>problem-solving</strong> in competitive environment",
+        ],
+        "certificate_url": "https://drive.google.com/file/d/1aRObwFQJsKuafk8rSMqq2em1HHGMQ7Vn/view?usp=drive_link",
+    },
+    {
+        "id": "iiitdmj-intensive",
+        "title": "🏆 36-Hour Programming Intensive",
+        "accent": "#764ba2",
+        "issuer": "Programming Club of IIITDMJ PDPM IIITDM Jabalpur",
+        "tags": ["Programming", "Competitive Coding", "Team Collaboration", "Problem Solving", "Algorithms"],
+        "featured": True,
+        "items": [
+            "✅ <strong>36-hour intensive</strong> in-person programming workshop",
+            "✅ Hands-on experience with <strong>competitive programming</strong>",
+            "✅ Collaborated in <strong>team-based challenges</strong>",
+            "✅ Prestigious <strong>IIITDMJ recognition</strong>",
+            "✅ Enhanced <strong>algorithmic thinking</strong> abilities",
+        ],
+        "skills_acquired": [
+            "• Advanced problem-solving techniques",
+            "• Efficient algorithm implementation",
+            "• Time-constrained programming",
+            "• Team collaboration and leadership",
+            "• Code optimization strategies",
+        ],
+        "certificate_url": "https://drive.google.com/file/d/1QC7ISV0pINplCW4JsiqhVaN17cMyJ-qS/view?usp=sharing",
+    },
+]
+
+
+CONTACTS = [
+    {"id": "phone", "icon": "📱", "label": "Phone", "text": "+91 (900) 1234567", "url": None},
+    {"id": "email", "icon": "📧", "label": "Email", "text": "bhumika.patel.dev@gmail.com", "url": None},
+    {"id": "github", "icon": "💼", "label": "GitHub", "text": "github.com/bhumika-patel",
+     "url": "https://github.com/bhumika-patel"},
+    {"id": "linkedin", "icon": "🔗", "label": "LinkedIn", "text": "Bhumika Patel",
+     "url": "https://www.linkedin.com/in/bhumika-patel-dev"},
+]
+
+
+BUNDLE_KEYS = ("profile", "section_headers", "skill_groups", "skill_levels", "projects", "showcase",
+               "experience", "courses", "contacts")
+
+
+def default_bundle():
+    """The built-in portfolio as a content bundle, the same shape tenant bundles use"""
+    return dict(zip(BUNDLE_KEYS, (PROFILE, SECTION_HEADERS, SKILL_GROUPS, SKILL_LEVELS, PROJECTS, SHOWCASE,
+                                  EXPERIENCE, COURSES, CONTACTS)))
+
+
+def content_version(bundle=None, with_resume=None):
+    """Short hash of the whole content model, used to invalidate prebuilt artifacts"""
+    payload = json.dumps([(bundle or default_bundle())[key] for key in BUNDLE_KEYS], sort_keys=True)
+    # The bundled resume only belongs to the built-in portfolio
+    resume = load_resume() if (bundle is None if with_resume is None else with_resume) else None
+    payload += resume["hash"] if resume else ""
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:12]
+
+
+def space_embed_url(demo_url):
+    """Map a huggingface.co/spaces page URL to the Space's directly embeddable hf.space URL"""
+    owner, name = demo_url.rstrip("/").split("/")[-2:]
+    subdomain = f"{owner}-{name}".lower().replace("_", "-").replace(".", "-")
+    return f"https://{subdomain}.hf.space"
+
+
+def outbound_links(bundle=None):
+    """Return every demo and certificate URL rendered on the page"""
+    bundle = bundle or default_bundle()
+    links = [project["demo_url"] for project in bundle["projects"]]
+    links += [course["certificate_url"] for course in bundle["courses"]]
+    return links
+
+
+def search_documents(bundle=None, with_resume=None):
+    """Flatten the content model into plain documents for the search index"""
+    documents = []
+    content = bundle or default_bundle()
+
+    for group in content["skill_groups"]:
+        documents.append({
+            "id": f"skill:{group['id']}",
+            "section": "Skills",
+            "title": group["title"],
+            "text": " ".join(group["items"]),
+            "url": None,
+        })
+
+    for project in content["projects"]:
+        documents.append({
+            "id": f"project:{project['id']}",
+            "section": "Projects",
+            "title": project["title"],
+            "text": " ".join([project["headline"], project["summary"],
+                              " ".join(project["tags"]), " ".join(project["features"])]),
+            "url": project["demo_url"],
+        })
+
+    for job in content["experience"]:
+        documents.append({
+            "id": f"experience:{job['id']}",
+            "section": "Experience",
+            "title": job["title"],
+            "text": " ".join([job["period"], job["location"], " ".join(job["items"])]),
+            "url": None,
+        })
+
+    for course in content["courses"]:
+        documents.append({
+            "id": f"course:{course['id']}",
+            "section": "Courses & Certifications",
+            "title": course["title"],
+            "text": " ".join([course["issuer"], " ".join(course["tags"]), " ".join(course["items"]),
+                              " ".join(course.get("skills_acquired", []))]),
+            "url": course["certificate_url"],
+        })
+
+    if bundle is None if with_resume is None else with_resume:
+        documents += resume_documents(load_resume())
+    return documents
@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""
+Crawler routing: search engine and link-preview bots get a server-rendered snapshot with Open Graph tags
+
+Usage: python src/crawlers.py --out build/snapshot
+"""
+
+import argparse
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import textwrap
+import threading
+import time
+from html import escape, unescape
+from pathlib import Path
+
+from admission import PASSTHROUGH_PREFIXES, header, request_tenant, send_response
+from asset_pipeline import BUILD_DIR, REPO_ROOT
+from content import content_version, default_bundle
+from hot_reload import RELOAD_INTERVAL_SECONDS, file_mtimes, load_module_bundle
+from static_export import export_site, render_page
+from tenants import CONTENT_MODULE_PATH, DEFAULT_TENANT, content_files
+
+SNAPSHOT_DIR = BUILD_DIR / "snapshot"
+SNAPSHOT_PATH = "/_portfolio/snapshot"
+SNAPSHOT_MANIFEST = "snapshot.json"
+RENDER_TIMEOUT_SECONDS = 300
+DESCRIPTION_LENGTH = 200
+# Absolute URLs in Open Graph tags use the public origin, filled in when a snapshot is served
+ORIGIN_PLACEHOLDER = "__PORTFOLIO_ORIGIN__"
+
+CRAWLER_PATTERN = re.compile(
+    r"googlebot|google-inspectiontool|storebot-google|bingbot|msnbot|duckduckbot|baiduspider|yandex|slurp"
+    r"|applebot|petalbot|facebookexternalhit|facebookcatalog|meta-externalagent|twitterbot|linkedinbot"
+    r"|slackbot|slack-imgproxy|discordbot|telegrambot|whatsapp|skypeuripreview|pinterest|redditbot|embedly"
+    r"|iframely|mastodon|cardyb|crawler|spider",
+    re.IGNORECASE)
+HOST_PATTERN = re.compile(r"^[A-Za-z0-9.\-\[\]:]+$")
+
+
+def plain_text(html, length=DESCRIPTION_LENGTH):
+    """Content text without markup, shortened for a meta tag and escaped for an attribute"""
+    text = " ".join(unescape(re.sub(r"<[^>]+>", " ", html)).split())
+    return escape(textwrap.shorten(text, length, placeholder="…"), quote=True)
+
+
+def page_meta(bundle=None):
+    """(title, description) per app page, for search results and link previews"""
+    content = bundle or default_bundle()
+    profile, headers = content["profile"], content["section_headers"]
+
+    def titled(header):
+        return plain_text(f"{header['title']} | {profile['name']}")
+
+    return {
+        "home": (plain_text(profile["page_title"]), plain_text(profile["about"])),
+        "projects": (titled(headers["projects"]),
+                     plain_text("; ".join(project["title"] for project in content["projects"]))),
+        "experience": (titled(headers["experience"]),
+                       plain_text("; ".join(f"{job['title']} ({job['period']})" for job in content["experience"]))),
+        "certifications": (titled(headers["courses"]),
+                           plain_text("; ".join(course["title"] for course in content["courses"]))),
+        "contact": (titled(headers["contact"]), plain_text(profile["tagline"])),
+    }
+
+
+def meta_tags(page, title, description, image_url=None, site_name=""):
+    """Canonical link, Open Graph and Twitter card tags for one page, plus a base for the snapshot's assets"""
+    url = f"{ORIGIN_PLACEHOLDER}/" + ("" if page == "home" else page)
+    tags = [f'<base href="{SNAPSHOT_PATH}/">', f'<link rel="canonical" href="{url}">']
+    properties = {"og:type": "website", "og:site_name": site_name, "og:title": title,
+                  "og:description": description, "og:url": url}
+    if image_url:
+        properties["og:image"] = f"{ORIGIN_PLACEHOLDER}{SNAPSHOT_PATH}/{image_url}"
+    tags += [f'<meta property="{name}" content="{value}">' for name, value in properties.items()]
+    tags += [f'<meta name="twitter:card" content="{"summary_large_image" if image_url else "summary"}">',
+             f'<meta name="twitter:title" content="{title}">',
+             f'<meta name="twitter:description" content="{description}">']
+    return "\n".join(tags)
+
+
+def render_snapshot(out_dir=SNAPSHOT_DIR):
+    """Export the site into out_dir and write one server-rendered document per app page"""
+    out_dir = Path(out_dir)
+    manifest = export_site(out_dir)
+    bundle = default_bundle()
+    image_url = manifest["images"].get(bundle["profile"].get("photo"))
+
+    pages_dir = out_dir / "pages"
+    pages_dir.mkdir(parents=True, exist_ok=True)
+    for page, (title, description) in page_meta(bundle).items():
+        head = meta_tags(page, title, description, image_url, plain_text(bundle["profile"]["name"]))
+        document = render_page(manifest["css"], manifest["images"], {}, manifest["resume"], title=title,
+                               description=description, extra_head=head)
+        (pages_dir / f"{page}.html").write_text(document, encoding="utf-8")
+
+    # Written last, so a snapshot with a manifest is complete
+    snapshot = {"content_version": content_version(), "pages": sorted(page_meta(bundle))}
+    (out_dir / SNAPSHOT_MANIFEST).write_text(json.dumps(snapshot, indent=2), encoding="utf-8")
+    return snapshot
+
+
+def snapshot_version(out_dir=SNAPSHOT_DIR):
+    """The content version a snapshot on disk was rendered from, or None when there is none"""
+    try:
+        return json.loads((Path(out_dir) / SNAPSHOT_MANIFEST).read_text(encoding="utf-8"))["content_version"]
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+class CrawlerSnapshots:
+    """Snapshot documents held in memory, rendered again on a daemon thread when the content version changes"""
+
+    def __init__(self, out_dir=SNAPSHOT_DIR, interval=RELOAD_INTERVAL_SECONDS, public_url="", trust_forwarded=False):
+        self.out_dir = Path(out_dir)
+        self.interval = interval
+        self.public_url = public_url.rstrip("/")
+        self.trust_forwarded = trust_forwarded
+        self.version = None
+        self.served = 0
+        self.renders = 0
+        self.rendered_at = None
+        self.error = None
+        self._pages = {}
+        self._files = {}
+        self._mtimes = {}
+        self._content_version = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._worker = None
+
+    def content_version(self):
+        """The version of the content on disk; content files are read again only after one changes"""
+        mtimes = file_mtimes(self._files)
+        if self._content_version is None or mtimes != self._mtimes:
+            bundle = load_module_bundle(CONTENT_MODULE_PATH)
+            self._files = content_files(DEFAULT_TENANT, bundle)
+            self._mtimes = file_mtimes(self._files)
+            self._content_version = content_version(bundle, with_resume=True)
+        return self._content_version
+
+    def render(self):
+        """Render the snapshot in a fresh interpreter, which sees the current content, and swap it in"""
+        staging = self.out_dir.with_name(self.out_dir.name + ".new")
+        retired = self.out_dir.with_name(self.out_dir.name + ".old")
+        shutil.rmtree(staging, ignore_errors=True)
+        try:
+            subprocess.run([sys.executable, str(Path(__file__).resolve()), "--out", str(staging)], cwd=REPO_ROOT,
+                           check=True, capture_output=True, timeout=RENDER_TIMEOUT_SECONDS)
+        except (subprocess.SubprocessError, OSError) as e:
+            # Keep serving the previous snapshot and try again on the next pass
+            self.error = str(e)
+            return False
+        shutil.rmtree(retired, ignore_errors=True)
+        if self.out_dir.exists():
+            self.out_dir.rename(retired)
+        staging.rename(self.out_dir)
+        shutil.rmtree(retired, ignore_errors=True)
+        self.renders += 1
+        self.rendered_at = time.time()
+        self.error = None
+        return True
+
+    def load(self):
+        """Read the snapshot documents on disk into memory"""
+        version = snapshot_version(self.out_dir)
+        if version is None:
+            return False
+        pages = {path.stem: path.read_text(encoding="utf-8") for path in (self.out_dir / "pages").glob("*.html")}
+        with self._lock:
+            self._pages = pages
+            self.version = version
+        return True
+
+    def refresh(self):
+        """Load the snapshot for the current content version, rendering it first when there is none"""
+        version = self.content_version()
+        if version == self.version:
+            return False
+        if snapshot_version(self.out_dir) != version and not self.render() and self._pages:
+            return False
+        # A failed render still loads an older snapshot from disk when nothing is served yet
+        return self.load()
+
+    def document(self, page, origin):
+        """A page's snapshot with absolute URLs on the public origin, or None when there is none"""
+        with self._lock:
+            document = self._pages.get(page)
+            if document is None:
+                return None
+            self.served += 1
+        return document.replace(ORIGIN_PLACEHOLDER, self.public_url or origin).encode("utf-8")
+
+    def status(self):
+        """Snapshot version and counters for the diagnostics page"""
+        with self._lock:
+            return {"version": self.version, "pages": len(self._pages), "served": self.served,
+                    "renders": self.renders, "rendered_at": self.rendered_at, "error": self.error,
+                    "running": self._worker is not None and self._worker.is_alive()}
+
+    def run(self):
+        """Refresh now and then every interval until stopped"""
+        while True:
+            self.refresh()
+            if self._stop.wait(self.interval):
+                return
+
+    def start(self):
+        """Start the refresh thread unless it is already running"""
+        with self._lock:
+            if self._worker is not None and self._worker.is_alive():
+                return False
+            self._stop.clear()
+            self._worker = threading.Thread(target=self.run, name="crawler-snapshots", daemon=True)
+            self._worker.start()
+        return True
+
+    def stop(self):
+        """Ask the refresh thread to exit"""
+        self._stop.set()
+
+
+_snapshots = None
+_snapshots_lock = threading.Lock()
+
+
+def get_snapshots(environ=os.environ):
+    """Return the process-wide crawler snapshots, configured from the environment on first use"""
+    global _snapshots
+    with _snapshots_lock:
+        if _snapshots is None:
+            _snapshots = CrawlerSnapshots(public_url=environ.get("PORTFOLIO_PUBLIC_URL", ""),
+                                          trust_forwarded=environ.get("PORTFOLIO_TRUST_FORWARDED") == "1")
+        return _snapshots
+
+
+def is_crawler(scope):
+    """Whether a request is a search engine or link-preview bot fetching a page of the built-in portfolio"""
+    # The snapshot is rendered from the default bundle only, so tenant pages always go to the app
+    return (scope["type"] == "http" and scope["method"] in ("GET", "HEAD")
+            and not scope["path"].startswith(PASSTHROUGH_PREFIXES)
+            and CRAWLER_PATTERN.search(header(scope, b"user-agent")) is not None
+            and request_tenant(scope) == DEFAULT_TENANT)
+
+
+def request_origin(scope, trust_forwarded=False):
+    """The scheme and host a request was made to; X-Forwarded-* only count behind a proxy that sets them"""
+    scheme, host = scope.get("scheme", "http"), header(scope, b"host")
+    if trust_forwarded:
+        scheme = header(scope, b"x-forwarded-proto").split(",")[0].strip() or scheme
+        host = header(scope, b"x-forwarded-host").split(",")[0].strip() or host
+    if scheme not in ("http", "https") or not HOST_PATTERN.match(host):
+        return ""
+    return f"{scheme}://{host}"
+
+
+class CrawlerMiddleware:
+    """ASGI middleware in front of Streamlit: answers crawlers with the snapshot instead of opening a session"""
+
+    def __init__(self, app, snapshots=None):
+        self.app = app
+        self.snapshots = snapshots or get_snapshots()
+
+    async def __call__(self, scope, receive, send):
+        if is_crawler(scope):
+            snapshots = self.snapshots
+            document = snapshots.document(scope["path"].strip("/") or "home",
+                                          request_origin(scope, snapshots.trust_forwarded))
+            if document is not None:
+                # The same URL gives browsers the app, so shared caches must key on the user agent, and on
+                # the forwarded headers too when the snapshot's absolute URLs were built from them
+                vary = "User-Agent"
+                if snapshots.trust_forwarded and not snapshots.public_url:
+                    vary += ", X-Forwarded-Host, X-Forwarded-Proto"
+                await send_response(send, 200, [("content-type", "text/html; charset=utf-8"),
+                                                ("content-length", str(len(document))),
+                                                ("cache-control", "public, max-age=300"),
+                                                ("vary", vary)],
+                                    document if scope["method"] == "GET" else b"")
+                return
+        await self.app(scope, receive, send)
+
+
+def main():
+    """Render the crawler snapshot"""
+    parser = argparse.ArgumentParser(description="Render the crawler snapshot")
+    parser.add_argument("--out", default=str(SNAPSHOT_DIR), help=f"output directory (default: {SNAPSHOT_DIR})")
+    args = parser.parse_args()
+
+    snapshot = render_snapshot(args.out)
+    print(f"✅ Rendered {len(snapshot['pages'])} crawler pages for content {snapshot['content_version']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Design tokens: one palette, spacing and type scale, emitted as CSS custom properties and utility classes
+"""
+
+PALETTE = {
+    "accent": "#64ffda",
+    "indigo": "#667eea",
+    "violet": "#764ba2",
+    "pink": "#f093fb",
+    "cyan": "#00f2fe",
+    "text": "#ccd6f6",
+    "muted": "#8892b0",
+    "white": "#fff",
+    "warning": "#f9ca24",
+    "danger": "#ff6b6b",
+}
+SPACING = (10, 15, 20, 25, 40)
+FONT_SIZES = {"small": "0.85rem", "caption": "0.9rem", "body": "1rem", "lead": "1.1rem", "intro": "1.3rem",
+              "title": "2.2rem", "icon": "2.5rem", "icon-large": "3rem"}
+FONT_WEIGHTS = {"light": 300, "semibold": 600, "bold": "bold"}
+LINE_HEIGHTS = {"relaxed": 1.7, "body": 1.8, "loose": 2}
+# Single-purpose helpers that are not tokens but replace the remaining repeated inline declarations
+HELPERS = {"no-underline": "text-decoration: none", "inline-block": "display: inline-block",
+           "text-center": "text-align: center", "italic": "font-style: italic"}
+
+# Content accents are plain hex values; those in the palette map to its classes
+COLOR_NAMES = {color: name for name, color in PALETTE.items()}
+
+
+def utility_rules():
+    """(class name, declaration) for every utility class"""
+    rules = [(f"c-{name}", f"color: var(--c-{name})") for name in PALETTE]
+    rules += [(f"bd-{name}", f"border-color: var(--c-{name})") for name in PALETTE]
+    for step in SPACING:
+        rules += [(f"mt-{step}", f"margin-top: var(--space-{step})"),
+                  (f"mb-{step}", f"margin-bottom: var(--space-{step})"),
+                  (f"my-{step}", f"margin: var(--space-{step}) 0")]
+    rules += [(f"fs-{name}", f"font-size: var(--fs-{name})") for name in FONT_SIZES]
+    rules += [(f"fw-{name}", f"font-weight: {weight}") for name, weight in FONT_WEIGHTS.items()]
+    rules += [(f"lh-{name}", f"line-height: var(--lh-{name})") for name in LINE_HEIGHTS]
+    rules += list(HELPERS.items())
+    return rules
+
+
+def token_css():
+    """Custom properties for every token and the utility classes that use them"""
+    properties = [f"--c-{name}: {color};" for name, color in PALETTE.items()]
+    properties += [f"--space-{step}: {step}px;" for step in SPACING]
+    properties += [f"--fs-{name}: {size};" for name, size in FONT_SIZES.items()]
+    properties += [f"--lh-{name}: {height};" for name, height in LINE_HEIGHTS.items()]
+    # Utilities stand in for the inline styles they replaced, which outranked Streamlit's markdown styles
+    rules = [f".{name} {{ {declaration} !important; }}" for name, declaration in utility_rules()]
+    return ("/* Generated from src/design_tokens.py */\n:root {\n    " + "\n    ".join(properties) + "\n}\n"
+            + "\n".join(rules) + "\n")
+
+
+def tone(color, *classes, border=False):
+    """class (and, for colors outside the palette, style) attributes that color an element"""
+    name = COLOR_NAMES.get(color.lower())
+    if name:
+        classes += (f"c-{name}",) + ((f"bd-{name}",) if border else ())
+        return f'class="{" ".join(classes)}"'
+    style = f"color: {color};" + (f" border-color: {color};" if border else "")
+    return (f'class="{" ".join(classes)}" ' if classes else "") + f'style="{style}"'
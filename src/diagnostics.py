@@ -0,0 +1,112 @@
+"""
+Runtime diagnostics: rerun and section timings, process memory and Streamlit's own session and cache stats
+"""
+
+import heapq
+import os
+import threading
+import time
+from collections import defaultdict, deque
+from pathlib import Path
+
+RECENT_RERUNS = 500
+RECENT_SECTION_TIMINGS = 200
+
+
+class RerunStats:
+    """Thread-safe record of recent reruns and per-section render times, shared by every session"""
+
+    def __init__(self, max_reruns=RECENT_RERUNS, max_section_timings=RECENT_SECTION_TIMINGS):
+        self.total = 0
+        self._reruns = deque(maxlen=max_reruns)
+        self._sections = defaultdict(lambda: deque(maxlen=max_section_timings))
+        self._lock = threading.Lock()
+
+    def record(self, session_id, page, seconds):
+        """Record one finished rerun"""
+        with self._lock:
+            self.total += 1
+            self._reruns.append({"at": time.time(), "session": session_id, "page": page, "seconds": seconds})
+
+    def section(self, name, seconds):
+        """Record how long one section took to render"""
+        with self._lock:
+            self._sections[name].append(seconds)
+
+    def rate(self, window=60):
+        """Reruns per minute over the last window seconds"""
+        cutoff = time.time() - window
+        with self._lock:
+            recent = sum(1 for rerun in self._reruns if rerun["at"] >= cutoff)
+        return recent * 60 / window
+
+    def slowest(self, count=10):
+        """The slowest recent reruns, slowest first"""
+        with self._lock:
+            return heapq.nlargest(count, self._reruns, key=lambda rerun: rerun["seconds"])
+
+    def section_summary(self):
+        """Count, mean, p95 and max milliseconds per section over its recent renders"""
+        with self._lock:
+            sections = {name: sorted(timings) for name, timings in self._sections.items()}
+        return [{"section": name,
+                 "renders": len(timings),
+                 "mean_ms": 1000 * sum(timings) / len(timings),
+                 "p95_ms": 1000 * timings[min(len(timings) - 1, int(0.95 * len(timings)))],
+                 "max_ms": 1000 * timings[-1]}
+                for name, timings in sorted(sections.items()) if timings]
+
+    def clear(self):
+        """Forget every recorded rerun and timing"""
+        with self._lock:
+            self._reruns.clear()
+            self._sections.clear()
+
+
+def process_rss_mb():
+    """Resident memory of this process in MB, or None where /proc is unavailable"""
+    try:
+        pages = int(Path("/proc/self/statm").read_text().split()[1])
+    except (OSError, ValueError, IndexError):
+        return None
+    return pages * os.sysconf("SC_PAGE_SIZE") / 1e6
+
+
+def streamlit_runtime():
+    """The running Streamlit server runtime, or None (e.g. under AppTest)"""
+    try:
+        from streamlit.runtime import Runtime
+        return Runtime.instance() if Runtime.exists() else None
+    except Exception:
+        return None
+
+
+def active_session_count():
+    """Number of browser sessions connected to this process, or None when unknown"""
+    runtime = streamlit_runtime()
+    try:
+        return runtime._session_mgr.num_active_sessions() if runtime else None
+    except AttributeError:
+        return None
+
+
+def streamlit_cache_stats():
+    """Bytes and entries per Streamlit cache (st.cache_data, st.cache_resource, session state)"""
+    runtime = streamlit_runtime()
+    if runtime is None:
+        return []
+    totals = defaultdict(lambda: [0, 0])
+    for stats in runtime.stats_mgr.get_stats().values():
+        for stat in stats:
+            if hasattr(stat, "category_name"):
+                total = totals[(stat.category_name, stat.cache_name)]
+                total[0] += 1
+                total[1] += stat.byte_length
+    return [{"category": category, "cache": name, "entries": entries, "bytes": size}
+            for (category, name), (entries, size) in sorted(totals.items(), key=lambda item: -item[1][1])]
+
+
+def hit_rate(hits, misses):
+    """Fraction of lookups served from cache, or None before the first lookup"""
+    lookups = hits + misses
+    return hits / lookups if lookups else None
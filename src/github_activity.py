@@ -0,0 +1,314 @@
+"""
+GitHub activity: a background fetcher appends public events to a compact columnar store on disk,
+and the heatmap and language breakdown are vectorized aggregates memoized by the store's version
+"""
+
+import os
+import re
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import requests
+
+from http_client import get_client
+
+GITHUB_API_URL = "https://api.github.com"
+FETCH_INTERVAL_SECONDS = 60 * 60
+# The public events API returns at most 300 events, 100 per page
+EVENTS_PER_PAGE = 100
+MAX_EVENT_PAGES = 3
+HEATMAP_WEEKS = 52
+HEATMAP_LEVELS = 4
+SECONDS_PER_DAY = 24 * 60 * 60
+# Repositories without a language (or not looked up yet) are counted here
+UNKNOWN_LANGUAGE = "Other"
+# Language code of a repository the fetcher has not looked up yet
+PENDING_LANGUAGE = -1
+
+GITHUB_PROFILE_PATTERN = re.compile(r"github\.com/([A-Za-z0-9-]+)/?$")
+
+# One row per event; strings are stored once in a vocabulary and referenced by small integer codes
+EVENT_COLUMNS = {"id": np.int64, "day": np.int32, "type": np.int16, "repo": np.int32, "weight": np.int32}
+
+
+def github_user(contacts):
+    """The GitHub username linked from the contact list, or None"""
+    for contact in contacts:
+        match = GITHUB_PROFILE_PATTERN.search(contact.get("url") or "")
+        if match:
+            return match.group(1)
+    return None
+
+
+def event_row(event):
+    """Reduce a GitHub API event to the fields the panel aggregates"""
+    created = pd.Timestamp(event["created_at"]).timestamp()
+    payload = event.get("payload") or {}
+    # A push counts each of its commits, as on the GitHub profile; every other event counts once
+    weight = payload.get("distinct_size", payload.get("size", 1)) if event["type"] == "PushEvent" else 1
+    return {"id": int(event["id"]), "day": int(created // SECONDS_PER_DAY), "type": event["type"],
+            "repo": event["repo"]["name"], "weight": max(1, int(weight))}
+
+
+def vocabulary_codes(vocabulary, values):
+    """Codes of values in a vocabulary list, appending values not seen before"""
+    index = {value: code for code, value in enumerate(vocabulary)}
+    codes = []
+    for value in values:
+        if value not in index:
+            index[value] = len(vocabulary)
+            vocabulary.append(value)
+        codes.append(index[value])
+    return codes
+
+
+def week_start(day):
+    """The Sunday starting the week of a day number (days since 1970-01-01, a Thursday)"""
+    return day - (day + 4) % 7
+
+
+def contribution_grid(days, weights, end_day, weeks=HEATMAP_WEEKS):
+    """Contributions per day as a 7 x weeks grid (rows Sunday..Saturday) ending with end_day's week"""
+    start = week_start(end_day) - 7 * (weeks - 1)
+    offsets = days.astype(np.int64) - start
+    inside = (offsets >= 0) & (offsets < 7 * weeks)
+    counts = np.bincount(offsets[inside], weights=weights[inside], minlength=7 * weeks)
+    return counts.reshape(weeks, 7).T, start
+
+
+def heatmap_levels(grid, levels=HEATMAP_LEVELS):
+    """Quantize daily counts to 0 (none) .. levels (busiest day) for coloring"""
+    peak = grid.max()
+    if peak <= 0:
+        return np.zeros(grid.shape, dtype=np.int8)
+    return np.ceil(levels * grid / peak).astype(np.int8)
+
+
+def language_totals(repos, weights, repo_languages, languages):
+    """Contributions per language, largest first, with each language's share"""
+    codes = np.maximum(repo_languages[repos], 0)
+    totals = pd.Series(np.bincount(codes, weights=weights, minlength=len(languages)), index=languages)
+    totals = totals[totals > 0].sort_values(ascending=False, kind="stable")
+    return pd.DataFrame({"language": totals.index, "contributions": totals.to_numpy(dtype=np.int64),
+                         "share": (totals / totals.sum()).to_numpy() if len(totals) else []})
+
+
+class ActivityStore:
+    """Append-only event columns in one compressed .npz file; the version increases on every change"""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._memo = {}
+        self.load()
+
+    def load(self):
+        """Read the store from disk, or start empty"""
+        columns = {name: np.empty(0, dtype=dtype) for name, dtype in EVENT_COLUMNS.items()}
+        types, repos, languages, repo_languages, version = [], [], [UNKNOWN_LANGUAGE], np.empty(0, np.int16), 0
+        try:
+            with np.load(self.path, allow_pickle=False) as data:
+                columns = {name: data[name].astype(dtype) for name, dtype in EVENT_COLUMNS.items()}
+                types, repos, languages = (data[name].tolist() for name in ("types", "repos", "languages"))
+                repo_languages = data["repo_languages"].astype(np.int16)
+                version = int(data["version"])
+        except (OSError, KeyError, ValueError):
+            pass
+        with self._lock:
+            self._columns = columns
+            self._types, self._repos, self._languages = types, repos, languages
+            self._repo_languages = repo_languages
+            self.version = version
+
+    def save(self):
+        """Atomically write the store"""
+        with self._lock:
+            arrays = dict(self._columns, types=np.array(self._types, dtype=str),
+                          repos=np.array(self._repos, dtype=str), languages=np.array(self._languages, dtype=str),
+                          repo_languages=self._repo_languages, version=np.int64(self.version))
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.path.with_name(self.path.name + ".tmp.npz")
+        np.savez_compressed(temp_path, **arrays)
+        os.replace(temp_path, self.path)
+
+    def __len__(self):
+        return len(self._columns["id"])
+
+    def latest_id(self):
+        """The newest event id stored, or 0 when empty"""
+        with self._lock:
+            ids = self._columns["id"]
+            return int(ids.max()) if len(ids) else 0
+
+    def append(self, events):
+        """Add API events not stored yet; return how many were added"""
+        rows = [event_row(event) for event in events]
+        with self._lock:
+            ids = np.array([row["id"] for row in rows], dtype=np.int64)
+            ids, first = np.unique(ids, return_index=True)
+            new = ~np.isin(ids, self._columns["id"])
+            rows = [rows[index] for index in first[new]]
+            if not rows:
+                return 0
+            added = {
+                "id": [row["id"] for row in rows],
+                "day": [row["day"] for row in rows],
+                "type": vocabulary_codes(self._types, [row["type"] for row in rows]),
+                "repo": vocabulary_codes(self._repos, [row["repo"] for row in rows]),
+                "weight": [row["weight"] for row in rows],
+            }
+            self._columns = {name: np.concatenate([self._columns[name], np.array(added[name], dtype=dtype)])
+                             for name, dtype in EVENT_COLUMNS.items()}
+            missing = len(self._repos) - len(self._repo_languages)
+            self._repo_languages = np.concatenate([self._repo_languages,
+                                                   np.full(missing, PENDING_LANGUAGE, dtype=np.int16)])
+            self.version += 1
+            return len(rows)
+
+    def repos_without_language(self):
+        """Repositories whose language has not been looked up"""
+        with self._lock:
+            return [self._repos[code] for code in np.flatnonzero(self._repo_languages == PENDING_LANGUAGE)]
+
+    def set_languages(self, repo_languages):
+        """Record the primary language of repositories by name"""
+        with self._lock:
+            index = {name: code for code, name in enumerate(self._repos)}
+            # Summaries read the arrays outside the lock, so they are replaced rather than modified
+            updated = self._repo_languages.copy()
+            for repo, language in repo_languages.items():
+                if repo in index:
+                    updated[index[repo]] = vocabulary_codes(self._languages, [language or UNKNOWN_LANGUAGE])[0]
+            if np.array_equal(updated, self._repo_languages):
+                return False
+            self._repo_languages = updated
+            self.version += 1
+            return True
+
+    def summary(self, end_day=None, weeks=HEATMAP_WEEKS):
+        """Heatmap levels, totals and language breakdown, computed once per store version and day"""
+        end_day = int(time.time() // SECONDS_PER_DAY) if end_day is None else end_day
+        with self._lock:
+            key = (self.version, end_day, weeks)
+            if key in self._memo:
+                self.hits += 1
+                return self._memo[key]
+            self.misses += 1
+            columns = self._columns
+            repo_languages, languages = self._repo_languages, list(self._languages)
+
+        grid, start_day = contribution_grid(columns["day"], columns["weight"], end_day, weeks)
+        recent = columns["day"] >= start_day
+        summary = {
+            "version": key[0],
+            "start_day": start_day,
+            "end_day": end_day,
+            "levels": heatmap_levels(grid),
+            "contributions": int(grid.sum()),
+            "active_days": int(np.count_nonzero(grid)),
+            "busiest_day": int(grid.max()),
+            "languages": language_totals(columns["repo"][recent], columns["weight"][recent],
+                                         repo_languages, languages),
+        }
+        with self._lock:
+            # Only the latest version is ever asked for again
+            self._memo = {key: summary}
+        return summary
+
+
+def fetch_repo_language(repo, api_url=GITHUB_API_URL, headers=None, timeout=10):
+    """A repository's primary language, '' when it has none or is gone, or None when unreachable"""
+    try:
+        response = get_client().get(f"{api_url}/repos/{repo}", deadline=timeout, headers=headers or {})
+        if response.status_code == 404:
+            return ""
+        response.raise_for_status()
+        return response.json().get("language") or ""
+    except (requests.RequestException, ValueError):
+        return None
+
+
+class ActivityFetcher:
+    """Polls a user's public GitHub events on a daemon thread and appends new ones to the store"""
+
+    def __init__(self, store, user, interval=FETCH_INTERVAL_SECONDS, api_url=GITHUB_API_URL, token=None,
+                 timeout=10):
+        self.store = store
+        self.user = user
+        self.interval = interval
+        self.api_url = api_url.rstrip("/")
+        self.timeout = timeout
+        self.headers = {"Accept": "application/vnd.github+json"}
+        if token:
+            self.headers["Authorization"] = f"Bearer {token}"
+        self.checked_at = None
+        self._etag = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._worker = None
+
+    def fetch_events(self):
+        """Events newer than the store's latest, newest first; unchanged first pages cost no rate limit"""
+        latest = self.store.latest_id()
+        events = []
+        for page in range(1, MAX_EVENT_PAGES + 1):
+            headers = dict(self.headers)
+            if page == 1 and self._etag:
+                headers["If-None-Match"] = self._etag
+            response = get_client().get(f"{self.api_url}/users/{self.user}/events/public",
+                                        deadline=self.timeout, headers=headers,
+                                        params={"per_page": EVENTS_PER_PAGE, "page": page})
+            if response.status_code == 304:
+                return []
+            response.raise_for_status()
+            if page == 1:
+                self._etag = response.headers.get("ETag")
+            batch = response.json()
+            events.extend(event for event in batch if int(event["id"]) > latest)
+            if len(batch) < EVENTS_PER_PAGE or any(int(event["id"]) <= latest for event in batch):
+                break
+        return events
+
+    def refresh(self):
+        """Fetch new events and missing repository languages once, then save the store if it changed"""
+        version = self.store.version
+        try:
+            self.store.append(self.fetch_events())
+        except (requests.RequestException, ValueError, KeyError):
+            # Keep what is stored when GitHub is unreachable or rate-limits us
+            return False
+        languages = {}
+        for repo in self.store.repos_without_language():
+            language = fetch_repo_language(repo, self.api_url, self.headers, self.timeout)
+            if language is not None:
+                languages[repo] = language
+        self.store.set_languages(languages)
+        if self.store.version != version:
+            self.store.save()
+        self.checked_at = time.time()
+        return True
+
+    def run(self):
+        """Fetch until stopped"""
+        while not self._stop.is_set():
+            self.refresh()
+            self._stop.wait(self.interval)
+
+    def start(self):
+        """Start the fetcher thread unless it is already running"""
+        with self._lock:
+            if self._worker is not None and self._worker.is_alive():
+                return False
+            self._stop.clear()
+            self._worker = threading.Thread(target=self.run, name="github-activity", daemon=True)
+            self._worker.start()
+        return True
+
+    def stop(self):
+        """Ask the fetcher thread to exit after its current pass"""
+        self._stop.set()
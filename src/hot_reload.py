@@ -0,0 +1,122 @@
+"""
+Content hot reload: watch content files, diff records and invalidate only the caches derived from them
+"""
+
+import json
+import runpy
+import threading
+from collections import defaultdict
+from pathlib import Path
+
+from content import BUNDLE_KEYS
+
+RELOAD_INTERVAL_SECONDS = 5.0
+
+
+def bundle_records(bundle):
+    """Flatten a bundle into canonical JSON per record, keyed 'collection:id'"""
+    records = {"profile": json.dumps(bundle["profile"], sort_keys=True)}
+    for name, header in bundle["section_headers"].items():
+        records[f"section_headers:{name}"] = json.dumps(header, sort_keys=True)
+    for collection in BUNDLE_KEYS:
+        if collection in ("profile", "section_headers"):
+            continue
+        for index, record in enumerate(bundle[collection]):
+            record_id = record.get("id", record.get("label", index))
+            records[f"{collection}:{record_id}"] = json.dumps(record, sort_keys=True)
+    return records
+
+
+def diff_bundles(old, new):
+    """Return the keys of records that were added, removed or changed"""
+    old_records = bundle_records(old)
+    new_records = bundle_records(new)
+    return {key for key in old_records.keys() | new_records.keys()
+            if old_records.get(key) != new_records.get(key)}
+
+
+def load_module_bundle(path):
+    """Re-execute a content module (src/content.py) and return its data as a bundle"""
+    namespace = runpy.run_path(str(path))
+    return {key: namespace[key.upper()] for key in BUNDLE_KEYS}
+
+
+class DependencyGraph:
+    """Maps content records (and files) to the cache entries derived from them"""
+
+    def __init__(self):
+        self._dependents = defaultdict(set)
+        self._lock = threading.Lock()
+
+    def add(self, cache_key, records):
+        """Record that cache_key was rendered from the given record keys"""
+        with self._lock:
+            for record in records:
+                self._dependents[record].add(cache_key)
+
+    def invalidate(self, changed):
+        """Return (and forget) every cache key that depends on a changed record"""
+        keys = set()
+        with self._lock:
+            for record in changed:
+                keys |= self._dependents.pop(record, set())
+        return keys
+
+
+def file_mtimes(paths):
+    """Modification time per watched file; missing files map to None"""
+    mtimes = {}
+    for path in paths:
+        try:
+            mtimes[path] = Path(path).stat().st_mtime_ns
+        except OSError:
+            mtimes[path] = None
+    return mtimes
+
+
+class ContentWatcher:
+    """Polls each loaded tenant's content files and reloads the tenants whose files changed"""
+
+    def __init__(self, registry, interval=RELOAD_INTERVAL_SECONDS):
+        self.registry = registry
+        self.interval = interval
+        self._stop = threading.Event()
+        self._worker = None
+        self._lock = threading.Lock()
+
+    def check(self):
+        """Reload every tenant with a changed file; return {tenant_id: changed record keys}"""
+        reloaded = {}
+        for tenant_id in self.registry.tenant_ids():
+            tenant = self.registry.peek(tenant_id)
+            if tenant is None:
+                continue
+            changed_files = [path for path, mtime in file_mtimes(tenant["mtimes"]).items()
+                             if mtime != tenant["mtimes"][path]]
+            if not changed_files:
+                continue
+            try:
+                reloaded[tenant_id] = self.registry.reload(tenant_id, changed_files)
+            except Exception:
+                # A half-saved content file keeps the old content; the next poll retries it
+                pass
+        return reloaded
+
+    def run(self):
+        """Poll until stopped"""
+        while not self._stop.wait(self.interval):
+            self.check()
+
+    def start(self):
+        """Start the polling thread unless it is already running"""
+        with self._lock:
+            if self._worker is not None and self._worker.is_alive():
+                return False
+            self._stop.clear()
+            self._worker = threading.Thread(target=self.run, name="content-watcher", daemon=True)
+            self._worker.start()
+        return True
+
+    def stop(self):
+        """Ask the polling thread to exit"""
+        self._stop.set()
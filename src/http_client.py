@@ -0,0 +1,173 @@
+"""
+Shared, pooled HTTP client used for every outbound fetch
+"""
+
+import io
+import random
+import threading
+import time
+import weakref
+from concurrent.futures import Future
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+# Identical idempotent, non-streaming requests share one in-flight call
+COALESCED_METHODS = {"GET", "HEAD"}
+
+
+def detached_copy(response):
+    """A copy of a fully read response that shares no body or connection state with the original"""
+    copy = requests.Response()
+    copy.status_code = response.status_code
+    copy.reason = response.reason
+    copy.url = response.url
+    copy.encoding = response.encoding
+    copy.headers = CaseInsensitiveDict(response.headers)
+    copy.cookies = response.cookies.copy()
+    copy.history = list(response.history)
+    copy.elapsed = response.elapsed
+    copy.request = response.request
+    copy._content = response.content
+    copy._content_consumed = True
+    copy.raw = io.BytesIO(copy._content)
+    return copy
+
+
+class HttpClient:
+    """requests.Session wrapper with bounded pools, jittered retries, deadlines and single-flight"""
+
+    def __init__(self, max_connections=16, max_per_host=4, retries=3,
+                 backoff_base=0.25, backoff_cap=4.0, default_deadline=10.0):
+        self.retries = retries
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.default_deadline = default_deadline
+
+        self.session = requests.Session()
+        self.session.headers["User-Agent"] = "bhumika-portfolio/1.0"
+        # Keep-alive pools per host; pool_block makes callers wait instead of opening extra sockets
+        adapter = HTTPAdapter(pool_connections=max_connections, pool_maxsize=max_per_host,
+                              pool_block=True, max_retries=0)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self._connection_slots = threading.BoundedSemaphore(max_connections)
+
+        self._in_flight = {}
+        self._in_flight_lock = threading.Lock()
+
+    def backoff(self, attempt):
+        """Full-jitter exponential backoff delay for the given retry attempt"""
+        return random.uniform(0, min(self.backoff_cap, self.backoff_base * (2 ** attempt)))
+
+    def request(self, method, url, deadline=None, **kwargs):
+        """Send a request, coalescing identical in-flight GET/HEAD calls into one"""
+        method = method.upper()
+        if method not in COALESCED_METHODS or kwargs.get("stream"):
+            return self._send(method, url, deadline, **kwargs)
+
+        key = (method, url, tuple(sorted(kwargs.items())))
+        try:
+            hash(key)
+        except TypeError:
+            return self._send(method, url, deadline, **kwargs)
+
+        with self._in_flight_lock:
+            future = self._in_flight.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._in_flight[key] = future
+
+        if not leader:
+            # Each follower gets its own copy, so reading .raw or iterating the body cannot race the others
+            return detached_copy(future.result())
+
+        try:
+            response = self._send(method, url, deadline, **kwargs)
+            future.set_result(response)
+            return response
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._in_flight_lock:
+                self._in_flight.pop(key, None)
+
+    def _send(self, method, url, deadline=None, **kwargs):
+        """Send with retries until success, a non-retryable error, or the overall deadline"""
+        deadline_at = time.monotonic() + (deadline or self.default_deadline)
+
+        for attempt in range(self.retries + 1):
+            remaining = deadline_at - time.monotonic()
+            if remaining <= 0:
+                raise requests.Timeout(f"Deadline exceeded for {method} {url}")
+
+            self._connection_slots.acquire()
+            try:
+                response = self.session.request(method, url, timeout=remaining, **kwargs)
+            except BaseException as e:
+                self._connection_slots.release()
+                if not isinstance(e, (requests.ConnectionError, requests.Timeout)) or attempt == self.retries:
+                    raise
+            else:
+                self._hold_slot(response, kwargs.get("stream", False))
+                if response.status_code not in RETRY_STATUSES or attempt == self.retries:
+                    return response
+                response.close()
+
+            delay = self.backoff(attempt)
+            if time.monotonic() + delay >= deadline_at:
+                raise requests.Timeout(f"Deadline exceeded for {method} {url}")
+            time.sleep(delay)
+
+    def _hold_slot(self, response, stream):
+        """Keep a streamed response's connection slot until its body is read or it is closed"""
+        if not stream:
+            self._connection_slots.release()
+            return
+
+        lock = threading.Lock()
+        held = [True]
+
+        def release():
+            with lock:
+                if held[0]:
+                    held[0] = False
+                    self._connection_slots.release()
+
+        # urllib3 returns the connection to its pool through release_conn, both when the body is exhausted
+        # and on close(); a response dropped unread gives its slot back when it is collected
+        release_conn = response.raw.release_conn
+
+        def release_conn_and_slot():
+            try:
+                release_conn()
+            finally:
+                release()
+
+        response.raw.release_conn = release_conn_and_slot
+        weakref.finalize(response, release)
+
+    def get(self, url, deadline=None, **kwargs):
+        """GET a URL through the shared pool"""
+        return self.request("GET", url, deadline=deadline, **kwargs)
+
+    def head(self, url, deadline=None, **kwargs):
+        """HEAD a URL through the shared pool"""
+        return self.request("HEAD", url, deadline=deadline, **kwargs)
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_client():
+    """Return the process-wide HTTP client, creating it on first use"""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = HttpClient()
+        return _client
@@ -0,0 +1,160 @@
+"""
+On-demand image resizing in a process pool, backed by a size-bounded disk cache
+"""
+
+import hashlib
+import io
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, TimeoutError
+from pathlib import Path
+
+FORMATS = {"jpeg": ".jpg", "webp": ".webp", "png": ".png"}
+QUALITY = 82
+
+
+def resize_image(source, width, fmt="jpeg"):
+    """Decode, resize (never upscaling) and encode an image; runs inside a worker process"""
+    from PIL import Image
+
+    with Image.open(source) as image:
+        if fmt != "png":
+            image = image.convert("RGB")
+        if width < image.width:
+            height = max(1, round(image.height * width / image.width))
+            image = image.resize((width, height), Image.Resampling.LANCZOS)
+        buffer = io.BytesIO()
+        image.save(buffer, format=fmt.upper(), quality=QUALITY, optimize=True)
+    return buffer.getvalue()
+
+
+def variant_name(source, width, fmt="jpeg"):
+    """Immutable file name for a variant, derived from the source bytes, width and format"""
+    source = Path(source)
+    digest = hashlib.sha256(source.read_bytes()).hexdigest()[:12]
+    return f"{source.stem}-{width}w.{digest}{FORMATS[fmt]}"
+
+
+class DiskCache:
+    """Directory of immutable files bounded by total size, evicting least recently used first"""
+
+    def __init__(self, directory, max_bytes):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def get(self, name):
+        """Return the cached file path, refreshing its recency, or None on a miss"""
+        path = self.directory / name
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return path
+
+    def put(self, name, data):
+        """Atomically store a file, then evict old entries until under the size bound"""
+        path = self.directory / name
+        temp_path = path.with_name(path.name + ".tmp")
+        temp_path.write_bytes(data)
+        os.replace(temp_path, path)
+        self.evict()
+        return path
+
+    def size(self):
+        """Total bytes currently cached"""
+        return sum(entry.stat().st_size for entry in self.directory.iterdir() if entry.is_file())
+
+    def clear(self):
+        """Delete every cached file"""
+        with self._lock:
+            for entry in self.directory.iterdir():
+                if entry.is_file():
+                    entry.unlink(missing_ok=True)
+
+    def evict(self):
+        """Delete least recently used files until the cache fits in max_bytes"""
+        with self._lock:
+            entries = [(entry.stat().st_mtime_ns, entry.stat().st_size, entry)
+                       for entry in self.directory.iterdir() if entry.is_file()]
+            total = sum(size for _, size, _ in entries)
+            for _, size, entry in sorted(entries, key=lambda item: item[0]):
+                if total <= self.max_bytes:
+                    break
+                entry.unlink(missing_ok=True)
+                total -= size
+
+
+class ResizeService:
+    """Computes each width/format variant once, off the script thread, de-duplicating concurrent requests"""
+
+    def __init__(self, cache_dir, max_bytes=64 * 1024 * 1024, max_workers=2):
+        self.cache = DiskCache(cache_dir, max_bytes)
+        # spawn avoids forking a process that already runs server and checker threads
+        self.pool = ProcessPoolExecutor(max_workers=max_workers,
+                                        mp_context=multiprocessing.get_context("spawn"))
+        self._pending = {}
+        # Variants whose source could not be resized are not retried until the source changes
+        self._failed = {}
+        self._lock = threading.Lock()
+
+    def request(self, source, width, fmt="jpeg"):
+        """Return a future resolving to the variant's cached path"""
+        from concurrent.futures import Future
+
+        name = variant_name(source, width, fmt)
+        cached = self.cache.get(name)
+        if cached is not None:
+            done = Future()
+            done.set_result(cached)
+            return done
+
+        with self._lock:
+            pending = self._pending.get(name)
+            if pending is not None:
+                return pending
+            if name in self._failed:
+                failed = Future()
+                failed.set_exception(self._failed[name])
+                return failed
+
+            result = Future()
+            self._pending[name] = result
+            work = self.pool.submit(resize_image, str(source), width, fmt)
+
+        def finish(work):
+            try:
+                result.set_result(self.cache.put(name, work.result()))
+            except Exception as e:
+                with self._lock:
+                    self._failed[name] = e
+                result.set_exception(e)
+            finally:
+                with self._lock:
+                    self._pending.pop(name, None)
+
+        work.add_done_callback(finish)
+        return result
+
+    def get(self, source, width, fmt="jpeg", timeout=None):
+        """Wait up to timeout for a variant; None means it is still being computed"""
+        try:
+            return self.request(source, width, fmt).result(timeout=timeout)
+        except TimeoutError:
+            return None
+
+    def pending(self, source, width, fmt="jpeg"):
+        """Whether a variant is being computed right now"""
+        name = variant_name(source, width, fmt)
+        with self._lock:
+            return name in self._pending
+
+    def shutdown(self):
+        """Stop the worker processes"""
+        self.pool.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,140 @@
+"""
+Background health checks for the outbound demo and certificate links
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+import requests
+
+from http_client import get_client
+
+# Healthy links are re-checked rarely; broken ones sooner so a recovered link reappears quickly
+OK_TTL_SECONDS = 6 * 60 * 60
+BROKEN_TTL_SECONDS = 10 * 60
+
+
+def probe_url(url, timeout=10):
+    """Return the HTTP status for a URL, falling back to GET when HEAD is refused"""
+    client = get_client()
+    try:
+        response = client.head(url, deadline=timeout, allow_redirects=True)
+        if response.status_code in (403, 405, 501):
+            response = client.get(url, deadline=timeout, stream=True)
+            response.close()
+        return response.status_code
+    except requests.RequestException:
+        return None
+
+
+class LinkHealthChecker:
+    """Checks links concurrently with a bounded pool and per-host pacing, caching results with TTLs"""
+
+    def __init__(self, max_concurrency=8, per_host_interval=0.5, timeout=10,
+                 ok_ttl=OK_TTL_SECONDS, broken_ttl=BROKEN_TTL_SECONDS, probe=probe_url):
+        self.max_concurrency = max_concurrency
+        self.per_host_interval = per_host_interval
+        self.timeout = timeout
+        self.ok_ttl = ok_ttl
+        self.broken_ttl = broken_ttl
+        self.probe = probe
+        self._results = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._worker = None
+
+    def status(self, url):
+        """Return the cached result for a URL, or None when unknown or expired"""
+        with self._lock:
+            result = self._results.get(url)
+        if result is None:
+            return None
+        ttl = self.ok_ttl if result["ok"] else self.broken_ttl
+        if time.time() - result["checked_at"] > ttl:
+            return None
+        return result
+
+    def is_broken(self, url):
+        """True only when a fresh check got an HTTP error; unknown links are assumed fine"""
+        result = self.status(url)
+        return result is not None and result["broken"]
+
+    def stale_urls(self, urls):
+        """Return the URLs with no fresh cached result"""
+        return [url for url in dict.fromkeys(urls) if self.status(url) is None]
+
+    async def check_all(self, urls):
+        """Probe every URL, at most max_concurrency at once and one request per host per interval
+
+        Probes run on an executor owned by this call and joined before it returns, so no blocking request
+        outlives the check or is scheduled after stop() or once the interpreter is exiting.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        executor = ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="link-health-probe")
+        host_locks = {}
+        host_last_request = {}
+        loop = asyncio.get_running_loop()
+
+        async def check(url):
+            host = urlsplit(url).netloc
+            host_lock = host_locks.setdefault(host, asyncio.Lock())
+
+            async with host_lock:
+                wait = host_last_request.get(host, 0) + self.per_host_interval - loop.time()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+                host_last_request[host] = loop.time()
+
+            async with semaphore:
+                if self._stop.is_set():
+                    return None
+                try:
+                    status = await loop.run_in_executor(executor, self.probe, url, self.timeout)
+                except RuntimeError:
+                    # The interpreter is shutting down and no longer starts threads
+                    self._stop.set()
+                    return None
+
+            result = {
+                "url": url,
+                "status": status,
+                "ok": status is not None and status < 400,
+                # Network failures stay unknown so an offline server does not flag every link
+                "broken": status is not None and status >= 400,
+                "checked_at": time.time(),
+            }
+            with self._lock:
+                self._results[url] = result
+            return result
+
+        try:
+            results = await asyncio.gather(*(check(url) for url in dict.fromkeys(urls)))
+        finally:
+            executor.shutdown(wait=True)
+        return [result for result in results if result is not None]
+
+    def refresh_in_background(self, urls):
+        """Start a daemon thread to re-check stale URLs unless one is already running"""
+        stale = self.stale_urls(urls)
+        if not stale:
+            return False
+
+        with self._lock:
+            if self._worker is not None and self._worker.is_alive():
+                return False
+            self._stop.clear()
+            self._worker = threading.Thread(target=asyncio.run, args=(self.check_all(stale),),
+                                            name="link-health-checker", daemon=True)
+            self._worker.start()
+        return True
+
+    def stop(self, timeout=None):
+        """Skip the probes a background check has not started yet and wait for it to finish"""
+        self._stop.set()
+        with self._lock:
+            worker = self._worker
+        if worker is not None:
+            worker.join(timeout)
@@ -0,0 +1,54 @@
+"""
+ASGI entry point: the Streamlit app behind crawler routing and admission control
+
+Usage: streamlit run src/portfolio_server.py (run_portfolio.py does this)
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+
+import streamlit as st
+from starlette.middleware import Middleware
+from starlette.responses import JSONResponse
+from starlette.routing import Mount, Route
+from starlette.staticfiles import StaticFiles
+
+from admission import STATIC_COPY_DIR, STATIC_PATH, STATUS_PATH, AdmissionMiddleware, ensure_static_copy, get_monitor
+from crawlers import SNAPSHOT_DIR, SNAPSHOT_PATH, CrawlerMiddleware, get_snapshots
+
+monitor = get_monitor()
+snapshots = get_snapshots()
+
+
+async def admission_status(request):
+    """Whether new visitors get a live session; the static copy polls this to hand visitors back"""
+    return JSONResponse(monitor.status(), headers={"Cache-Control": "no-store"})
+
+
+@asynccontextmanager
+async def lifespan(app):
+    """Prerender the static copy off the event loop, then sample load on the server's loop
+
+    Crawler snapshots are rendered in the background; until the first is ready, crawlers get the app.
+    """
+    await asyncio.to_thread(ensure_static_copy)
+    monitor.start(asyncio.get_running_loop())
+    snapshots.start()
+    yield
+    snapshots.stop()
+    monitor.stop()
+
+
+STATIC_COPY_DIR.mkdir(parents=True, exist_ok=True)
+SNAPSHOT_DIR.mkdir(parents=True, exist_ok=True)
+
+app = st.App(
+    "streamlit_app.py",
+    lifespan=lifespan,
+    routes=[Route(STATUS_PATH, admission_status),
+            Mount(STATIC_PATH, StaticFiles(directory=STATIC_COPY_DIR, html=True)),
+            Mount(SNAPSHOT_PATH, StaticFiles(directory=SNAPSHOT_DIR))],
+    # Crawlers are answered first, so they neither open sessions nor count towards admission
+    middleware=[Middleware(CrawlerMiddleware, snapshots=snapshots),
+                Middleware(AdmissionMiddleware, monitor=monitor)],
+)
@@ -0,0 +1,131 @@
+"""
+Parse the bundled resume .docx into structured sections, cached per process by file hash
+"""
+
+import hashlib
+import io
+import re
+import threading
+import zipfile
+from pathlib import Path
+from xml.etree import ElementTree
+
+RESUME_PATH = Path(__file__).resolve().parent.parent / "Bhumika_Patel_Resume_new.docx"
+RESUME_MIME = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+
+W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+
+_cache = {"hash": None, "resume": None}
+_cache_lock = threading.Lock()
+
+
+def slugify(text):
+    """Lowercase, hyphen-separated id for a section title"""
+    return re.sub(r"[^a-z0-9]+", "-", text.lower()).strip("-")
+
+
+def paragraph_info(paragraph):
+    """Extract text, leading bold run and list/bookmark markers from a w:p element"""
+    parts = []
+    lead = []
+    leading_bold = True
+    for run in paragraph.iter(f"{W}r"):
+        text = "".join("\t" if child.tag in (f"{W}tab", f"{W}ptab") else (child.text or "")
+                       for child in run if child.tag in (f"{W}t", f"{W}tab", f"{W}ptab"))
+        if not text:
+            continue
+        bold = run.find(f"{W}rPr/{W}b")
+        bold = bold is not None and bold.get(f"{W}val") not in ("0", "false")
+        leading_bold = leading_bold and bold
+        if leading_bold:
+            lead.append(text)
+        parts.append(text)
+
+    bookmarks = [mark.get(f"{W}name") for mark in paragraph.iter(f"{W}bookmarkStart")]
+    return {
+        "text": "".join(parts),
+        "lead": "".join(lead).strip(),
+        "bullet": paragraph.find(f"{W}pPr/{W}numPr") is not None,
+        # Word marks each heading with a bookmark; _GoBack and friends are internal
+        "heading": any(name and not name.startswith("_") for name in bookmarks),
+    }
+
+
+def iter_paragraphs(data):
+    """Stream the document body paragraph by paragraph without building the whole tree"""
+    with zipfile.ZipFile(io.BytesIO(data)) as archive, archive.open("word/document.xml") as document:
+        depth = 0
+        for event, element in ElementTree.iterparse(document, events=("start", "end")):
+            if element.tag != f"{W}p":
+                continue
+            if event == "start":
+                depth += 1
+                continue
+            depth -= 1
+            if depth == 0:
+                yield paragraph_info(element)
+                element.clear()
+
+
+def parse_resume(data):
+    """Group paragraphs into the name, contact lines and titled sections"""
+    name = None
+    contact = []
+    sections = []
+
+    for paragraph in iter_paragraphs(data):
+        text = paragraph["text"].strip()
+        if not text:
+            continue
+        if paragraph["heading"]:
+            sections.append({"id": slugify(text), "title": text, "entries": []})
+        elif not sections:
+            if name is None:
+                name = text
+            else:
+                contact.append(text)
+        else:
+            body, _, aside = text.partition("\t")
+            lead = paragraph["lead"].split("\t")[0].strip()
+            sections[-1]["entries"].append({
+                "lead": lead,
+                "text": body[len(lead):].strip() if lead and body.startswith(lead) else body.strip(),
+                "aside": aside.strip(),
+                "bullet": paragraph["bullet"],
+            })
+
+    return {"name": name, "contact": contact, "sections": sections}
+
+
+def load_resume(path=RESUME_PATH):
+    """Return the parsed resume with its raw bytes, re-parsing only when the file hash changes"""
+    try:
+        data = Path(path).read_bytes()
+    except OSError:
+        return None
+
+    digest = hashlib.sha256(data).hexdigest()[:12]
+    with _cache_lock:
+        if _cache["hash"] != digest:
+            resume = parse_resume(data)
+            resume.update({"hash": digest, "filename": Path(path).name, "data": data})
+            _cache.update({"hash": digest, "resume": resume})
+        return _cache["resume"]
+
+
+def entry_text(entry):
+    """Plain-text rendering of one resume entry"""
+    return " ".join(part for part in (entry["lead"], entry["text"], entry["aside"]) if part)
+
+
+def resume_documents(resume):
+    """Flatten resume sections into search documents"""
+    if resume is None:
+        return []
+    return [{
+        "id": f"resume:{section['id']}",
+        "section": "Resume",
+        "title": section["title"],
+        "text": " ".join(entry_text(entry) for entry in section["entries"]),
+        "url": None,
+    } for section in resume["sections"]]
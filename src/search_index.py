@@ -0,0 +1,136 @@
+"""
+In-memory inverted index over the portfolio content with prefix matching
+"""
+
+import pickle
+import re
+from bisect import bisect_left, insort
+from collections import defaultdict
+
+from content import content_version, search_documents
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9][a-z0-9+#.]*")
+TAG_PATTERN = re.compile(r"<[^>]+>")
+
+# Hits in the card title outrank hits in the body text
+TITLE_WEIGHT = 3
+
+
+def strip_html(text):
+    """Remove markup so only visible words are indexed"""
+    return TAG_PATTERN.sub(" ", text)
+
+
+def tokenize(text):
+    """Split text into lowercase search terms"""
+    return [token.rstrip(".") for token in TOKEN_PATTERN.findall(strip_html(text).lower())]
+
+
+class SearchIndex:
+    """Inverted index mapping terms to weighted postings of document positions"""
+
+    def __init__(self, documents):
+        self.documents = list(documents)
+        postings = defaultdict(dict)
+
+        for position, doc in enumerate(self.documents):
+            for token, weight in self.term_weights(doc).items():
+                postings[token][position] = weight
+
+        self.postings = dict(postings)
+        # Sorted vocabulary lets prefix lookups bisect instead of scanning every term
+        self.vocabulary = sorted(self.postings)
+
+    @staticmethod
+    def term_weights(doc):
+        """Weighted term counts for one document"""
+        weights = {}
+        for token in tokenize(doc["title"]):
+            weights[token] = weights.get(token, 0) + TITLE_WEIGHT
+        for token in tokenize(doc["text"]):
+            weights[token] = weights.get(token, 0) + 1
+        return weights
+
+    def add(self, doc):
+        """Index one more document without rebuilding the rest"""
+        position = len(self.documents)
+        self.documents.append(doc)
+        for token, weight in self.term_weights(doc).items():
+            if token not in self.postings:
+                self.postings[token] = {}
+                insort(self.vocabulary, token)
+            self.postings[token][position] = weight
+
+    def remove(self, doc_id):
+        """Drop one document's postings; its position stays reserved so the others keep theirs"""
+        position = next((position for position, doc in enumerate(self.documents)
+                         if doc is not None and doc["id"] == doc_id), None)
+        if position is None:
+            return False
+
+        for token in self.term_weights(self.documents[position]):
+            postings = self.postings[token]
+            postings.pop(position, None)
+            if not postings:
+                del self.postings[token]
+                del self.vocabulary[bisect_left(self.vocabulary, token)]
+        self.documents[position] = None
+        return True
+
+    def expand(self, prefix):
+        """Return every indexed term starting with the given prefix"""
+        start = bisect_left(self.vocabulary, prefix)
+        terms = []
+        for term in self.vocabulary[start:]:
+            if not term.startswith(prefix):
+                break
+            terms.append(term)
+        return terms
+
+    def search(self, query, limit=10):
+        """Return documents matching every query term (by prefix), best matches first"""
+        terms = tokenize(query)
+        if not terms:
+            return []
+
+        scores = None
+        for term in terms:
+            term_scores = {}
+            for expanded in self.expand(term):
+                for position, weight in self.postings[expanded].items():
+                    term_scores[position] = term_scores.get(position, 0) + weight
+
+            if scores is None:
+                scores = term_scores
+            else:
+                scores = {position: score + term_scores[position]
+                          for position, score in scores.items() if position in term_scores}
+            if not scores:
+                return []
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+        return [self.documents[position] for position, _ in ranked[:limit]]
+
+
+def build_index(bundle=None):
+    """Build the search index from the portfolio content model"""
+    return SearchIndex(search_documents(bundle))
+
+
+def save_index(index, path):
+    """Write a prebuilt index tagged with the content version it was built from"""
+    with open(path, "wb") as f:
+        pickle.dump({"version": content_version(), "index": index}, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def load_index(path=None):
+    """Load a prebuilt index when it matches the current content, otherwise build one"""
+    if path is not None:
+        try:
+            with open(path, "rb") as f:
+                prebuilt = pickle.load(f)
+            if prebuilt["version"] == content_version():
+                return prebuilt["index"]
+        except (OSError, pickle.UnpicklingError, KeyError, EOFError):
+            pass
+    return build_index()
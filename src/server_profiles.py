@@ -0,0 +1,106 @@
+"""
+Named server profiles: the Streamlit config and environment for dev, prod and load-test runs
+"""
+
+import os
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+CONFIG_PATH = REPO_ROOT / ".streamlit" / "config.toml"
+DEFAULT_PROFILE = "prod"
+
+# Settings every profile shares; the profiles below only list what they change
+BASE_CONFIG = {
+    "global": {"developmentMode": False},
+    "browser": {"gatherUsageStats": False},
+    "server": {"headless": True, "enableCORS": False, "enableXsrfProtection": False},
+}
+
+PROFILES = {
+    "dev": {
+        "config": {
+            "server": {"headless": False, "fileWatcherType": "auto", "runOnSave": True},
+            "client": {"showErrorDetails": "full", "toolbarMode": "developer"},
+            "logger": {"level": "info"},
+        },
+        "env": {"PORTFOLIO_RELOAD_INTERVAL": "1"},
+    },
+    "prod": {
+        "config": {
+            # No inotify watches or polling threads and no rerun-on-save: code only changes on deploy
+            "server": {"fileWatcherType": "none", "runOnSave": False,
+                       # Pages are ~50 KB and nothing is uploaded, so much lower caps are still generous
+                       "maxMessageSize": 50, "maxUploadSize": 1},
+            "client": {"showErrorDetails": "none", "toolbarMode": "viewer"},
+            "logger": {"level": "warning"},
+        },
+        "env": {"PORTFOLIO_RELOAD_INTERVAL": "30"},
+    },
+    "load-test": {
+        "config": {
+            "server": {"fileWatcherType": "none", "runOnSave": False, "maxMessageSize": 50, "maxUploadSize": 1},
+            "client": {"showErrorDetails": "none", "toolbarMode": "viewer"},
+            "logger": {"level": "error"},
+        },
+        # Synthetic traffic must not land in the real analytics or contact outbox
+        "env": {"PORTFOLIO_RELOAD_INTERVAL": "30",
+                "PORTFOLIO_ANALYTICS_DB": str(REPO_ROOT / "data" / "load-test-analytics.sqlite3"),
+                "PORTFOLIO_CONTACT_DB": str(REPO_ROOT / "data" / "load-test-contact.sqlite3")},
+    },
+}
+
+
+def profile_config(name):
+    """Merge a profile's settings over the shared base, section by section"""
+    config = {section: dict(options) for section, options in BASE_CONFIG.items()}
+    for section, options in PROFILES[name]["config"].items():
+        config.setdefault(section, {}).update(options)
+    return config
+
+
+def toml_value(value):
+    """Format a config value as TOML"""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, int):
+        return str(value)
+    return f'"{value}"'
+
+
+def render_config(name):
+    """Render a complete .streamlit/config.toml for a profile"""
+    lines = [f"# Generated by: python run_portfolio.py --profile {name} --write-config",
+             "# Edit src/server_profiles.py instead of this file."]
+    for section, options in profile_config(name).items():
+        lines.append("")
+        lines.append(f"[{section}]")
+        lines.extend(f"{option} = {toml_value(value)}" for option, value in options.items())
+    return "\n".join(lines) + "\n"
+
+
+def write_config(name, path=CONFIG_PATH):
+    """Write a profile's config.toml, which `streamlit run` reads when started from the repo root"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(render_config(name), encoding="utf-8")
+    return path
+
+
+def command_line_flags(name):
+    """The profile as `streamlit run` flags, which take precedence over any config.toml"""
+    return [f"--{section}.{option}={str(value).lower() if isinstance(value, bool) else value}"
+            for section, options in profile_config(name).items() for option, value in options.items()]
+
+
+def apply_profile(name, environ=os.environ):
+    """Export a profile's environment, leaving variables that are already set untouched"""
+    for key, value in PROFILES[name]["env"].items():
+        environ.setdefault(key, value)
+    environ.setdefault("PORTFOLIO_PROFILE", name)
+    return environ
+
+
+def profile_from_env(environ=os.environ):
+    """The profile named by PORTFOLIO_PROFILE, defaulting to prod"""
+    name = environ.get("PORTFOLIO_PROFILE", DEFAULT_PROFILE)
+    return name if name in PROFILES else DEFAULT_PROFILE
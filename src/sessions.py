@@ -0,0 +1,185 @@
+"""
+Per-session accounting, idle-session eviction and a cap on sessions per process
+"""
+
+import asyncio
+import threading
+import time
+
+from diagnostics import streamlit_runtime
+
+SESSION_IDLE_SECONDS = 30 * 60
+MAX_SESSIONS = 200
+REAP_INTERVAL_SECONDS = 60
+# When the cap is reached, only sessions idle at least this long are evicted to make room
+CAP_EVICTION_IDLE_SECONDS = 60
+# Sessions turned away at the cap keep their "busy" notice this long before the reaper releases them
+REJECTED_RELEASE_SECONDS = 60
+# WebSocket close code telling the browser the server is going away; Streamlit's client reconnects
+GOING_AWAY = 1001
+
+
+def active_session_ids():
+    """Ids of the sessions connected to this Streamlit server, or None when unknown"""
+    runtime = streamlit_runtime()
+    try:
+        return {info.session.id for info in runtime._session_mgr.list_active_sessions()} if runtime else None
+    except AttributeError:
+        return None
+
+
+def session_state_bytes(session_id):
+    """Approximate memory held by one session's state, from Streamlit's own stats"""
+    runtime = streamlit_runtime()
+    try:
+        info = runtime._session_mgr.get_active_session_info(session_id) if runtime else None
+        if info is None:
+            return None
+        return sum(stat.byte_length for stats in info.session.session_state.get_stats().values() for stat in stats)
+    except AttributeError:
+        return None
+
+
+def close_browser_session(session_id):
+    """Shut a session down and drop its WebSocket; the tab reconnects to a fresh session when it is next active"""
+    runtime = streamlit_runtime()
+    try:
+        info = runtime._session_mgr.get_active_session_info(session_id) if runtime else None
+        if info is None:
+            return False
+        websocket = getattr(info.client, "_websocket", None)
+
+        def close():
+            # Session methods are not thread-safe and must run on the server's event loop
+            runtime.close_session(session_id)
+            if websocket is not None:
+                asyncio.ensure_future(websocket.close(code=GOING_AWAY))
+
+        runtime._get_async_objs().eventloop.call_soon_threadsafe(close)
+        return True
+    except (AttributeError, RuntimeError):
+        return False
+
+
+class SessionTracker:
+    """Tracks reruns and last activity per session and evicts sessions that sit idle"""
+
+    def __init__(self, idle_timeout=SESSION_IDLE_SECONDS, max_sessions=MAX_SESSIONS,
+                 interval=REAP_INTERVAL_SECONDS, close_session=close_browser_session,
+                 list_sessions=active_session_ids, state_bytes=session_state_bytes):
+        self.idle_timeout = idle_timeout
+        self.max_sessions = max_sessions
+        self.interval = interval
+        self.close_session = close_session
+        self.list_sessions = list_sessions
+        self.state_bytes = state_bytes
+        self.evicted = 0
+        self.rejected = 0
+        self._sessions = {}
+        self._rejected = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._worker = None
+
+    def admit(self, session_id):
+        """Register a new session unless the process is full; known sessions are always admitted"""
+        with self._lock:
+            if session_id in self._sessions:
+                return True
+            if len(self._sessions) >= self.max_sessions:
+                cutoff = time.time() - CAP_EVICTION_IDLE_SECONDS
+                candidates = sorted((record["last_active"], other) for other, record in self._sessions.items()
+                                    if record["last_active"] <= cutoff)
+                needed = len(self._sessions) - self.max_sessions + 1
+                victims = [other for _, other in candidates[:needed]]
+            else:
+                victims = []
+
+        for victim in victims:
+            self.evict(victim)
+
+        with self._lock:
+            now = time.time()
+            if len(self._sessions) >= self.max_sessions:
+                # Turned-away sessions are remembered, so the reaper releases their WebSockets too
+                if session_id not in self._rejected:
+                    self._rejected[session_id] = now
+                    self.rejected += 1
+                return False
+            self._rejected.pop(session_id, None)
+            self._sessions[session_id] = {"started": now, "last_active": now, "reruns": 0, "page": ""}
+            return True
+
+    def touch(self, session_id, page=None):
+        """Count a rerun of a session, or of one of its fragments, and mark it active"""
+        with self._lock:
+            record = self._sessions.get(session_id)
+            if record is not None:
+                record["last_active"] = time.time()
+                record["reruns"] += 1
+                if page is not None:
+                    record["page"] = page
+
+    def evict(self, session_id):
+        """Stop tracking a session and release it on the server"""
+        with self._lock:
+            if self._sessions.pop(session_id, None) is None:
+                return False
+            self.evicted += 1
+        self.close_session(session_id)
+        return True
+
+    def reap(self):
+        """Forget sessions whose tabs closed, release turned-away sessions and evict those idle past the timeout
+
+        Returns the evicted ids.
+        """
+        connected = self.list_sessions()
+        now = time.time()
+        with self._lock:
+            if connected is not None:
+                for gone in set(self._sessions) - connected:
+                    del self._sessions[gone]
+                for gone in set(self._rejected) - connected:
+                    del self._rejected[gone]
+            released = [session_id for session_id, rejected_at in self._rejected.items()
+                        if rejected_at <= now - REJECTED_RELEASE_SECONDS]
+            for session_id in released:
+                del self._rejected[session_id]
+            idle = [session_id for session_id, record in self._sessions.items()
+                    if record["last_active"] <= now - self.idle_timeout]
+        for session_id in released:
+            self.close_session(session_id)
+        return [session_id for session_id in idle if self.evict(session_id)]
+
+    def report(self):
+        """Per-session accounting, most recently active first"""
+        now = time.time()
+        with self._lock:
+            sessions = {session_id: dict(record) for session_id, record in self._sessions.items()}
+        return [{"session": session_id, "page": record["page"], "reruns": record["reruns"],
+                 "idle_s": now - record["last_active"], "age_s": now - record["started"],
+                 "state_bytes": self.state_bytes(session_id)}
+                for session_id, record in sorted(sessions.items(), key=lambda item: -item[1]["last_active"])]
+
+    def __len__(self):
+        return len(self._sessions)
+
+    def run(self):
+        """Reap until stopped"""
+        while not self._stop.wait(self.interval):
+            self.reap()
+
+    def start(self):
+        """Start the reaper thread unless it is already running"""
+        with self._lock:
+            if self._worker is not None and self._worker.is_alive():
+                return False
+            self._stop.clear()
+            self._worker = threading.Thread(target=self.run, name="session-reaper", daemon=True)
+            self._worker.start()
+        return True
+
+    def stop(self):
+        """Ask the reaper thread to exit"""
+        self._stop.set()
@@ -0,0 +1,117 @@
+"""
+Background polling of Hugging Face Space runtime status for the live-demo badges
+"""
+
+import threading
+import time
+
+import requests
+
+from http_client import get_client
+
+HF_API_URL = "https://huggingface.co/api/spaces"
+POLL_INTERVAL_SECONDS = 5 * 60
+
+# Hugging Face runtime stages collapsed into the three states a visitor cares about
+STAGE_STATES = {
+    "RUNNING": "running",
+    "RUNNING_BUILDING": "running",
+    "APP_STARTING": "running",
+    "BUILDING": "sleeping",
+    "SLEEPING": "sleeping",
+    "PAUSED": "sleeping",
+    "STOPPED": "sleeping",
+}
+
+
+def space_id(demo_url):
+    """Return the owner/name id from a huggingface.co/spaces URL"""
+    return "/".join(demo_url.rstrip("/").split("/")[-2:])
+
+
+def classify(stage):
+    """Map a runtime stage to running, sleeping or error"""
+    return STAGE_STATES.get(stage, "error")
+
+
+def fetch_stage(demo_url, api_url=HF_API_URL, timeout=10):
+    """Return the Space's runtime stage from the Hub API, or None when it cannot be reached"""
+    try:
+        response = get_client().get(f"{api_url}/{space_id(demo_url)}/runtime", deadline=timeout)
+        if response.status_code == 404:
+            return "NO_APP_FILE"
+        response.raise_for_status()
+        return response.json().get("stage")
+    except (requests.RequestException, ValueError):
+        return None
+
+
+class SpaceStatusMonitor:
+    """Polls Space runtimes on a daemon thread; renders read the cached statuses without network I/O"""
+
+    def __init__(self, demo_urls, interval=POLL_INTERVAL_SECONDS, api_url=HF_API_URL, timeout=10):
+        self.demo_urls = list(dict.fromkeys(demo_urls))
+        self.interval = interval
+        self.api_url = api_url
+        self.timeout = timeout
+        self._results = {}
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._worker = None
+
+    def watch(self, demo_urls):
+        """Add Spaces to poll, e.g. a tenant's loaded after startup; return the new ones, which are polled now"""
+        with self._lock:
+            new = [demo_url for demo_url in dict.fromkeys(demo_urls) if demo_url not in self.demo_urls]
+            self.demo_urls = self.demo_urls + new
+        if new:
+            self._wake.set()
+        return new
+
+    def status(self, demo_url):
+        """Return the last polled status for a Space, or None before its first check"""
+        with self._lock:
+            return self._results.get(demo_url)
+
+    def unchecked(self):
+        """Watched Spaces without a status yet"""
+        with self._lock:
+            return [demo_url for demo_url in self.demo_urls if demo_url not in self._results]
+
+    def refresh(self, demo_urls=None):
+        """Poll the given Spaces (default: every watched one) once and update the cache"""
+        for demo_url in self.demo_urls if demo_urls is None else demo_urls:
+            stage = fetch_stage(demo_url, self.api_url, self.timeout)
+            if stage is None:
+                # Keep the previous answer when the Hub is unreachable rather than flagging an error
+                continue
+            with self._lock:
+                self._results[demo_url] = {"stage": stage, "state": classify(stage), "checked_at": time.time()}
+
+    def run(self):
+        """Poll every Space each interval, and newly watched ones as soon as they are added, until stopped"""
+        next_poll = 0.0
+        while not self._stop.is_set():
+            if time.monotonic() >= next_poll:
+                self.refresh()
+                next_poll = time.monotonic() + self.interval
+            else:
+                self.refresh(self.unchecked())
+            self._wake.wait(max(0.0, next_poll - time.monotonic()))
+            self._wake.clear()
+
+    def start(self):
+        """Start the polling thread unless it is already running"""
+        with self._lock:
+            if self._worker is not None and self._worker.is_alive():
+                return False
+            self._stop.clear()
+            self._worker = threading.Thread(target=self.run, name="space-status-monitor", daemon=True)
+            self._worker.start()
+        return True
+
+    def stop(self):
+        """Ask the polling thread to exit after its current pass"""
+        self._stop.set()
+        self._wake.set()
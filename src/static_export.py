@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Export the portfolio to a static, precompressed HTML/CSS/asset bundle
+
+Usage: python src/static_export.py --out dist
+"""
+
+import argparse
+import json
+import shutil
+import sys
+from pathlib import Path
+
+from content import (PROFILE, SECTION_HEADERS, SKILL_GROUPS, SKILL_LEVELS, PROJECTS, SHOWCASE,
+                     EXPERIENCE, COURSES, CONTACTS, content_version)
+from templates import (hero_title, hero_tagline, hero_intro, about_card, section_header,
+                       showcase_heading, showcase_points, skill_card, project_card, experience_card,
+                       course_card, figure, skill_meter, contact_card, resume_card)
+from asset_pipeline import STYLESHEET_KEY, brotli, build_assets, content_hash, precompress_file, write_hashed
+from resume import load_resume
+
+DIVIDER = '<div class="cyber-divider"></div>'
+# Written into every export; only a directory holding it is ever cleared for a new export
+EXPORT_MARKER = ".portfolio-export"
+
+SERVICE_WORKER = """\
+const CACHE = "portfolio-%(version)s";
+const SHELL = %(shell)s;
+
+self.addEventListener("install", (event) => {
+    event.waitUntil(caches.open(CACHE).then((cache) => cache.addAll(SHELL)));
+    self.skipWaiting();
+});
+
+self.addEventListener("activate", (event) => {
+    event.waitUntil(caches.keys().then((keys) =>
+        Promise.all(keys.filter((key) => key !== CACHE).map((key) => caches.delete(key)))));
+    self.clients.claim();
+});
+
+self.addEventListener("fetch", (event) => {
+    const url = new URL(event.request.url);
+    if (event.request.method !== "GET" || url.origin !== location.origin) {
+        return;
+    }
+    // Hashed assets never change, so serve them cache-first; the page itself is network-first
+    if (url.pathname.includes("/assets/")) {
+        event.respondWith(caches.match(event.request).then((hit) => hit || fetch(event.request)));
+    } else {
+        event.respondWith(fetch(event.request)
+            .then((response) => {
+                const copy = response.clone();
+                caches.open(CACHE).then((cache) => cache.put(event.request, copy));
+                return response;
+            })
+            .catch(() => caches.match(event.request).then((hit) => hit || caches.match("./"))));
+    }
+});
+"""
+
+
+def columns(cells):
+    """Lay out rendered cells in a responsive grid"""
+    return '<div class="static-columns">' + "".join(f"<div>{cell}</div>" for cell in cells) + "</div>"
+
+
+def column_groups(items, count):
+    """Group items by their 'column' field into count columns"""
+    groups = [[] for _ in range(count)]
+    for item in items:
+        groups[item["column"]].append(item)
+    return groups
+
+
+def resume_section(resume_url):
+    """Render the parsed resume with a link to the downloadable original"""
+    resume = load_resume()
+    if resume is None:
+        return ""
+    return "\n".join([
+        section_header(SECTION_HEADERS["resume"]),
+        f'<p><a href="{resume_url}" download="{resume["filename"]}">📥 Download Resume</a></p>',
+        columns(["".join(resume_card(section) for section in resume["sections"][column::2])
+                 for column in range(2)]),
+        DIVIDER,
+    ])
+
+
+def render_body(image_urls, placeholders, resume_url=None):
+    """Render the same sections src/streamlit_app.py shows, as plain HTML"""
+    courses = [course for course in COURSES if not course.get("featured")]
+    featured_courses = [course for course in COURSES if course.get("featured")]
+
+    sections = [
+        hero_title(PROFILE),
+        hero_tagline(PROFILE),
+        hero_intro(PROFILE),
+        DIVIDER,
+        columns([
+            '<div class="text-center"><div class="photo-frame-static">'
+            + figure(image_urls[PROFILE["photo"]], PROFILE["name"], width=300,
+                     placeholder=placeholders.get(PROFILE["photo"]))
+            + "</div></div>",
+            about_card(PROFILE),
+        ]),
+        DIVIDER,
+        section_header(SECTION_HEADERS["skills"]),
+        columns([skill_card(group) for group in SKILL_GROUPS]),
+        "<h3><span class='c-accent'>📊</span> Skill Proficiency</h3>",
+        columns(["".join(skill_meter(skill) for skill in group)
+                 for group in column_groups(SKILL_LEVELS, 4)]),
+        DIVIDER,
+        section_header(SECTION_HEADERS["projects"]),
+        columns([project_card(project) for project in PROJECTS]),
+        DIVIDER,
+        section_header(SECTION_HEADERS["showcase"]),
+        columns([showcase_heading(item)
+                 + figure(image_urls[item["image"]], item["caption"], placeholder=placeholders.get(item["image"]))
+                 + showcase_points(item) for item in SHOWCASE]),
+        DIVIDER,
+        section_header(SECTION_HEADERS["experience"]),
+        columns(["".join(experience_card(job) for job in group)
+                 for group in column_groups(EXPERIENCE, 2)]),
+        DIVIDER,
+        section_header(SECTION_HEADERS["courses"]),
+        columns(["".join(course_card(course) for course in group)
+                 for group in column_groups(courses, 2)]),
+        "".join(course_card(course) for course in featured_courses),
+        DIVIDER,
+        resume_section(resume_url),
+        section_header(SECTION_HEADERS["contact"]),
+        columns([contact_card(contact) for contact in CONTACTS]),
+    ]
+    return "\n".join(sections)
+
+
+def render_page(css_url, image_urls, placeholders, resume_url=None, extra_body="", title=None, description=None,
+                extra_head=""):
+    """Render the complete static HTML document; extra_head and extra_body are appended inside <head> and <body>"""
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{title or PROFILE['page_title']}</title>
+<meta name="description" content="{description or PROFILE['about']}">
+{extra_head}
+<link rel="stylesheet" href="{css_url}">
+</head>
+<body class="main">
+<div class="grid-overlay"></div>
+<main class="static-page">
+{render_body(image_urls, placeholders, resume_url)}
+</main>
+<script>
+if ("serviceWorker" in navigator) {{
+    navigator.serviceWorker.register("sw.js");
+}}
+</script>
+{extra_body}
+</body>
+</html>
+"""
+
+
+def clear_export(out_dir):
+    """Remove a previous export, refusing to delete a non-empty directory no export wrote"""
+    if not out_dir.exists():
+        return
+    if not out_dir.is_dir() or (any(out_dir.iterdir()) and not (out_dir / EXPORT_MARKER).is_file()):
+        raise ValueError(f"Refusing to replace {out_dir}: it is not empty and holds no previous export")
+    shutil.rmtree(out_dir)
+
+
+def export_site(out_dir, extra_body=""):
+    """Render the portfolio into out_dir and return the bundle manifest"""
+    out_dir = Path(out_dir)
+    clear_export(out_dir)
+    out_dir.mkdir(parents=True)
+    (out_dir / EXPORT_MARKER).write_text("Written by src/static_export.py; replaced on the next export\n",
+                                         encoding="utf-8")
+
+    asset_manifest = build_assets(out_dir / "assets")
+    asset_urls = {key: f"assets/{name}" for key, name in asset_manifest["files"].items()}
+    css_url = asset_urls.pop(STYLESHEET_KEY)
+    image_urls = asset_urls
+
+    resume = load_resume()
+    resume_url = None
+    if resume:
+        resume_url = "assets/" + write_hashed(resume["data"], Path(resume["filename"]).stem, ".docx",
+                                              out_dir / "assets")
+
+    page = render_page(css_url, image_urls, asset_manifest.get("images", {}), resume_url,
+                       extra_body)
+    (out_dir / "index.html").write_text(page, encoding="utf-8")
+
+    shell = ["./", css_url] + list(image_urls.values())
+    version = content_hash(page.encode("utf-8"))
+    (out_dir / "sw.js").write_text(SERVICE_WORKER % {"version": version, "shell": json.dumps(shell)},
+                                   encoding="utf-8")
+
+    manifest = {"version": version, "content_version": content_version(), "css": css_url, "images": image_urls, "resume": resume_url, "shell": shell}
+    (out_dir / "manifest.json").write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+
+    # Page-level files are compressed here; build_assets already compressed the assets
+    for name in ("index.html", "sw.js", "manifest.json"):
+        precompress_file(out_dir / name)
+    return manifest
+
+
+def main():
+    """Export the site"""
+    parser = argparse.ArgumentParser(description="Export the portfolio as a static site")
+    parser.add_argument("--out", default="dist", help="output directory (default: dist)")
+    args = parser.parse_args()
+
+    try:
+        manifest = export_site(args.out)
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    print(f"✅ Exported portfolio to {args.out} (version {manifest['version']})")
+    if brotli is None:
+        print("ℹ️  brotli not installed; wrote gzip variants only")
+
+
+if __name__ == "__main__":
+    main()
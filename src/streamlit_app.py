@@ -1,13 +1,48 @@
 import streamlit as st
+import streamlit.components.v1 as components
 import pandas as pd
-import numpy as np
 import requests
 import json
+import functools
+import hmac
 import os
-import sys
+import time
+import uuid
 from datetime import datetime
 from pathlib import Path
 
+from content import BUNDLE_KEYS, space_embed_url, outbound_links
+from templates import (stylesheet, hero_title, hero_tagline, hero_intro, about_card, section_header,
+                       showcase_heading, showcase_points, skill_card, project_card, experience_card,
+                       course_card, search_result, demo_preview, figure, resume_card, certificate_tile,
+                       certificate_gallery, activity_heatmap, language_breakdown)
+from link_health import LinkHealthChecker
+from http_client import get_client
+from asset_pipeline import (REPO_ROOT, STYLESHEET_KEY, THUMBNAIL_CACHE_DIR, THUMBNAIL_INDEX_PATH,
+                            VARIANT_CACHE_DIR, load_manifest, minify_css)
+from image_service import ResizeService
+from certificate_thumbnails import ThumbnailWorker
+from resume import RESUME_MIME, load_resume
+from space_status import HF_API_URL, SpaceStatusMonitor
+from analytics import get_recorder, load_events, summarize
+from contact_queue import enqueue, validate, worker_from_env
+from tenants import DEFAULT_TENANT, BoundedCache, TenantRegistry, tenant_id_from, theme_css
+from hot_reload import RELOAD_INTERVAL_SECONDS, ContentWatcher
+from diagnostics import RerunStats, active_session_count, hit_rate, process_rss_mb, streamlit_cache_stats
+from admission import get_monitor
+from crawlers import get_snapshots
+from github_activity import (FETCH_INTERVAL_SECONDS, GITHUB_API_URL, HEATMAP_WEEKS, SECONDS_PER_DAY, ActivityFetcher, ActivityStore,
+                             github_user)
+from sessions import MAX_SESSIONS, REAP_INTERVAL_SECONDS, SESSION_IDLE_SECONDS, SessionTracker
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+# Rerun wall time is measured from here to the end of the visited page, for the diagnostics page
+RERUN_STARTED = time.perf_counter()
+
+# PORTFOLIO_BACKGROUND_WORKERS=0 starts no pollers or fetchers (content watcher, link checks, Space status,
+# certificate thumbnails, GitHub events), so tests and offline runs never reach remote services
+BACKGROUND_WORKERS = os.environ.get("PORTFOLIO_BACKGROUND_WORKERS", "1") != "0"
+
 # Error handling and logging setup
 def handle_error(error, context="Application"):
     """Centralized error handling function"""
@@ -15,9 +50,122 @@ def handle_error(error, context="Application"):
     st.error(f"⚠️ {error_msg}")
     return None
 
-def safe_load_image(image_path, caption="", width=None):
-    """Safely load images with comprehensive error handling for Hugging Face Spaces"""
+# Multi-tenant mode: ?tenant=<id> selects a bundle from tenants/<id>/; shared code, per-tenant caches
+@st.cache_resource
+def get_tenant_registry():
+    """One registry of loaded tenants per process, with a watcher that hot-reloads changed content"""
+    registry = TenantRegistry()
+    if BACKGROUND_WORKERS:
+        ContentWatcher(registry, interval=float(os.environ.get("PORTFOLIO_RELOAD_INTERVAL", RELOAD_INTERVAL_SECONDS))).start()
+    return registry
+
+tenant_registry = get_tenant_registry()
+# Page navigation clears query parameters, so the tenant is remembered for the session and put back
+if "tenant" in st.query_params or "tenant_id" not in st.session_state:
+    st.session_state["tenant_id"] = tenant_id_from(st.query_params)
+tenant = tenant_registry.get(st.session_state["tenant_id"]) or tenant_registry.get(DEFAULT_TENANT)
+TENANT_ID = tenant["id"]
+if TENANT_ID != DEFAULT_TENANT and st.query_params.get("tenant") != TENANT_ID:
+    st.query_params["tenant"] = TENANT_ID
+IS_DEFAULT_TENANT = TENANT_ID == DEFAULT_TENANT
+# Read together, so every section of this rerun renders the content its version names
+with tenant["cache"].lock:
+    BUNDLE, CONTENT_VERSION = tenant["bundle"], tenant["version"]
+(PROFILE, SECTION_HEADERS, SKILL_GROUPS, SKILL_LEVELS, PROJECTS, SHOWCASE,
+ EXPERIENCE, COURSES, CONTACTS) = (BUNDLE[key] for key in BUNDLE_KEYS)
+
+def cached_html(key, records, render, *args):
+    """Render a static section once per tenant; a change to any of its records drops it from the cache"""
+    tenant["graph"].add(f"html:{key}", records)
+    # A rerun that started before a hot reload renders old content, which must not outlive the reload
+    return tenant["cache"].get_or_set(f"html:{key}", lambda: render(*args),
+                                      is_current=lambda: tenant["version"] == CONTENT_VERSION)
+
+# Hashed, precompressed assets are served by the companion asset server when one is configured
+ASSET_BASE_URL = os.environ.get("PORTFOLIO_ASSET_URL", "").rstrip("/")
+
+@st.cache_resource
+def get_asset_manifest():
+    """Load the built asset manifest once per process"""
+    return load_manifest() if ASSET_BASE_URL else None
+
+def asset_url(asset_key):
+    """Return the immutable URL for a built asset, or None to fall back to Streamlit media"""
+    manifest = get_asset_manifest()
+    if not manifest or asset_key not in manifest["files"]:
+        return None
+    return f"{ASSET_BASE_URL}/assets/{manifest['files'][asset_key]}"
+
+def image_placeholder(image_path):
+    """Return the build-time placeholder (size, color, blurred data URI) for an image, if any"""
+    manifest = get_asset_manifest()
+    if not manifest:
+        return None
+    return manifest.get("images", {}).get(image_path)
+
+# Images are requested at twice their CSS width so they stay sharp on high-density screens
+PIXEL_DENSITY = 2
+# CSS width of a showcase image in its half-page column of the wide layout
+SHOWCASE_IMAGE_WIDTH = 560
+# How often an image shown at full size checks whether its resized variant is ready
+RESIZE_POLL_SECONDS = 2
+
+@st.cache_resource
+def get_resize_service():
+    """One resize worker pool and variant cache per process"""
+    max_bytes = int(os.environ.get("PORTFOLIO_VARIANT_CACHE_MB", "64")) * 1024 * 1024
+    return ResizeService(VARIANT_CACHE_DIR, max_bytes=max_bytes)
+
+def variant_url(image_path, width):
+    """Return the URL of a prebuilt or cached variant; None when the original is no wider or a resize is queued"""
+    manifest = get_asset_manifest()
+    if not manifest or image_path not in manifest.get("images", {}):
+        return None
+    if width >= manifest["images"][image_path]["width"]:
+        return None
+
+    prebuilt = manifest.get("variants", {}).get(image_path, {}).get(str(width))
+    if prebuilt:
+        return f"{ASSET_BASE_URL}/assets/{prebuilt}"
+
+    # Never waits: a miss is resized in the background and the original is shown meanwhile
+    try:
+        path = get_resize_service().get(REPO_ROOT / image_path, width, timeout=0)
+    except Exception:
+        return None
+    return f"{ASSET_BASE_URL}/assets/{path.name}" if path else None
+
+@st.fragment(run_every=RESIZE_POLL_SECONDS)
+def await_variant(image_path, caption, width, variant_width):
+    """Show the original image while its variant is resized, then rerun the page once to swap the variant in"""
+    if not get_resize_service().pending(REPO_ROOT / image_path, variant_width):
+        # The full rerun renders the variant and, without a pending resize, stops this polling
+        st.rerun()
+    st.markdown(figure(asset_url(image_path), caption, width, placeholder=image_placeholder(image_path)),
+                unsafe_allow_html=True)
+
+def safe_load_image(image_path, caption="", width=None, display_width=None):
+    """Safely load images with comprehensive error handling for Hugging Face Spaces
+
+    display_width is the CSS width a stretched image is expected to fill, used to pick its variant.
+    """
     try:
+        # Images edited since the assets were built are served from disk until the next build
+        hashed_url = asset_url(image_path) if image_path not in tenant["stale_images"] else None
+        css_width = width if isinstance(width, int) else display_width
+        if hashed_url and css_width:
+            variant_width = PIXEL_DENSITY * css_width
+            variant = variant_url(image_path, variant_width)
+            if variant is None and get_resize_service().pending(REPO_ROOT / image_path, variant_width):
+                await_variant(image_path, caption, width if isinstance(width, int) else None, variant_width)
+                return True
+            hashed_url = variant or hashed_url
+        if hashed_url:
+            st.markdown(figure(hashed_url, caption, width if isinstance(width, int) else None,
+                               placeholder=image_placeholder(image_path)),
+                        unsafe_allow_html=True)
+            return True
+
         # Check multiple possible paths for Hugging Face Spaces
         possible_paths = [
             image_path,
@@ -37,10 +185,12 @@ def safe_load_image(image_path, caption="", width=None):
             # Don't show error in HF Spaces, just skip
             return False
             
+        tenant["graph"].add(f"asset:{working_path}", [f"file:{image_path}"])
+        image_bytes = tenant["cache"].get_or_set(f"asset:{working_path}", Path(working_path).read_bytes)
         if width and isinstance(width, int):
-            st.image(working_path, caption=caption, width=width)
+            st.image(image_bytes, caption=caption, width=width)
         else:
-            st.image(working_path, caption=caption, width="stretch")
+            st.image(image_bytes, caption=caption, width="stretch")
         return True
         
     except Exception as e:
@@ -59,8 +209,8 @@ except Exception as e:
 # Page configuration with Hugging Face Spaces compatibility
 try:
     st.set_page_config(
-        page_title="Bhumika Patel | Software Developer & Data Analyst",
-        page_icon="👩‍💻",
+        page_title=PROFILE["page_title"],
+        page_icon=PROFILE["page_icon"],
         layout="wide",
         initial_sidebar_state="collapsed"
     )
@@ -68,13 +218,26 @@ except Exception as e:
     # Silently handle config errors in Hugging Face Spaces
     pass
 
+# Lottie JSON is cached per process, bounded by size like the tenant caches
+LOTTIE_CACHE_BYTES = 2 * 1024 * 1024
+
+@st.cache_resource
+def get_lottie_cache():
+    """Process-wide cache of downloaded Lottie animations"""
+    return BoundedCache(LOTTIE_CACHE_BYTES)
+
 # Safe Lottie animation loader
 def load_lottie_url(url: str):
     """Safely load Lottie animation with comprehensive error handling"""
     try:
-        r = requests.get(url, timeout=10)
+        cached = get_lottie_cache().get(url)
+        if cached is not None:
+            return json.loads(cached)
+        r = get_client().get(url, deadline=10)
         if r.status_code == 200:
-            return r.json()
+            animation = r.json()
+            get_lottie_cache().put(url, r.text)
+            return animation
         else:
             return None
     except requests.RequestException as e:
@@ -87,6 +250,172 @@ def load_lottie_url(url: str):
         handle_error(e, "Lottie Animation")
         return None
 
+# Analytics events only enqueue here; a writer thread batches them into SQLite
+analytics = get_recorder()
+if "analytics_session" not in st.session_state:
+    st.session_state["analytics_session"] = uuid.uuid4().hex
+    analytics.record("view", TENANT_ID, st.session_state["analytics_session"])
+
+def track(kind, target):
+    """Record a visitor event for the current session without touching disk"""
+    analytics.record(kind, target, st.session_state.get("analytics_session", ""))
+
+# Rerun and section timings are shared by every session, for the diagnostics page
+@st.cache_resource
+def get_rerun_stats():
+    """Process-wide record of recent reruns"""
+    return RerunStats()
+
+rerun_stats = get_rerun_stats()
+
+def timed_section(name):
+    """Decorator recording how long a page or fragment takes to render"""
+    def decorate(render):
+        @functools.wraps(render)
+        def timed(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return render(*args, **kwargs)
+            finally:
+                rerun_stats.section(name, time.perf_counter() - started)
+        return timed
+    return decorate
+
+def marks_activity(render):
+    """Decorator keeping a session active while the visitor only reruns one of its fragments"""
+    @functools.wraps(render)
+    def active(*args, **kwargs):
+        context = get_script_run_ctx()
+        # Full runs are counted at the end of the script, which a fragment rerun never reaches
+        if context is not None and context.fragment_ids_this_run:
+            session_tracker.touch(SESSION_ID)
+        return render(*args, **kwargs)
+    return active
+
+def tracked_url(kind, item_id, url):
+    """Route an outbound link through the asset server's click counter when it is available"""
+    # The redirect only knows the built-in portfolio's links
+    return f"{ASSET_BASE_URL}/go/{kind}/{item_id}" if ASSET_BASE_URL and IS_DEFAULT_TENANT else url
+
+@st.fragment
+@marks_activity
+@timed_section("search")
+def render_search():
+    """Search box that reruns only this fragment while the visitor types"""
+    query = st.text_input("🔎 Search the portfolio",
+                          placeholder="Try YOLO, fraud or SQL",
+                          key="portfolio_search")
+    if not query:
+        return
+
+    track("search", query.strip().lower()[:64])
+    # Each tenant's index is shared by its sessions and updated in place when content changes
+    hits = tenant_registry.search_index(tenant).search(query)
+    if not hits:
+        st.markdown("<p class='c-muted'>No matches found.</p>", unsafe_allow_html=True)
+        return
+
+    for hit in hits:
+        st.markdown(search_result(hit), unsafe_allow_html=True)
+
+# Link health results are shared across sessions; checks run off the script thread
+@st.cache_resource
+def get_link_checker():
+    """Create the process-wide outbound link health checker"""
+    return LinkHealthChecker()
+
+link_checker = get_link_checker()
+if BACKGROUND_WORKERS:
+    link_checker.refresh_in_background(outbound_links(BUNDLE))
+
+# Space runtime badges are polled on a schedule by one thread per process, for every tenant served
+@st.cache_resource
+def get_space_monitor():
+    """Create and start the process-wide Hugging Face Space status poller"""
+    monitor = SpaceStatusMonitor([], api_url=os.environ.get("PORTFOLIO_HF_API_URL", HF_API_URL))
+    if BACKGROUND_WORKERS:
+        monitor.start()
+    return monitor
+
+space_monitor = get_space_monitor()
+space_monitor.watch([project["demo_url"] for project in PROJECTS])
+
+@st.fragment
+@marks_activity
+@timed_section("project grid")
+def render_project_grid():
+    """Project grid with a tech tag filter that reruns only this fragment"""
+    # Tag bitmaps are precomputed once per tenant and shared by every session
+    tag_index = tenant_registry.tag_index(tenant)
+
+    filter_col, mode_col = st.columns([3, 1])
+    with filter_col:
+        selected_tags = st.multiselect("🏷️ Filter by technology", tag_index.tags,
+                                       key="tag_filter")
+    with mode_col:
+        match_mode = st.radio("Match", ["Any tag", "All tags"], horizontal=True,
+                              key="tag_match_mode")
+
+    if not selected_tags:
+        cards = [("project", project) for project in PROJECTS]
+    else:
+        cards = tag_index.filter(selected_tags, match_all=match_mode == "All tags")
+
+    if not cards:
+        st.markdown("<p class='c-muted'>No projects or certificates carry all of these tags.</p>",
+                    unsafe_allow_html=True)
+        return
+
+    grid_cols = st.columns(3, gap="medium")
+    for position, (kind, card) in enumerate(cards):
+        with grid_cols[position % 3]:
+            if kind == "project":
+                st.markdown(project_card(card, broken=link_checker.is_broken(card["demo_url"]),
+                                         status=space_monitor.status(card["demo_url"]),
+                                         href=tracked_url("project", card["id"], card["demo_url"])),
+                            unsafe_allow_html=True)
+            else:
+                st.markdown(course_card(card, broken=link_checker.is_broken(card["certificate_url"]),
+                                        href=tracked_url("certificate", card["id"], card["certificate_url"])),
+                            unsafe_allow_html=True)
+
+def set_active_demo(project_id):
+    """Make one Space the only live embed; any other embed is dropped on the next render"""
+    st.session_state["active_demo"] = project_id
+    if project_id:
+        track("demo", project_id)
+
+@st.fragment
+@marks_activity
+@timed_section("live demos")
+def render_live_demos():
+    """Static previews that instantiate at most one Hugging Face Space iframe on demand"""
+    active_demo = st.session_state.get("active_demo")
+
+    if not PROJECTS:
+        return
+
+    demo_cols = st.columns(len(PROJECTS), gap="medium")
+    for demo_col, project in zip(demo_cols, PROJECTS):
+        with demo_col:
+            is_active = project["id"] == active_demo
+            st.markdown(demo_preview(project, active=is_active), unsafe_allow_html=True)
+            if is_active:
+                st.button("⏹ Close demo", key=f"close_demo_{project['id']}",
+                          on_click=set_active_demo, args=(None,), width="stretch")
+            else:
+                st.button("▶ Load live demo", key=f"load_demo_{project['id']}",
+                          on_click=set_active_demo, args=(project["id"],), width="stretch")
+
+    for project in PROJECTS:
+        if project["id"] == active_demo:
+            embed_url = space_embed_url(project["demo_url"])
+            # st.iframe replaces components.iframe on newer Streamlit releases
+            if hasattr(st, "iframe"):
+                st.iframe(embed_url, height=720)
+            else:
+                components.iframe(embed_url, height=720, scrolling=True)
+
 # Advanced fallback animation
 fallback_animation = {
     "v": "5.5.9",
@@ -135,995 +464,512 @@ fallback_animation = {
     }]
 }
 
-# Ultra-Modern CSS with Advanced Animations
-st.markdown("""
-<style>
-    @import url('https://fonts.googleapis.com/css2?family=Space+Grotesk:wght@300;400;500;600;700&family=JetBrains+Mono:wght@400;600&display=swap');
-    
-    * {
-        font-family: 'Space Grotesk', sans-serif;
-        margin: 0;
-        padding: 0;
-        box-sizing: border-box;
-    }
-    
-    /* Advanced Animated Mesh Background */
-    .main {
-        background: #0a0a0f;
-        position: relative;
-        overflow-x: hidden;
-    }
-    
-    .main::before {
-        content: '';
-        position: fixed;
-        top: 0;
-        left: 0;
-        width: 100%;
-        height: 100%;
-        background: 
-            radial-gradient(circle at 20% 50%, rgba(120, 119, 198, 0.2) 0%, transparent 50%),
-            radial-gradient(circle at 80% 80%, rgba(138, 43, 226, 0.2) 0%, transparent 50%),
-            radial-gradient(circle at 40% 20%, rgba(0, 191, 255, 0.1) 0%, transparent 50%);
-        pointer-events: none;
-        z-index: 0;
-    }
-    
-    /* Static Grid Lines */
-    .grid-overlay {
-        position: fixed;
-        top: 0;
-        left: 0;
-        width: 100%;
-        height: 100%;
-        background-image: 
-            linear-gradient(rgba(100, 255, 218, 0.02) 1px, transparent 1px),
-            linear-gradient(90deg, rgba(100, 255, 218, 0.02) 1px, transparent 1px);
-        background-size: 50px 50px;
-        pointer-events: none;
-        z-index: 0;
-    }
-    
-    /* Name Loading Animation - Stable */
-    @keyframes nameReveal {
-        0% {
-            opacity: 0;
-            transform: translateY(20px);
-        }
-        100% {
-            opacity: 1;
-            transform: translateY(0);
-        }
-    }
-    
-    /* Holographic Text Effect - Smooth Gradient */
-    .holographic-text {
-        background: linear-gradient(45deg, #667eea 0%, #764ba2 50%, #f093fb 100%);
-        background-size: 200% 200%;
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        background-clip: text;
-        filter: drop-shadow(0 0 10px rgba(102, 126, 234, 0.3));
-        animation: smoothGradient 6s ease-in-out infinite;
-    }
-    
-    @keyframes smoothGradient {
-        0%, 100% { background-position: 0% 50%; }
-        50% { background-position: 100% 50%; }
-    }
-    
-    /* Cyber Hero Header - Stable */
-    .cyber-hero {
-        font-size: clamp(3rem, 8vw, 6rem);
-        font-weight: 800;
-        text-align: center;
-        margin: 0;
-        position: relative;
-        animation: nameReveal 1s ease-out forwards;
-        opacity: 0;
-    }
-    
-    /* Neon Subtitle - Gentle Glow */
-    .neon-subtitle {
-        font-size: clamp(1.2rem, 3vw, 2rem);
-        text-align: center;
-        color: #64ffda;
-        text-shadow: 0 0 10px rgba(100, 255, 218, 0.5);
-        font-family: 'JetBrains Mono', monospace;
-        letter-spacing: 0.1em;
-        animation: gentleGlow 4s ease-in-out infinite;
-    }
-    
-    @keyframes gentleGlow {
-        0%, 100% { text-shadow: 0 0 10px rgba(100, 255, 218, 0.5); }
-        50% { text-shadow: 0 0 20px rgba(100, 255, 218, 0.7), 0 0 30px rgba(100, 255, 218, 0.3); }
-    }
-    
-    /* 3D Section Headers - Static */
-    .section-3d {
-        font-size: clamp(2rem, 5vw, 3.5rem);
-        font-weight: 800;
-        margin: 60px 0 40px 0;
-        position: relative;
-        display: inline-block;
-    }
-    
-    .section-3d::after {
-        content: '';
-        position: absolute;
-        bottom: -10px;
-        left: 10%;
-        width: 80%;
-        height: 4px;
-        background: linear-gradient(90deg, #667eea, #764ba2, #f093fb);
-        border-radius: 2px;
-        box-shadow: 0 4px 15px rgba(102, 126, 234, 0.3);
-    }
-    
-    /* Glassmorphic Cards with 3D Transform */
-    .glass-card {
-        background: rgba(255, 255, 255, 0.03);
-        backdrop-filter: blur(20px) saturate(180%);
-        border-radius: 20px;
-        padding: 35px;
-        margin: 25px 0;
-        border: 1px solid rgba(255, 255, 255, 0.08);
-        box-shadow: 
-            0 8px 32px 0 rgba(31, 38, 135, 0.37),
-            inset 0 1px 0 0 rgba(255, 255, 255, 0.1);
-        transition: all 0.5s cubic-bezier(0.23, 1, 0.320, 1);
-        position: relative;
-        overflow: hidden;
-        transform-style: preserve-3d;
-    }
-    
-    .glass-card::before {
-        content: '';
-        position: absolute;
-        top: -50%;
-        left: -50%;
-        width: 200%;
-        height: 200%;
-        background: linear-gradient(45deg, 
-            transparent 30%, 
-            rgba(100, 255, 218, 0.1) 50%, 
-            transparent 70%);
-        transform: rotate(45deg);
-        transition: 0.6s;
-    }
-    
-    .glass-card:hover {
-        transform: translateY(-8px) scale(1.01);
-        border-color: rgba(100, 255, 218, 0.4);
-        box-shadow: 
-            0 15px 40px rgba(100, 255, 218, 0.2),
-            0 0 30px rgba(102, 126, 234, 0.15),
-            inset 0 1px 0 0 rgba(255, 255, 255, 0.15);
-        transition: all 0.4s cubic-bezier(0.23, 1, 0.320, 1);
-    }
-    
-    .glass-card:hover::before {
-        left: 150%;
-    }
-    
-    /* Magnetic Hover Effect for Project Cards */
-    .project-magnetic {
-        background: rgba(255, 255, 255, 0.04);
-        backdrop-filter: blur(15px);
-        border-radius: 25px;
-        padding: 40px;
-        margin: 30px 0;
-        border: 1px solid rgba(255, 255, 255, 0.1);
-        transition: all 0.4s cubic-bezier(0.23, 1, 0.320, 1);
-        position: relative;
-        overflow: hidden;
-        cursor: pointer;
-    }
-    
-    .project-magnetic::after {
-        content: '';
-        position: absolute;
-        top: 50%;
-        left: 50%;
-        width: 0;
-        height: 0;
-        border-radius: 50%;
-        background: radial-gradient(circle, rgba(102, 126, 234, 0.2) 0%, transparent 70%);
-        transform: translate(-50%, -50%);
-        transition: width 0.6s, height 0.6s;
-    }
-    
-    .project-magnetic:hover::after {
-        width: 500px;
-        height: 500px;
-    }
-    
-    .project-magnetic {
-        animation: gentleFloat 8s ease-in-out infinite;
-    }
-    
-    .project-magnetic:hover {
-        transform: translateY(-12px) scale(1.02);
-        border-color: rgba(102, 126, 234, 0.5);
-        box-shadow: 
-            0 20px 50px rgba(102, 126, 234, 0.25),
-            0 0 40px rgba(138, 43, 226, 0.2);
-        transition: all 0.4s cubic-bezier(0.23, 1, 0.320, 1);
-    }
-    
-    @keyframes gentleFloat {
-        0%, 100% { transform: translateY(0px); }
-        50% { transform: translateY(-5px); }
-    }
-    
-    /* Animated Tech Tags */
-    .tech-bubble {
-        background: linear-gradient(135deg, rgba(102, 126, 234, 0.8), rgba(118, 75, 162, 0.8));
-        color: white;
-        padding: 8px 18px;
-        border-radius: 25px;
-        font-size: 0.85rem;
-        margin: 6px 6px 6px 0;
-        display: inline-block;
-        font-weight: 600;
-        position: relative;
-        overflow: hidden;
-        transition: all 0.3s cubic-bezier(0.68, -0.55, 0.265, 1.55);
-        box-shadow: 0 4px 15px rgba(102, 126, 234, 0.3);
-    }
-    
-    .tech-bubble::before {
-        content: '';
-        position: absolute;
-        top: 50%;
-        left: 50%;
-        width: 0;
-        height: 0;
-        background: rgba(255, 255, 255, 0.3);
-        border-radius: 50%;
-        transform: translate(-50%, -50%);
-        transition: width 0.4s, height 0.4s;
-    }
-    
-    .tech-bubble:hover {
-        transform: translateY(-5px) scale(1.15);
-        box-shadow: 0 8px 25px rgba(102, 126, 234, 0.5);
-    }
-    
-    .tech-bubble:hover::before {
-        width: 200px;
-        height: 200px;
-    }
-    
-    /* Skill Progress - Smooth Gradient */
-    .stProgress > div > div > div > div {
-        background: linear-gradient(90deg, #667eea, #764ba2, #f093fb) !important;
-        background-size: 200% 100%;
-        box-shadow: 0 2px 10px rgba(102, 126, 234, 0.3);
-        animation: smoothProgress 4s ease-in-out infinite;
-    }
-    
-    @keyframes smoothProgress {
-        0%, 100% { background-position: 0% 50%; }
-        50% { background-position: 100% 50%; }
-    }
-    
-    /* Contact Cards with Lift Effect */
-    .contact-lift {
-        background: rgba(255, 255, 255, 0.05);
-        backdrop-filter: blur(15px);
-        border-radius: 20px;
-        padding: 35px;
-        text-align: center;
-        border: 1px solid rgba(255, 255, 255, 0.1);
-        transition: all 0.4s cubic-bezier(0.175, 0.885, 0.32, 1.275);
-        position: relative;
-    }
-    
-    .contact-lift::before {
-        content: '';
-        position: absolute;
-        inset: 0;
-        border-radius: 20px;
-        padding: 2px;
-        background: linear-gradient(45deg, #667eea, #764ba2, #f093fb);
-        -webkit-mask: linear-gradient(#fff 0 0) content-box, linear-gradient(#fff 0 0);
-        -webkit-mask-composite: xor;
-        mask-composite: exclude;
-        opacity: 0;
-        transition: opacity 0.4s;
-    }
-    
-    .contact-lift:hover {
-        transform: translateY(-15px) scale(1.05);
-        box-shadow: 0 20px 50px rgba(100, 255, 218, 0.3);
-    }
-    
-    .contact-lift:hover::before {
-        opacity: 1;
-    }
-    
-    /* Experience Timeline Effect */
-    .timeline-card {
-        background: rgba(255, 255, 255, 0.04);
-        backdrop-filter: blur(12px);
-        border-radius: 20px;
-        padding: 30px;
-        margin: 20px 0;
-        border-left: 4px solid #64ffda;
-        transition: all 0.4s ease;
-        position: relative;
-    }
-    
-    .timeline-card::before {
-        content: '';
-        position: absolute;
-        left: -12px;
-        top: 50%;
-        transform: translateY(-50%);
-        width: 20px;
-        height: 20px;
-        background: #64ffda;
-        border-radius: 50%;
-        box-shadow: 0 0 15px rgba(100, 255, 218, 0.5);
-    }
-    
-    .timeline-card:hover {
-        transform: translateX(15px);
-        border-left-width: 6px;
-        box-shadow: 0 10px 40px rgba(100, 255, 218, 0.2);
-    }
-    
-    /* Smooth Separator */
-    .cyber-divider {
-        height: 2px;
-        background: linear-gradient(90deg, 
-            transparent 0%, 
-            rgba(100, 255, 218, 0.3) 25%, 
-            rgba(102, 126, 234, 0.6) 50%, 
-            rgba(100, 255, 218, 0.3) 75%, 
-            transparent 100%);
-        margin: 50px 0;
-        position: relative;
-        background-size: 300% 100%;
-        animation: smoothDivider 8s ease-in-out infinite;
-    }
-    
-    @keyframes smoothDivider {
-        0%, 100% { background-position: 0% 50%; }
-        50% { background-position: 100% 50%; }
-    }
-    
-    /* Custom Scrollbar */
-    ::-webkit-scrollbar {
-        width: 10px;
-    }
-    
-    ::-webkit-scrollbar-track {
-        background: rgba(255, 255, 255, 0.05);
-        border-radius: 10px;
-    }
-    
-    ::-webkit-scrollbar-thumb {
-        background: linear-gradient(180deg, #667eea, #764ba2);
-        border-radius: 10px;
-        box-shadow: 0 0 10px rgba(102, 126, 234, 0.5);
-    }
-    
-    ::-webkit-scrollbar-thumb:hover {
-        background: linear-gradient(180deg, #764ba2, #f093fb);
-    }
-    
-    /* Text Reveal Animation */
-    .reveal-text {
-        animation: revealUp 1s ease-out forwards;
-        opacity: 0;
-    }
-    
-    @keyframes revealUp {
-        from {
-            opacity: 0;
-            transform: translateY(30px);
-        }
-        to {
-            opacity: 1;
-            transform: translateY(0);
-        }
-    }
-    
-    /* Gentle Icon Glow */
-    .icon-glow {
-        margin-top: 40px;
-        transition: all 0.3s ease;
-        display: inline-block;
-        animation: iconBreath 6s ease-in-out infinite;
-    }
-    
-    .icon-glow:hover {
-        filter: drop-shadow(0 0 20px rgba(100, 255, 218, 0.6));
-        transform: scale(1.15);
-        animation-play-state: paused;
-    }
-    
-    @keyframes iconBreath {
-        0%, 100% { 
-            filter: drop-shadow(0 0 5px rgba(100, 255, 218, 0.3));
-            transform: scale(1);
-        }
-        50% { 
-            filter: drop-shadow(0 0 10px rgba(100, 255, 218, 0.5));
-            transform: scale(1.05);
-        }
-    }
-    
-    /* Hide Streamlit header and footer */
-    .stApp > header {
-        display: none;
-    }
-    
-    #MainMenu {
-        display: none;
-    }
-    
-    footer {
-        display: none;
-    }
-    
-    .stApp > footer {
-        display: none;
-    }
-</style>
+# Ultra-Modern CSS with Advanced Animations, shared with the static export
+@st.cache_resource
+def load_stylesheet():
+    """Read and minify the portfolio stylesheet once per process"""
+    return minify_css(stylesheet())
+
+stylesheet_url = asset_url(STYLESHEET_KEY)
+if stylesheet_url:
+    # The immutable stylesheet is fetched once per browser instead of resent on every rerun
+    st.markdown(f"""
+<style>@import url("{stylesheet_url}");</style>
 
 <div class="grid-overlay"></div>
 """, unsafe_allow_html=True)
+else:
+    st.markdown(f"""
+<style>
+{load_stylesheet()}
+</style>
 
-st.markdown("""
-    <style>
-    .main, .stApp {
-        background-color: #0A0A0A;
-    }
-    # h1, h2, h3 {
-    #     color: #00D4FF;
-    #     border-left: 4px solid #00D4FF;
-    #     padding-left: 10px;
-    # }
-    p, div {
-        color: #E0E0E0;
-    }
-    </style>
-    """, unsafe_allow_html=True)
-
-# Hero Section with Animated Name
-st.markdown('''
-    <h1 class="cyber-hero" data-text="BHUMIKA PATEL">
-        <span style="color: #fff;">BHUMIKA</span> 
-        <span class="holographic-text">PATEL</span>
-    </h1>
-''', unsafe_allow_html=True)
-
-st.markdown('<p class="neon-subtitle">Software Developer | Data Analyst | Problem Solver</p>', unsafe_allow_html=True)
-
-st.markdown("""
-<div class="reveal-text" style="text-align: center; margin: 40px 0; max-width: 700px; margin-left: auto; margin-right: auto;">
-    <p style="font-size: 1.3rem; color: #ccd6f6; line-height: 1.8; font-weight: 300;">
-    A dedicated software developer specializing in <span style="color: #64ffda; font-weight: 600;">data-driven solutions</span> and 
-    <span style="color: #667eea; font-weight: 600;">innovative applications</span>. Passionate about leveraging technology to solve 
-    complex problems and create impactful solutions that drive business growth and user engagement.
-    </p>
-</div>
+<div class="grid-overlay"></div>
 """, unsafe_allow_html=True)
 
-st.markdown('</div>', unsafe_allow_html=True)
-
-# Cyber Divider
-# Professional Photo Section
-st.markdown('<div class="cyber-divider"></div>', unsafe_allow_html=True)
-
-# Horizontal layout for photo and intro
-photo_col1, photo_col2 = st.columns([1, 2], gap="large")
-
-with photo_col1:
-    st.markdown("""
-    <style>
-    .photo-frame-static {
-        padding: 6px;
-        background: linear-gradient(45deg, #667eea, #764ba2, #f093fb);
-        border-radius: 15px;
-        display: inline-block;
-        box-shadow: 0 8px 25px rgba(100, 255, 218, 0.3);
-        margin: 20px 0;
-    }
-    </style>
-    <div style="text-align: center;">
-        <div class="photo-frame-static">
-    """, unsafe_allow_html=True)
-    
-    # Display the professional photo sideways with proper parameters
-    safe_load_image("src/assets/Bhumika_Photo.jfif", 
-                   caption="Bhumika Patel", 
-                   width=300)
-    
-    st.markdown("""
-        </div>
-    </div>
-    """, unsafe_allow_html=True)
-
-with photo_col2:
-    st.markdown("""
-    <div style="margin: 40px 0;">
-        <h2 style="color: #64ffda; margin-bottom: 20px; font-weight: 600; font-size: 2.2rem;">👩‍💻 Meet Bhumika Patel</h2>
-        <div style="padding: 25px; background: rgba(255, 255, 255, 0.05); border-radius: 15px; border-left: 4px solid #64ffda;">
-            <h3 style="color: #667eea; margin-bottom: 15px;">About Me</h3>
-            <p style="color: #ccd6f6; font-size: 1.1rem; line-height: 1.8; margin-bottom: 15px;">
-                A dedicated software developer and data analyst with expertise in AI/ML, hackathon winner, and technical leader passionate about creating innovative solutions.
-            </p>
-            <p style="color: #8892b0; font-size: 1rem; font-style: italic; margin-top: 20px;">
-                ✨ "Passionate about creating innovative solutions that make a difference"
-            </p>
-        </div>
-    </div>
-    """, unsafe_allow_html=True)
-
-st.markdown('<div class="cyber-divider"></div>', unsafe_allow_html=True)
-
-# Skills Section
-st.markdown('<h2 class="section-3d"><span style="color: #64ffda;">🛠</span> Technical Skills</h2>', unsafe_allow_html=True)
-
-col1, col2, col3 = st.columns(3, gap="large")
-
-with col1:
-    st.markdown("""
-    <div class="glass-card">
-        <h3>💻 Software Development</h3>
-        <ul>
-            <li><b>Full-Stack Development</b> (Frontend & Backend)</li>
-            <li><b>Web Application Development</b> with modern frameworks</li>
-            <li><b>Database Design & Management</b> (SQL & NoSQL)</li>
-            <li><b>RESTful API Development</b> & Integration</li>
-            <li><b>Version Control</b> with Git & GitHub</li>
-            <li><b>Agile Development</b> methodologies</li>
-        </ul>
-    </div>
-    """, unsafe_allow_html=True)
-
-with col2:
-    st.markdown("""
-    <div class="glass-card">
-        <h3>📊 Data Analytics</h3>
-        <ul>
-            <li><b>Data Analysis & Visualization</b> with Python/R</li>
-            <li><b>Statistical Analysis</b> & Business Intelligence</li>
-            <li><b>Machine Learning</b> & Predictive Modeling</li>
-            <li><b>SQL Database Querying</b> & Data Mining</li>
-            <li><b>Dashboard Creation</b> with Power BI/Tableau</li>
-            <li><b>Data Cleaning</b> & ETL processes</li>
-        </ul>
-    </div>
-    """, unsafe_allow_html=True)
-
-with col3:
-    st.markdown("""
-    <div class="glass-card">
-        <h3>🔧 Tools & Technologies</h3>
-        <ul>
-            <li><b>Languages:</b> Python, Java, JavaScript, SQL, R</li>
-            <li><b>Frameworks:</b> React, Node.js, Django, Flask</li>
-            <li><b>Tools:</b> VS Code, Git, Docker, Jupyter, Power BI</li>
-            <li><b>Libraries:</b> Pandas, NumPy, Scikit-learn, TensorFlow</li>
-            <li><b>Databases:</b> MySQL, PostgreSQL, MongoDB</li>
-            <li><b>Cloud:</b> AWS, Azure, Google Cloud Platform</li>
-        </ul>
-    </div>
-    """, unsafe_allow_html=True)
-
-# Skills Proficiency
-st.markdown("<br>", unsafe_allow_html=True)
-st.markdown("### <span style='color: #64ffda;'>📊</span> Skill Proficiency", unsafe_allow_html=True)
-
-col1, col2, col3, col4 = st.columns(4)
-
-with col1:
-    st.markdown("**🐍 Python**")
-    st.progress(0.85)
-    st.markdown("**☕ Java**")
-    st.progress(0.75)
-
-with col2:
-    st.markdown("**📊 Data Analysis**")
-    st.progress(0.80)
-    st.markdown("**💾 SQL**")
-    st.progress(0.78)
-
-with col3:
-    st.markdown("**⚙️ Machine Learning**")
-    st.progress(0.72)
-    st.markdown("**🌐 Web Development**")
-    st.progress(0.75)
-
-with col4:
-    st.markdown("**📚 Git/GitHub**")
-    st.progress(0.70)
-    st.markdown("**☁️ Cloud Platforms**")
-    st.progress(0.68)
-
-st.markdown('<div class="cyber-divider"></div>', unsafe_allow_html=True)
-
-# Projects Section
-st.markdown('<h2 class="section-3d"><span style="color: #667eea;">🏆</span> Award-Winning Projects & Innovations</h2>', unsafe_allow_html=True)
-
-# Featured Projects Layout
-col1, col2, col3 = st.columns(3, gap="medium")
-
-# -------- Project 1: Financial Fraud Detection API - Execute 4.0 TOP 6 --------
-with col1:
-    st.markdown("""
-    <div class="project-magnetic">
-        <h3 style="color: #64ffda;">🔒 Financial Fraud Detection API</h3>
-        <p style="color: #8892b0; font-size: 1.1rem; line-height: 1.7; margin: 20px 0;">
-            <strong>🏆 TOP 6 Achievement in Execute 4.0 Hackathon, Delhi Technical University (DTU)</strong><br>
-            Advanced machine learning-powered API for real-time financial fraud detection and risk assessment.
-        </p>
-        <div style="margin: 20px 0;">
-            <span class="tech-bubble">Machine Learning</span><span class="tech-bubble">Python</span>
-            <span class="tech-bubble">API Development</span><span class="tech-bubble">Fraud Detection</span>
-            <span class="tech-bubble">Hugging Face</span>
-        </div>
-        <div style="margin-top: 25px;">
-            <h4 style="color: #64ffda; margin-bottom: 15px;">✨ Key Features</h4>
-            <ul style="color: #ccd6f6; line-height: 2;">
-                <li>🔍 Real-time fraud detection algorithms</li>
-                <li>📊 Advanced risk scoring system</li>
-                <li>⚡ High-performance API endpoints</li>
-                <li>🎯 Precision-focused ML models</li>
-                <li>📈 Interactive fraud analytics dashboard</li>
-                <li>🏆 Award-winning solution architecture</li>
-            </ul>
+# Tenant themes are small overrides on top of the shared stylesheet
+if tenant["theme"]:
+    st.markdown(f"<style>{theme_css(tenant['theme'])}</style>", unsafe_allow_html=True)
+
+# Admin analytics dashboard, reachable with ?admin=<PORTFOLIO_ADMIN_TOKEN>
+ADMIN_TOKEN = os.environ.get("PORTFOLIO_ADMIN_TOKEN", "")
+
+@st.cache_data(ttl=60)
+def get_analytics_summary():
+    """Aggregate every recorded event; cached briefly so refreshes do not rescan the log"""
+    return summarize(load_events())
+
+def render_analytics_dashboard():
+    """Click, search and view totals for the site owner"""
+    summary = get_analytics_summary()
+    st.markdown("## 📈 Visitor Analytics")
+
+    total_col, session_col, dropped_col = st.columns(3)
+    total_col.metric("Events", f"{summary['total']:,}")
+    session_col.metric("Sessions", f"{summary['sessions']:,}")
+    dropped_col.metric("Dropped (queue full)", f"{analytics.dropped:,}")
+
+    if summary["total"] == 0:
+        st.info("No events recorded yet.")
+        return
+
+    by_target = summary["by_target"]
+    clicks = by_target[by_target["kind"] == "click"]
+    if not clicks.empty:
+        st.markdown("### Outbound clicks")
+        st.bar_chart(clicks.set_index("target")["events"])
+
+    st.markdown("### Daily activity")
+    st.line_chart(summary["daily"].set_index("day")[["events", "sessions"]])
+
+    st.markdown("### All events by target")
+    st.dataframe(by_target, hide_index=True)
+
+if ADMIN_TOKEN and hmac.compare_digest(st.query_params.get("admin", ""), ADMIN_TOKEN):
+    render_analytics_dashboard()
+    st.stop()
+
+# Certificate previews are rendered once in the background and served by the asset server
+CERTIFICATES_PER_PAGE = 6
+
+@st.cache_resource
+def get_thumbnail_worker():
+    """Create the process-wide thumbnail worker and queue the built-in certificates up front"""
+    max_bytes = int(os.environ.get("PORTFOLIO_THUMBNAIL_CACHE_MB", "16")) * 1024 * 1024
+    worker = ThumbnailWorker(THUMBNAIL_CACHE_DIR, THUMBNAIL_INDEX_PATH, max_bytes=max_bytes)
+    if BACKGROUND_WORKERS:
+        worker.start()
+    for course in get_tenant_registry().get(DEFAULT_TENANT)["bundle"]["courses"]:
+        worker.lookup(course["certificate_url"])
+    return worker
+
+@st.fragment
+@marks_activity
+@timed_section("certificate gallery")
+def render_certificate_gallery():
+    """One page of certificate tiles; paging reruns only this fragment and sends only that page"""
+    worker = get_thumbnail_worker()
+    pages = max(1, -(-len(COURSES) // CERTIFICATES_PER_PAGE))
+    page = min(st.session_state.get("certificate_page", 0), pages - 1)
+
+    tiles = []
+    for course in COURSES[page * CERTIFICATES_PER_PAGE:(page + 1) * CERTIFICATES_PER_PAGE]:
+        name = worker.lookup(course["certificate_url"])
+        tiles.append(certificate_tile(course, f"{ASSET_BASE_URL}/assets/{name}" if name else None,
+                                      href=tracked_url("certificate", course["id"], course["certificate_url"])))
+    st.markdown(certificate_gallery(tiles), unsafe_allow_html=True)
+
+    if pages > 1:
+        previous_col, label_col, next_col = st.columns([1, 2, 1])
+        with previous_col:
+            if st.button("← Previous", key="certificate_previous", disabled=page == 0):
+                st.session_state["certificate_page"] = page - 1
+                st.rerun(scope="fragment")
+        with label_col:
+            st.markdown(f"<p class='text-center c-muted'>Page {page + 1} of {pages}</p>",
+                        unsafe_allow_html=True)
+        with next_col:
+            if st.button("Next →", key="certificate_next", disabled=page == pages - 1):
+                st.session_state["certificate_page"] = page + 1
+                st.rerun(scope="fragment")
+
+# Contact form: submissions are stored durably and mailed by a background worker
+@st.cache_resource
+def get_mail_worker():
+    """Start the process-wide SMTP delivery worker when SMTP is configured"""
+    worker = worker_from_env()
+    if worker is not None:
+        worker.start()
+    return worker
+
+# GitHub events are fetched on a schedule into a columnar store; renders read its memoized summary
+@st.cache_resource
+def get_github_activity(user):
+    """Start the process-wide GitHub event fetcher for one account"""
+    store = ActivityStore(os.environ.get("PORTFOLIO_GITHUB_STORE", REPO_ROOT / "data" / "github-activity.npz"))
+    fetcher = ActivityFetcher(store, user,
+                              interval=float(os.environ.get("PORTFOLIO_GITHUB_INTERVAL", FETCH_INTERVAL_SECONDS)),
+                              api_url=os.environ.get("PORTFOLIO_GITHUB_API_URL", GITHUB_API_URL),
+                              token=os.environ.get("PORTFOLIO_GITHUB_TOKEN"))
+    if BACKGROUND_WORKERS:
+        fetcher.start()
+    return fetcher
+
+@st.cache_data(max_entries=4)
+def github_activity_html(user, version, end_day):
+    """The activity panel for one store version and day; reruns in between reuse the HTML"""
+    summary = get_github_activity(user).store.summary(end_day)
+    return (activity_heatmap(summary["levels"], summary["contributions"], HEATMAP_WEEKS),
+            language_breakdown(summary["languages"]))
+
+@timed_section("github activity")
+def render_github_activity(user):
+    """Contribution heatmap and per-language breakdown from the locally stored GitHub events"""
+    store = get_github_activity(user).store
+    if not len(store):
+        st.caption("GitHub activity appears here after the first sync.")
+        return
+    heatmap_html, languages_html = github_activity_html(user, store.version, int(time.time() // SECONDS_PER_DAY))
+    heatmap_col, languages_col = st.columns([3, 1], gap="medium")
+    heatmap_col.markdown(heatmap_html, unsafe_allow_html=True)
+    languages_col.markdown(languages_html, unsafe_allow_html=True)
+
+# Pages: each rerun runs the shared setup above and then only the page being visited
+@timed_section("page: home")
+def home_page():
+    """Hero, about, search, skills and achievements"""
+    # Hero Section with Animated Name
+    st.markdown(cached_html("hero_title", ["profile"], hero_title, PROFILE), unsafe_allow_html=True)
+
+    st.markdown(cached_html("hero_tagline", ["profile"], hero_tagline, PROFILE), unsafe_allow_html=True)
+
+    st.markdown(cached_html("hero_intro", ["profile"], hero_intro, PROFILE), unsafe_allow_html=True)
+
+    # Professional Photo Section
+    st.markdown('<div class="cyber-divider"></div>', unsafe_allow_html=True)
+
+    # Horizontal layout for photo and intro
+    photo_col1, photo_col2 = st.columns([1, 2], gap="large")
+
+    with photo_col1:
+        st.markdown("""
+        <div class="text-center">
+            <div class="photo-frame-static">
+        """, unsafe_allow_html=True)
+
+        # Display the professional photo sideways with proper parameters
+        if PROFILE["photo"]:
+            safe_load_image(PROFILE["photo"],
+                           caption=PROFILE["name"],
+                           width=300)
+
+        st.markdown("""
+            </div>
         </div>
-        <a href="https://huggingface.co/spaces/bhumika007/Fraud_Detection_API_excecute4_Part2" target="_blank" style="color:#64ffda; text-decoration:none; font-weight:bold;">🚀 Live Demo on Hugging Face</a>
-    </div>
-    """, unsafe_allow_html=True)
-
-# -------- Project 2: AI Health Assistant - HACK SRIT 2025 --------
-with col2:
-    st.markdown("""
-    <div class="project-magnetic">
-        <h3 style="color: #667eea;">🏥 AI Health Assistant</h3>
-        <p style="color: #8892b0; font-size: 1.1rem; line-height: 1.7; margin: 20px 0;">
-            <strong>🚀 HACK SRIT 2025 Project - SRIT Jabalpur (May 10-11, 2025)</strong><br>
-            Intelligent healthcare AI assistant providing personalized medical insights and health recommendations.
-        </p>
-        <div style="margin: 20px 0;">
-            <span class="tech-bubble">Artificial Intelligence</span><span class="tech-bubble">Healthcare</span>
-            <span class="tech-bubble">Machine Learning</span><span class="tech-bubble">NLP</span>
-            <span class="tech-bubble">Hugging Face</span>
-        </div>
-        <div style="margin-top: 25px;">
-            <h4 style="color: #667eea; margin-bottom: 15px;">✨ Key Features</h4>
-            <ul style="color: #ccd6f6; line-height: 2;">
-                <li>🧠 AI-powered health diagnostics</li>
-                <li>📊 Personalized health recommendations</li>
-                <li>💬 Natural language processing interface</li>
-                <li>📈 Health data visualization</li>
-                <li>⚡ Real-time symptom analysis</li>
-                <li>🏆 Hackathon innovation showcase</li>
-            </ul>
-        </div>
-        <a href="https://huggingface.co/spaces/bhumika007/AI_health" target="_blank" style="color:#667eea; text-decoration:none; font-weight:bold;">🚀 Live Demo on Hugging Face</a>
-    </div>
-    """, unsafe_allow_html=True)
-
-st.markdown("<br>", unsafe_allow_html=True)
-
-# -------- Project 3: Helmet & License Plate Detection - Major College Project --------
-with col3:
-    st.markdown("""
-    <div class="project-magnetic">
-        <h3 style="color: #f093fb;">🏏 Helmet & License Plate Detection</h3>
-        <p style="color: #8892b0; font-size: 1.1rem; line-height: 1.7; margin: 20px 0;">
-            <strong>🎓 Major College Project</strong><br>
-            Advanced computer vision system for automated traffic safety monitoring and license plate recognition using deep learning.
-        </p>
-        <div style="margin: 20px 0;">
-            <span class="tech-bubble">Computer Vision</span><span class="tech-bubble">Deep Learning</span>
-            <span class="tech-bubble">YOLO</span><span class="tech-bubble">OpenCV</span>
-            <span class="tech-bubble">Hugging Face</span>
-        </div>
-        <div style="margin-top: 25px;">
-            <h4 style="color: #f093fb; margin-bottom: 15px;">✨ Key Features</h4>
-            <ul style="color: #ccd6f6; line-height: 2;">
-                <li>🎯 Real-time helmet detection for riders</li>
-                <li>📷 Automated license plate recognition</li>
-                <li>🚦 Traffic safety compliance monitoring</li>
-                <li>📊 Advanced object detection algorithms</li>
-                <li>⚡ High-accuracy YOLO implementation</li>
-                <li>🎓 Academic excellence demonstration</li>
-            </ul>
-        </div>
-        <a href="https://huggingface.co/spaces/bhumika007/Helmet-License-Plate-Detection" target="_blank" style="color:#f093fb; text-decoration:none; font-weight:bold;">🚀 Live Demo on Hugging Face</a>
-    </div>
-    """, unsafe_allow_html=True)
-
-
-st.markdown('<div class="cyber-divider"></div>', unsafe_allow_html=True)
-
-# Achievements Showcase Section
-st.markdown('<h2 class="section-3d"><span style="color: #f093fb;">🏆</span> Leadership & Innovation Showcase</h2>', unsafe_allow_html=True)
-
-# Create two columns for achievements
-achievement_col1, achievement_col2 = st.columns(2, gap="large")
-
-with achievement_col1:
-    st.markdown("""
-    <div class="glass-card">
-        <h3 style="color: #64ffda; text-align: center; margin-bottom: 20px;">👩‍💼 Professional Profile</h3>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    safe_load_image("src/assets/Bhumika_Photo.jfif", 
-                   caption="Bhumika Patel - Software Developer & Data Analyst")
-    
-    st.markdown("""
-    <div class="glass-card" style="margin-top: 20px; padding: 20px;">
-        <ul style="color: #ccd6f6; line-height: 1.8;">
-            <li>✅ <strong>Passionate technologist</strong> with expertise in AI/ML</li>
-            <li>✅ <strong>Award-winning developer</strong> in competitive hackathons</li>
-            <li>✅ <strong>Technical leader</strong> driving innovation in healthcare and fintech</li>
-            <li>✅ <strong>Problem solver</strong> with focus on real-world impact</li>
-        </ul>
-    </div>
-    """, unsafe_allow_html=True)
-
-with achievement_col2:
-    st.markdown("""
-    <div class="glass-card">
-        <h3 style="color: #667eea; text-align: center; margin-bottom: 20px;">🎤 Leadership in Action</h3>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    safe_load_image("src/assets/Presentation_Leadership_hackSRIT.jfif", 
-                   caption="Presenting at HACK SRIT 2025 - Technical Leadership")
-    
-    st.markdown("""
-    <div class="glass-card" style="margin-top: 20px; padding: 20px;">
-        <ul style="color: #ccd6f6; line-height: 1.8;">
-            <li>✅ <strong>Public speaking</strong> and technical presentation skills</li>
-            <li>✅ <strong>Team leadership</strong> in competitive hackathon environments</li>
-            <li>✅ <strong>Project management</strong> and stakeholder communication</li>
-            <li>✅ <strong>Innovation showcase</strong> with live demonstrations</li>
-        </ul>
-    </div>
-    """, unsafe_allow_html=True)
-
-st.markdown('<div class="cyber-divider"></div>', unsafe_allow_html=True)
-
-# Experience Section
-st.markdown('<h2 class="section-3d"><span style="color: #f093fb;">💼</span> Professional Experience</h2>', unsafe_allow_html=True)
-
-exp_col1, exp_col2 = st.columns(2, gap="large")
-
-with exp_col1:
-    st.markdown("""
-    <div class="timeline-card">
-        <h3><span style='color: #667eea;'>👨‍💻</span> TechCorp Solutions | Software Developer</h3>
-        <p><strong>Jan 2023 - Present</strong> | Mumbai, India</p>
-        <h4>🎯 Key Responsibilities</h4>
-        <ul>
-            <li>Developed and maintained <strong>full-stack web applications</strong> using modern frameworks</li>
-            <li>Implemented <strong>data analytics solutions</strong> for business intelligence</li>
-            <li>Collaborated with <strong>cross-functional teams</strong> to deliver high-quality software</li>
-            <li>Optimized <strong>database performance</strong> and reduced query execution time by 40%</li>
-            <li>Led <strong>code reviews</strong> and mentored junior developers</li>
-        </ul>
-    </div>
-    """, unsafe_allow_html=True)
-
-    st.markdown("""
-    <div class="timeline-card">
-        <h3><span style='color: #64ffda;'>👨‍💻</span> DataInsights Analytics | Data Analyst</h3>
-        <p><strong>Jun 2021 - Dec 2022</strong> | Pune, India</p>
-        <h4>🎯 Key Achievements</h4>
-        <ul>
-            <li>Analyzed <strong>large datasets</strong> to identify business trends and insights</li>
-            <li>Created <strong>interactive dashboards</strong> using Power BI and Tableau</li>
-            <li>Implemented <strong>predictive models</strong> for customer behavior analysis</li>
-            <li>Automated <strong>data processing workflows</strong> reducing manual effort by 60%</li>
-            <li>Collaborated with <strong>stakeholders</strong> to translate business requirements into technical solutions</li>
-        </ul>
-    </div>
-    """, unsafe_allow_html=True)
-
-with exp_col2:
-    st.markdown("""
-    <div class="timeline-card">
-        <h3><span style='color: #64ffda;'>👨‍💻</span> InnovateTech | Junior Software Engineer</h3>
-        <p><strong>Aug 2020 - May 2021</strong> | Bangalore, India</p>
-        <h4>🎯 Key Responsibilities</h4>
-        <ul>
-            <li>Developed <strong>web applications</strong> using Java Spring Boot and React</li>
-            <li>Designed and implemented <strong>RESTful APIs</strong> for mobile and web clients</li>
-            <li>Participated in <strong>agile development</strong> processes and daily standups</li>
-            <li>Conducted <strong>unit testing</strong> and debugging to ensure code quality</li>
-            <li>Collaborated with <strong>senior engineers</strong> on architecture decisions</li>
-        </ul>
-    </div>
-    """, unsafe_allow_html=True)
-    
-st.markdown('<div class="cyber-divider"></div>', unsafe_allow_html=True)
-
-st.markdown('<h2 class="section-3d"><span style="color: #00f2fe;">📚</span> Courses & Certifications</h2>', unsafe_allow_html=True)
-
-# Create columns for courses
-course_col1, course_col2 = st.columns(2, gap="large")
-
-with course_col1:
-    # Basics of Python - Springboard
-    st.markdown("""
-    <div class="glass-card">
-        <h3 style="color: #64ffda;">🐍 Basics of Python</h3>
-        <p style="color: #8892b0; margin: 10px 0;"><strong>Springboard</strong></p>
-        <div style="margin: 15px 0;">
-            <span class="tech-bubble">Python</span>
-            <span class="tech-bubble">Programming Fundamentals</span>
-            <span class="tech-bubble">Coding</span>
-            <span class="tech-bubble">Development</span>
-        </div>
-        <ul style="color: #ccd6f6; line-height: 1.8; margin: 15px 0;">
-            <li>✅ Successfully completed <strong>comprehensive Python course</strong></li>
-            <li>✅ Mastered <strong>Python fundamentals</strong> and syntax</li>
-            <li>✅ Hands-on experience with <strong>practical coding exercises</strong></li>
-            <li>✅ Built strong foundation for <strong>advanced programming</strong></li>
-        </ul>
-        <a href="https://drive.google.com/file/d/1PPBFguEliZgMx81E7I4dTkk9-OwWte2W/view?usp=drive_link" 
-           target="_blank" 
-           style="color: #64ffda; text-decoration: none; font-weight: bold; display: inline-block; margin-top: 10px;">
-           📄 View Certificate
-        </a>
-    </div>
-    """, unsafe_allow_html=True)
-
-    # Object Oriented Programming using Python
-    st.markdown("""
-    <div class="glass-card">
-        <h3 style="color: #667eea;">⚙️ Object Oriented Programming using Python</h3>
-        <p style="color: #8892b0; margin: 10px 0;"><strong>Professional Certification</strong></p>
-        <div style="margin: 15px 0;">
-            <span class="tech-bubble">Python</span>
-            <span class="tech-bubble">OOP</span>
-            <span class="tech-bubble">Programming</span>
-            <span class="tech-bubble">Software Design</span>
-        </div>
-        <ul style="color: #ccd6f6; line-height: 1.8; margin: 15px 0;">
-            <li>✅ Advanced <strong>Object-Oriented Programming</strong> concepts</li>
-            <li>✅ Expertise in <strong>Python class design</strong> patterns</li>
-            <li>✅ Proficiency in <strong>inheritance and polymorphism</strong></li>
-            <li>✅ Enhanced <strong>software architecture</strong> skills</li>
-        </ul>
-        <a href="https://drive.google.com/file/d/1VpakzRDauRF3-f-yoe5p3iixysP6ruQN/view?usp=sharing" 
-           target="_blank" 
-           style="color: #667eea; text-decoration: none; font-weight: bold; display: inline-block; margin-top: 10px;">
-           📄 View Certificate
-        </a>
-    </div>
-    """, unsafe_allow_html=True)
-
-with course_col2:
-    # E-Cell DTU E-SUMMIT Achievement
-    st.markdown("""
-    <div class="glass-card">
-        <h3 style="color: #f093fb;">🏆 E-SUMMIT '25 TOP 6 Achievement</h3>
-        <p style="color: #8892b0; margin: 10px 0;"><strong>E-Cell DTU, SabPaisa, and cellDTU</strong></p>
-        <div style="margin: 15px 0;">
-            <span class="tech-bubble">Entrepreneurship</span>
-            <span class="tech-bubble">Innovation</span>
-            <span class="tech-bubble">Competition</span>
-            <span class="tech-bubble">Leadership</span>
-        </div>
-        <ul style="color: #ccd6f6; line-height: 1.8; margin: 15px 0;">
-            <li>✅ Achieved <strong>TOP 6 position</strong> in prestigious E-SUMMIT '25</li>
-            <li>✅ Demonstrated <strong>innovative thinking</strong> and problem-solving</li>
-            <li>✅ Competed with <strong>top entrepreneurial talent</strong> nationwide</li>
-            <li>✅ Recognition from <strong>leading industry partners</strong></li>
-            <li>✅ Enhanced <strong>business development</strong> and pitching skills</li>
-        </ul>
-        <a href="https://drive.google.com/file/d/1JtOSuIYjJaL_yyehXujJXqjqbYbP-AiR/view?usp=drive_link" 
-           target="_blank" 
-           style="color: #f093fb; text-decoration: none; font-weight: bold; display: inline-block; margin-top: 10px;">
-           📄 View Certificate
-        </a>
-    </div>
-    """, unsafe_allow_html=True)
-
-    # HACK SRIT 2025 Achievement
-    st.markdown("""
-    <div class="glass-card">
-        <h3 style="color: #00f2fe;">🚀 HACK SRIT 2025 Participant</h3>
-        <p style="color: #8892b0; margin: 10px 0;"><strong>SRIT Jabalpur</strong></p>
-        <div style="margin: 15px 0;">
-            <span class="tech-bubble">Hackathon</span>
-            <span class="tech-bubble">Coding</span>
-            <span class="tech-bubble">Innovation</span>
-            <span class="tech-bubble">Team Work</span>
-        </div>
-        <ul style="color: #ccd6f6; line-height: 1.8; margin: 15px 0;">
-            <li>✅ Participated in <strong>prestigious hackathon</strong> competition</li>
-            <li>✅ Developed <strong>innovative tech solutions</strong> under time pressure</li>
-            <li>✅ Collaborated with <strong>skilled development teams</strong></li>
-            <li>✅ Enhanced <strong>rapid prototyping</strong> abilities</li>
-            <li>✅ Demonstrated <strong>problem-solving</strong> in competitive environment</li>
-        </ul>
-        <a href="https://drive.google.com/file/d/1aRObwFQJsKuafk8rSMqq2em1HHGMQ7Vn/view?usp=drive_link" 
-           target="_blank" 
-           style="color: #00f2fe; text-decoration: none; font-weight: bold; display: inline-block; margin-top: 10px;">
-           📄 View Certificate
-        </a>
-    </div>
-    """, unsafe_allow_html=True)
-
-# IIITDMJ Programming Club Certificate
-st.markdown("""
-<div class="project-magnetic" style="margin-top: 20px;">
-    <h3 style="color: #764ba2;">🏆 36-Hour Programming Intensive</h3>
-    <p style="color: #8892b0; margin: 10px 0;"><strong>Programming Club of IIITDMJ PDPM IIITDM Jabalpur</strong></p>
-    <div style="margin: 15px 0;">
-        <span class="tech-bubble">Programming</span>
-        <span class="tech-bubble">Competitive Coding</span>
-        <span class="tech-bubble">Team Collaboration</span>
-        <span class="tech-bubble">Problem Solving</span>
-        <span class="tech-bubble">Algorithms</span>
-    </div>
-    <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 20px; margin: 20px 0;">
-        <div>
-            <h4 style="color: #64ffda; margin-bottom: 10px;">🎯 Program Highlights</h4>
-            <ul style="color: #ccd6f6; line-height: 1.8;">
-                <li>✅ <strong>36-hour intensive</strong> in-person programming workshop</li>
-                <li>✅ Hands-on experience with <strong>competitive programming</strong></li>
-                <li>✅ Collaborated in <strong>team-based challenges</strong></li>
-                <li>✅ Prestigious <strong>IIITDMJ recognition</strong></li>
-                <li>✅ Enhanced <strong>algorithmic thinking</strong> abilities</li>
-            </ul>
-        </div>
-        <div>
-            <h4 style="color: #667eea; margin-bottom: 10px;">💡 Skills Acquired</h4>
-            <ul style="color: #ccd6f6; line-height: 1.8;">
-                <li>• Advanced problem-solving techniques</li>
-                <li>• Efficient algorithm implementation</li>
-                <li>• Time-constrained programming</li>
-                <li>• Team collaboration and leadership</li>
-                <li>• Code optimization strategies</li>
-            </ul>
-        </div>
-    </div>
-    <a href="https://drive.google.com/file/d/1QC7ISV0pINplCW4JsiqhVaN17cMyJ-qS/view?usp=sharing" 
-       target="_blank" 
-       style="color: #764ba2; text-decoration: none; font-weight: bold; display: inline-block; margin-top: 10px;">
-       📄 View Certificate
-    </a>
-</div>
-""", unsafe_allow_html=True)
+        """, unsafe_allow_html=True)
+
+    with photo_col2:
+        st.markdown(cached_html("about", ["profile"], about_card, PROFILE), unsafe_allow_html=True)
+
+    st.markdown('<div class="cyber-divider"></div>', unsafe_allow_html=True)
+
+    # Portfolio Search
+    render_search()
+
+    st.markdown('<div class="cyber-divider"></div>', unsafe_allow_html=True)
+
+    # Skills Section
+    st.markdown(section_header(SECTION_HEADERS["skills"]), unsafe_allow_html=True)
+
+    skill_cols = st.columns(3, gap="large")
+
+    for skill_col, group in zip(skill_cols, SKILL_GROUPS):
+        with skill_col:
+            st.markdown(cached_html(f"skill:{group['id']}", [f"skill_groups:{group['id']}"], skill_card, group), unsafe_allow_html=True)
+
+    # Skills Proficiency
+    st.markdown("<br>", unsafe_allow_html=True)
+    st.markdown("### <span class='c-accent'>📊</span> Skill Proficiency", unsafe_allow_html=True)
+
+    level_cols = st.columns(4)
+
+    for skill in SKILL_LEVELS:
+        with level_cols[skill["column"]]:
+            st.markdown(f"**{skill['label']}**")
+            st.progress(skill["level"])
+
+    st.markdown('<div class="cyber-divider"></div>', unsafe_allow_html=True)
 
-st.markdown('<div class="cyber-divider"></div>', unsafe_allow_html=True)
+    # Achievements Showcase Section
+    st.markdown(section_header(SECTION_HEADERS["showcase"]), unsafe_allow_html=True)
 
-# Contact Section
-st.markdown('<h2 class="section-3d"><span style="color: #64ffda;">📞</span> Let\'s Connect</h2>', unsafe_allow_html=True)
+    # Create two columns for achievements
+    achievement_cols = st.columns(2, gap="large")
 
-contact_col1, contact_col2, contact_col3, contact_col4 = st.columns(4, gap="medium")
+    for achievement_col, item in zip(achievement_cols, SHOWCASE):
+        with achievement_col:
+            st.markdown(cached_html(f"showcase_heading:{item['id']}", [f"showcase:{item['id']}"], showcase_heading, item), unsafe_allow_html=True)
 
-with contact_col1:
-    st.markdown("<div class='icon-glow' style='font-size: 3rem;'>📱</div>", unsafe_allow_html=True)
-    st.markdown("### Phone")
-    st.markdown("**+91 (900) 1234567**")
+            if item["image"]:
+                safe_load_image(item["image"], caption=item["caption"], display_width=SHOWCASE_IMAGE_WIDTH)
 
-with contact_col2:
-    st.markdown("<div class='icon-glow' style='font-size: 3rem;'>📧</div>", unsafe_allow_html=True)
-    st.markdown("### Email")
-    st.markdown("**bhumika.patel.dev@gmail.com**")
+            st.markdown(cached_html(f"showcase_points:{item['id']}", [f"showcase:{item['id']}"], showcase_points, item), unsafe_allow_html=True)
 
-with contact_col3:
-    st.markdown("<div class='icon-glow' style='font-size: 3rem;'>💼</div>", unsafe_allow_html=True)
-    st.markdown("### GitHub")
-    st.markdown("**[github.com/bhumika-patel](https://github.com/bhumika-patel)**")
+@timed_section("page: projects")
+def projects_page():
+    """Project grid and on-demand live demos"""
+    # Projects Section
+    st.markdown(section_header(SECTION_HEADERS["projects"]), unsafe_allow_html=True)
 
-with contact_col4:
-    st.markdown("<div class='icon-glow' style='font-size: 3rem;'>🔗</div>", unsafe_allow_html=True)
-    st.markdown("### LinkedIn")
-    st.markdown("**[Bhumika Patel](https://www.linkedin.com/in/bhumika-patel-dev)**")
+    # Featured Projects Layout, filterable by tech tag
+    render_project_grid()
+
+    # Live demos are embedded only on request, one at a time
+    st.markdown("### <span class='c-indigo'>🎮</span> Try the Live Demos", unsafe_allow_html=True)
+    render_live_demos()
+
+    st.markdown("<br>", unsafe_allow_html=True)
+
+@timed_section("page: experience")
+def experience_page():
+    """Work experience and the resume"""
+    # Experience Section
+    st.markdown(section_header(SECTION_HEADERS["experience"]), unsafe_allow_html=True)
+
+    exp_cols = st.columns(2, gap="large")
+
+    for job in EXPERIENCE:
+        with exp_cols[job["column"]]:
+            st.markdown(cached_html(f"experience:{job['id']}", [f"experience:{job['id']}"], experience_card, job), unsafe_allow_html=True)
+
+    st.markdown('<div class="cyber-divider"></div>', unsafe_allow_html=True)
+
+    # Resume Section, parsed from the bundled .docx so it cannot drift from the download
+    resume = load_resume() if IS_DEFAULT_TENANT else None
+    if resume:
+        st.markdown(section_header(SECTION_HEADERS["resume"]), unsafe_allow_html=True)
+        st.download_button("📥 Download Resume", data=resume["data"], file_name=resume["filename"],
+                           mime=RESUME_MIME, key="download_resume")
+
+        resume_cols = st.columns(2, gap="large")
+        for index, section in enumerate(resume["sections"]):
+            with resume_cols[index % 2]:
+                st.markdown(resume_card(section), unsafe_allow_html=True)
+
+@timed_section("page: certifications")
+def certifications_page():
+    """Courses, certificates and the thumbnail gallery"""
+    st.markdown(section_header(SECTION_HEADERS["courses"]), unsafe_allow_html=True)
+
+    # Create columns for courses
+    course_cols = st.columns(2, gap="large")
+
+    for course in COURSES:
+        if not course.get("featured"):
+            with course_cols[course["column"]]:
+                st.markdown(course_card(course, broken=link_checker.is_broken(course["certificate_url"]),
+                                        href=tracked_url("certificate", course["id"], course["certificate_url"])),
+                            unsafe_allow_html=True)
+
+    # Featured programs span the full width below the course grid
+    for course in COURSES:
+        if course.get("featured"):
+            st.markdown(course_card(course, broken=link_checker.is_broken(course["certificate_url"]),
+                                    href=tracked_url("certificate", course["id"], course["certificate_url"])),
+                        unsafe_allow_html=True)
+
+    if ASSET_BASE_URL and COURSES:
+        st.markdown("### 🖼️ Certificate Gallery")
+        render_certificate_gallery()
+
+@timed_section("page: contact")
+def contact_page():
+    """Contact details and the contact form"""
+    # Contact Section
+    st.markdown(section_header(SECTION_HEADERS["contact"]), unsafe_allow_html=True)
+
+    contact_cols = st.columns(max(len(CONTACTS), 1), gap="medium")
+
+    for contact_col, contact in zip(contact_cols, CONTACTS):
+        with contact_col:
+            st.markdown(f"<div class='icon-glow fs-icon-large'>{contact['icon']}</div>", unsafe_allow_html=True)
+            st.markdown(f"### {contact['label']}")
+            if contact["url"]:
+                st.markdown(f"**[{contact['text']}]({contact['url']})**")
+            else:
+                st.markdown(f"**{contact['text']}**")
+
+    github_account = github_user(CONTACTS)
+    # Like the contact form, activity is only tracked for the built-in portfolio's owner
+    if IS_DEFAULT_TENANT and github_account:
+        st.markdown("### <span class='c-accent'>📈</span> GitHub Activity", unsafe_allow_html=True)
+        render_github_activity(github_account)
+
+    mail_worker = get_mail_worker()
+
+    # Submissions are mailed to the built-in portfolio's owner, so tenants do not get the form
+    if IS_DEFAULT_TENANT:
+        st.markdown("### <span class='c-accent'>✉️</span> Send a Message", unsafe_allow_html=True)
+        with st.form("contact_form", clear_on_submit=True):
+            sender_name = st.text_input("Name", max_chars=100)
+            sender_email = st.text_input("Email")
+            sender_message = st.text_area("Message", max_chars=5000)
+            submitted = st.form_submit_button("📨 Send")
+
+        if submitted:
+            errors = validate(sender_name, sender_email, sender_message)
+            if errors:
+                for error in errors:
+                    st.error(error)
+            else:
+                try:
+                    # Rate limited per client address, or per session when the address is unknown
+                    enqueue(sender_name, sender_email, sender_message, sender=st.context.ip_address or SESSION_ID)
+                    if mail_worker is not None:
+                        mail_worker.notify()
+                    track("contact", "form")
+                    st.success("✅ Thanks! Your message has been received and will be delivered shortly.")
+                except ValueError as e:
+                    st.error(str(e))
+                except Exception as e:
+                    handle_error(e, "Contact Form")
+
+# Diagnostics, reachable with ?diagnostics=<PORTFOLIO_DIAGNOSTICS_TOKEN>
+DIAGNOSTICS_TOKEN = os.environ.get("PORTFOLIO_DIAGNOSTICS_TOKEN", "")
+
+def cache_row(name, cache, budget, entries=None, size=None):
+    """One row of the diagnostics cache table"""
+    rate = hit_rate(cache.hits, cache.misses)
+    return {"cache": name, "entries": entries if entries is not None else len(cache),
+            "size KB": (size if size is not None else cache.size) / 1024, "budget KB": budget / 1024,
+            "hits": cache.hits, "misses": cache.misses, "hit rate": f"{rate:.0%}" if rate is not None else "–"}
+
+def render_diagnostics():
+    """Live sessions, timings, memory and cache usage, with buttons to flush each cache"""
+    st.markdown("## 🩺 Diagnostics")
+    sessions = active_session_count()
+    rss = process_rss_mb()
+    session_col, rate_col, total_col, rss_col = st.columns(4)
+    session_col.metric("Active sessions", sessions if sessions is not None else "–")
+    rate_col.metric("Reruns / min", f"{rerun_stats.rate():.1f}")
+    total_col.metric("Reruns since start", f"{rerun_stats.total:,}")
+    rss_col.metric("Process RSS", f"{rss:.0f} MB" if rss is not None else "–")
+
+    st.markdown("### Section render times")
+    st.dataframe(pd.DataFrame(rerun_stats.section_summary()), hide_index=True)
+
+    st.markdown("### Slowest recent reruns")
+    st.dataframe(pd.DataFrame([{"at": datetime.fromtimestamp(rerun["at"]).strftime("%H:%M:%S"),
+                                "page": rerun["page"], "session": rerun["session"][:8],
+                                "ms": 1000 * rerun["seconds"]} for rerun in rerun_stats.slowest()]),
+                 hide_index=True)
+
+    st.markdown("### Caches")
+    registry = get_tenant_registry()
+    rows = [cache_row(f"tenant {tenant_id}: sections and images", loaded["cache"], loaded["cache"].max_bytes)
+            for tenant_id in registry.tenant_ids() if (loaded := registry.peek(tenant_id))]
+    rows.append(cache_row("Lottie animations", get_lottie_cache(), LOTTIE_CACHE_BYTES))
+    variants = get_resize_service().cache
+    rows.append(cache_row("resized image variants", variants, variants.max_bytes,
+                          entries=len(list(variants.directory.iterdir())), size=variants.size()))
+    if ASSET_BASE_URL:
+        thumbnails = get_thumbnail_worker().cache
+        rows.append(cache_row("certificate thumbnails", thumbnails, thumbnails.max_bytes,
+                              entries=len(list(thumbnails.directory.iterdir())), size=thumbnails.size()))
+    st.dataframe(pd.DataFrame(rows), hide_index=True)
+
+    st.markdown("### Sessions")
+    evicted_col, rejected_col, limit_col = st.columns(3)
+    evicted_col.metric("Evicted (idle or cap)", f"{session_tracker.evicted:,}")
+    rejected_col.metric("Turned away (cap)", f"{session_tracker.rejected:,}")
+    limit_col.metric("Limits", f"{session_tracker.max_sessions} sessions, {session_tracker.idle_timeout / 60:.0f} min idle")
+    st.dataframe(pd.DataFrame([{"session": record["session"][:8], "page": record["page"], "reruns": record["reruns"],
+                                "idle s": record["idle_s"], "age s": record["age_s"],
+                                "state KB": (record["state_bytes"] or 0) / 1024}
+                               for record in session_tracker.report()]), hide_index=True)
+    if st.button("Evict idle sessions now", key="evict_idle_sessions"):
+        st.toast(f"Evicted {len(session_tracker.reap())} idle sessions")
+
+    st.markdown("### Admission")
+    admission = get_monitor().status()
+    if admission["running"]:
+        state_col, lag_col, diverted_col, threshold_col = st.columns(4)
+        state_col.metric("New visitors", "live app" if admission["admit"] else "static copy")
+        lag_col.metric("Event-loop lag", f"{admission['lag_ms']:.0f} ms")
+        diverted_col.metric("Sent to static copy", f"{admission['diverted']:,}")
+        threshold_col.metric("Thresholds", f"{admission['max_sessions']} sessions, {admission['max_lag_ms']:.0f} ms")
+    else:
+        st.caption("Admission control is off; start the app with `streamlit run src/portfolio_server.py`.")
+
+    st.markdown("### Crawler snapshots")
+    snapshot = get_snapshots().status()
+    if snapshot["running"]:
+        version_col, pages_col, served_col, renders_col = st.columns(4)
+        version_col.metric("Content version", snapshot["version"] or "rendering…")
+        pages_col.metric("Pages", snapshot["pages"])
+        served_col.metric("Served to crawlers", f"{snapshot['served']:,}")
+        renders_col.metric("Renders", snapshot["renders"])
+        if snapshot["error"]:
+            st.warning(f"Last render failed, serving the previous snapshot: {snapshot['error']}")
+    else:
+        st.caption("Crawler routing is off; start the app with `streamlit run src/portfolio_server.py`.")
+
+    st.markdown("### Streamlit caches")
+    st.dataframe(pd.DataFrame(streamlit_cache_stats()), hide_index=True)
+
+    st.markdown("### Flush")
+    flush_cols = st.columns(5)
+    if flush_cols[0].button("Tenant caches", key="flush_tenant_caches"):
+        for tenant_id in registry.tenant_ids():
+            loaded = registry.peek(tenant_id)
+            if loaded:
+                loaded["cache"].clear()
+        st.toast("Tenant caches flushed")
+    if flush_cols[1].button("Lottie cache", key="flush_lottie"):
+        get_lottie_cache().clear()
+        st.toast("Lottie cache flushed")
+    if flush_cols[2].button("Image variants", key="flush_variants"):
+        variants.clear()
+        st.toast("Image variants flushed")
+    if flush_cols[3].button("Thumbnails", key="flush_thumbnails", disabled=not ASSET_BASE_URL):
+        get_thumbnail_worker().cache.clear()
+        st.toast("Thumbnails flushed; they are regenerated in the background")
+    if flush_cols[4].button("st.cache_data", key="flush_cache_data"):
+        st.cache_data.clear()
+        st.toast("st.cache_data flushed")
+    if st.button("Reset timings", key="reset_timings"):
+        rerun_stats.clear()
+        st.rerun()
+
+# Sessions are accounted per process; idle ones are released and their tabs reconnect when they return
+@st.cache_resource
+def get_session_tracker():
+    """Start the process-wide session tracker and its idle-session reaper"""
+    idle_timeout = float(os.environ.get("PORTFOLIO_SESSION_IDLE_SECONDS", SESSION_IDLE_SECONDS))
+    tracker = SessionTracker(idle_timeout=idle_timeout,
+                             max_sessions=int(os.environ.get("PORTFOLIO_MAX_SESSIONS", MAX_SESSIONS)),
+                             interval=min(REAP_INTERVAL_SECONDS, idle_timeout / 2))
+    tracker.start()
+    return tracker
+
+session_tracker = get_session_tracker()
+script_context = get_script_run_ctx()
+SESSION_ID = script_context.session_id if script_context else st.session_state["analytics_session"]
+
+if DIAGNOSTICS_TOKEN and hmac.compare_digest(st.query_params.get("diagnostics", ""), DIAGNOSTICS_TOKEN):
+    render_diagnostics()
+    st.stop()
+
+# Past the session cap, new visitors get a short notice instead of a full page session; the tracker
+# remembers them and the reaper releases their WebSockets once the notice has been up for a minute
+if not session_tracker.admit(SESSION_ID):
+    st.warning("⏳ The portfolio is very busy right now. Please reload in a minute.")
+    st.stop()
+
+PAGES = [
+    (home_page, "Home", "🏠", "home"),
+    (projects_page, "Projects", "🚀", "projects"),
+    (experience_page, "Experience", "💼", "experience"),
+    (certifications_page, "Certifications", "📜", "certifications"),
+    (contact_page, "Contact", "📬", "contact"),
+]
+
+# PORTFOLIO_SINGLE_PAGE=1 keeps the original one-page layout, the baseline for `bench_portfolio.py pages`
+if os.environ.get("PORTFOLIO_SINGLE_PAGE") == "1":
+    current_page_name = "all"
+    for index, (render_page, *_) in enumerate(PAGES):
+        if index:
+            st.markdown('<div class="cyber-divider"></div>', unsafe_allow_html=True)
+        render_page()
+else:
+    current_page = st.navigation([st.Page(render_page, title=title, icon=icon, url_path=url_path, default=index == 0)
+                                  for index, (render_page, title, icon, url_path) in enumerate(PAGES)],
+                                 position="top")
+    current_page_name = current_page.url_path or "home"
+    if st.session_state.get("analytics_page") != current_page_name:
+        st.session_state["analytics_page"] = current_page_name
+        track("page", current_page_name)
+    current_page.run()
+
+rerun_stats.record(st.session_state.get("analytics_session", ""), current_page_name, time.perf_counter() - RERUN_STARTED)
+session_tracker.touch(SESSION_ID, current_page_name)
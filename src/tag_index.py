@@ -0,0 +1,58 @@
+"""
+Precomputed bitmap index from tech-bubble tags to project and course cards
+"""
+
+from content import default_bundle
+
+
+class TagIndex:
+    """Maps every tag to an integer bitset whose bit i marks card i as carrying the tag"""
+
+    def __init__(self, cards):
+        self.cards = list(cards)
+        self.bitmaps = {}
+
+        for position, (_, card) in enumerate(self.cards):
+            bit = 1 << position
+            for tag in card["tags"]:
+                self.bitmaps[tag] = self.bitmaps.get(tag, 0) | bit
+
+        self.all_cards = (1 << len(self.cards)) - 1
+        # Most common tags first so the filter leads with the broadest facets
+        self.tags = sorted(self.bitmaps, key=lambda tag: (-self.bitmaps[tag].bit_count(), tag))
+
+    def match(self, tags, match_all=False):
+        """Resolve a multi-tag filter to a bitset with AND (match_all) or OR semantics"""
+        if not tags:
+            return self.all_cards
+
+        if match_all:
+            result = self.all_cards
+            for tag in tags:
+                result &= self.bitmaps.get(tag, 0)
+        else:
+            result = 0
+            for tag in tags:
+                result |= self.bitmaps.get(tag, 0)
+        return result
+
+    def cards_for(self, bitmap):
+        """Return the (kind, card) pairs whose bits are set, in content order"""
+        cards = []
+        while bitmap:
+            lowest = bitmap & -bitmap
+            cards.append(self.cards[lowest.bit_length() - 1])
+            bitmap ^= lowest
+        return cards
+
+    def filter(self, tags, match_all=False):
+        """Return the cards matching the selected tags"""
+        return self.cards_for(self.match(tags, match_all))
+
+
+def build_tag_index(bundle=None):
+    """Build the tag index over every project and course card"""
+    bundle = bundle or default_bundle()
+    cards = [("project", project) for project in bundle["projects"]]
+    cards += [("course", course) for course in bundle["courses"]]
+    return TagIndex(cards)
@@ -0,0 +1,359 @@
+"""
+HTML templates for the portfolio cards, rendered from the content model
+"""
+
+import time
+from html import escape
+from pathlib import Path
+
+from design_tokens import token_css, tone
+
+STYLESHEET_PATH = Path(__file__).parent / "assets" / "portfolio.css"
+
+
+def stylesheet():
+    """The portfolio stylesheet shared by the app and the static export, followed by the token utilities"""
+    return STYLESHEET_PATH.read_text(encoding="utf-8") + "\n" + token_css()
+
+
+def tech_bubbles(tags):
+    """Render a row of tech-bubble tags"""
+    return "\n".join(f'<span class="tech-bubble">{tag}</span>' for tag in tags)
+
+
+def list_items(items):
+    """Render list items from pre-formatted HTML fragments"""
+    return "\n".join(f"<li>{item}</li>" for item in items)
+
+
+def broken_link_notice(broken):
+    """Render a warning next to a link the health checker found unreachable"""
+    if not broken:
+        return ""
+    return '<span class="link-broken">⚠️ Link currently unreachable</span>'
+
+
+SPACE_BADGES = {
+    "running": ("🟢", "Running", "#64ffda"),
+    "sleeping": ("🟡", "Sleeping", "#f9ca24"),
+    "error": ("🔴", "Error", "#ff6b6b"),
+}
+
+
+def space_badge(status):
+    """Render a Space's runtime status with the time it was last checked"""
+    if not status:
+        return ""
+    icon, label, color = SPACE_BADGES[status["state"]]
+    checked = time.strftime("%H:%M UTC", time.gmtime(status["checked_at"]))
+    return (f'<div class="mt-10"><span {tone(color, "space-badge", border=True)} '
+            f'title="{status["stage"]}">{icon} {label}</span><span class="space-badge-time">checked {checked}</span></div>')
+
+
+def hero_title(profile):
+    """Render the animated name header"""
+    return f'''
+    <h1 class="cyber-hero" data-text="{profile['first_name']} {profile['last_name']}">
+        <span class="c-white">{profile['first_name']}</span>
+        <span class="holographic-text">{profile['last_name']}</span>
+    </h1>
+'''
+
+
+def hero_tagline(profile):
+    """Render the neon subtitle under the name"""
+    return f'<p class="neon-subtitle">{profile["tagline"]}</p>'
+
+
+def hero_intro(profile):
+    """Render the centered introduction paragraph"""
+    return f"""
+<div class="reveal-text hero-intro">
+    <p class="c-text fs-intro lh-body fw-light">
+    {profile['intro']}
+    </p>
+</div>
+"""
+
+
+def about_card(profile):
+    """Render the 'Meet' panel next to the professional photo"""
+    return f"""
+    <div class="my-40">
+        <h2 class="c-accent mb-20 fw-semibold fs-title">👩‍💻 Meet {profile['name']}</h2>
+        <div class="about-panel">
+            <h3 class="c-indigo mb-15">About Me</h3>
+            <p class="c-text fs-lead lh-body mb-15">
+                {profile['about']}
+            </p>
+            <p class="c-muted fs-body italic mt-20">
+                ✨ "{profile['quote']}"
+            </p>
+        </div>
+    </div>
+    """
+
+
+def section_header(header):
+    """Render a 3D section header"""
+    return f'<h2 class="section-3d"><span {tone(header["accent"])}>{header["icon"]}</span> {header["title"]}</h2>'
+
+
+def showcase_heading(item):
+    """Render the title card above a showcase photo"""
+    return f"""
+    <div class="glass-card">
+        <h3 {tone(item['accent'], "text-center", "mb-20")}>{item['title']}</h3>
+    </div>
+    """
+
+
+def showcase_points(item):
+    """Render the bullet card below a showcase photo"""
+    return f"""
+    <div class="glass-card showcase-points">
+        <ul class="c-text lh-body">
+            {list_items(item['items'])}
+        </ul>
+    </div>
+    """
+
+
+def skill_card(group):
+    """Render a skill group glass card"""
+    return f"""
+    <div class="glass-card">
+        <h3>{group['title']}</h3>
+        <ul>
+            {list_items(group['items'])}
+        </ul>
+    </div>
+    """
+
+
+def project_card(project, broken=False, status=None, href=None):
+    """Render an award-winning project card"""
+    accent = project["accent"]
+    return f"""
+    <div class="project-magnetic">
+        <h3 {tone(accent)}>{project['icon']} {project['title']}</h3>
+        <p class="c-muted fs-lead lh-relaxed my-20">
+            <strong>{project['headline']}</strong><br>
+            {project['summary']}
+        </p>
+        <div class="my-20">
+            {tech_bubbles(project['tags'])}
+        </div>
+        <div class="mt-25">
+            <h4 {tone(accent, "mb-15")}>✨ Key Features</h4>
+            <ul class="c-text lh-loose">
+                {list_items(project['features'])}
+            </ul>
+        </div>
+        <a href="{href or project['demo_url']}" target="_blank" {tone(accent, "no-underline", "fw-bold")}>🚀 Live Demo on Hugging Face</a>{broken_link_notice(broken)}{space_badge(status)}
+    </div>
+    """
+
+
+def experience_card(job):
+    """Render a professional experience timeline card"""
+    return f"""
+    <div class="timeline-card">
+        <h3><span {tone(job['accent'])}>👨‍💻</span> {job['title']}</h3>
+        <p><strong>{job['period']}</strong> | {job['location']}</p>
+        <h4>{job['heading']}</h4>
+        <ul>
+            {list_items(job['items'])}
+        </ul>
+    </div>
+    """
+
+
+def resume_entry(entry):
+    """Render one resume line: bold lead, body text and a right-aligned date"""
+    lead = f"<strong>{escape(entry['lead'])}</strong> " if entry["lead"] else ""
+    aside = f'<span class="resume-aside">{escape(entry["aside"])}</span>' if entry["aside"] else ""
+    return f"{lead}{escape(entry['text'])}{aside}"
+
+
+def resume_card(section):
+    """Render one parsed resume section as a timeline card"""
+    bullets = [resume_entry(entry) for entry in section["entries"] if entry["bullet"]]
+    lines = "".join(f'<p class="resume-line">{resume_entry(entry)}</p>'
+                    for entry in section["entries"] if not entry["bullet"])
+    items = f"<ul>{list_items(bullets)}</ul>" if bullets else ""
+    return f"""
+    <div class="timeline-card resume-card" id="resume-{section['id']}">
+        <h3>{escape(section['title'])}</h3>
+        {lines}{items}
+    </div>
+    """
+
+
+def certificate_link(course, broken=False, href=None):
+    """Render the 'View Certificate' anchor for a course, optionally through a tracking redirect"""
+    return f"""
+        <a href="{href or course['certificate_url']}"
+           target="_blank"
+           {tone(course['accent'], "no-underline", "fw-bold", "inline-block", "mt-10")}>
+           📄 View Certificate
+        </a>{broken_link_notice(broken)}
+    """
+
+
+def course_card(course, broken=False, href=None):
+    """Render a course or certificate card, using the wide layout for featured courses"""
+    if course.get("featured"):
+        return featured_course_card(course, broken, href)
+
+    return f"""
+    <div class="glass-card">
+        <h3 {tone(course['accent'])}>{course['title']}</h3>
+        <p class="c-muted my-10"><strong>{course['issuer']}</strong></p>
+        <div class="my-15">
+            {tech_bubbles(course['tags'])}
+        </div>
+        <ul class="c-text lh-body my-15">
+            {list_items(course['items'])}
+        </ul>
+        {certificate_link(course, broken, href)}
+    </div>
+    """
+
+
+def certificate_tile(course, thumbnail_url=None, href=None):
+    """Render a gallery tile with the certificate's cached thumbnail, or a placeholder until it exists"""
+    if thumbnail_url:
+        preview = (f'<img src="{thumbnail_url}" alt="{escape(course["title"])} certificate" '
+                   f'loading="lazy" decoding="async">')
+    else:
+        preview = '<span class="cert-thumb-empty">📄</span>'
+    return f"""
+    <a class="cert-tile" href="{href or course['certificate_url']}" target="_blank" rel="noopener">
+        <div class="cert-thumb">{preview}</div>
+        <div {tone(course['accent'], "cert-tile-title")}>{course['title']}</div>
+        <div class="cert-tile-issuer">{course['issuer']}</div>
+    </a>
+    """
+
+
+def certificate_gallery(tiles):
+    """Lay out one page of certificate tiles in a responsive grid"""
+    return f'<div class="cert-gallery">{"".join(tiles)}</div>'
+
+
+def activity_heatmap(levels, contributions, weeks):
+    """Render a contribution heatmap from a 7 x weeks grid of levels, one column per week"""
+    # Column-major order fills each week top (Sunday) to bottom (Saturday)
+    cells = "".join(f'<i class="gh-l{level}"></i>' for level in levels.T.ravel())
+    return f"""
+    <div class="gh-heatmap" role="img" aria-label="{contributions} contributions in the last {weeks} weeks">{cells}</div>
+    <p class="gh-caption">{contributions:,} contributions in the last {weeks} weeks</p>
+    """
+
+
+def language_breakdown(languages):
+    """Render contributions per language as labelled bars"""
+    rows = "".join(f"""
+    <div class="gh-language"><span>{escape(row.language)}</span><span>{row.share:.0%}</span></div>
+    <div class="skill-meter"><div style="width: {round(row.share * 100)}%;"></div></div>"""
+                   for row in languages.itertuples())
+    return f'<div class="gh-languages">{rows}</div>'
+
+
+def featured_course_card(course, broken=False, href=None):
+    """Render the full-width card used for intensive programs"""
+    return f"""
+<div class="project-magnetic mt-20">
+    <h3 {tone(course['accent'])}>{course['title']}</h3>
+    <p class="c-muted my-10"><strong>{course['issuer']}</strong></p>
+    <div class="my-15">
+        {tech_bubbles(course['tags'])}
+    </div>
+    <div class="two-columns">
+        <div>
+            <h4 class="c-accent mb-10">🎯 Program Highlights</h4>
+            <ul class="c-text lh-body">
+                {list_items(course['items'])}
+            </ul>
+        </div>
+        <div>
+            <h4 class="c-indigo mb-10">💡 Skills Acquired</h4>
+            <ul class="c-text lh-body">
+                {list_items(course['skills_acquired'])}
+            </ul>
+        </div>
+    </div>
+    {certificate_link(course, broken, href)}
+</div>
+"""
+
+
+def search_result(doc):
+    """Render a single search hit with its section and outbound link"""
+    link = ""
+    if doc.get("url"):
+        link = f' · <a href="{doc["url"]}" target="_blank" class="c-accent no-underline">Open ↗</a>'
+    return f"""
+    <div class="search-hit">
+        <span class="c-muted fs-small">{doc['section']}</span><br>
+        <strong class="c-text">{doc['title']}</strong>{link}
+    </div>
+    """
+
+
+def demo_preview(project, active=False):
+    """Render the static placeholder shown in place of a Space embed until it is requested"""
+    status = "🟢 Live demo running below" if active else "Click to load the interactive demo"
+    return f"""
+    <div {tone(project['accent'], "demo-preview", border=True)}>
+        <div class="fs-icon">{project['icon']}</div>
+        <strong>{project['title']}</strong><br>
+        <span class="c-muted fs-caption">{status}</span>
+    </div>
+    """
+
+
+def figure(src, caption, width=None, placeholder=None):
+    """Render a captioned image served from a static URL, over its blurred placeholder when known"""
+    if placeholder is None:
+        width_attr = f' width="{width}"' if width else ' style="width: 100%;"'
+        return f"""
+    <figure class="static-figure">
+        <img src="{src}" alt="{caption}"{width_attr} loading="lazy">
+        <figcaption>{caption}</figcaption>
+    </figure>
+    """
+
+    # The frame reserves the final aspect ratio and shows the placeholder until the image paints over it
+    frame_width = f"width: {width}px; max-width: 100%;" if width else "width: 100%;"
+    return f"""
+    <figure class="static-figure">
+        <div class="lqip-frame" style="{frame_width} aspect-ratio: {placeholder['width']} / {placeholder['height']}; background-color: {placeholder['color']}; background-image: url('{placeholder['placeholder']}');">
+            <img src="{src}" alt="{caption}" width="{placeholder['width']}" height="{placeholder['height']}" loading="lazy" decoding="async">
+        </div>
+        <figcaption>{caption}</figcaption>
+    </figure>
+    """
+
+
+def skill_meter(skill):
+    """Render a skill proficiency bar for the static export"""
+    return f"""
+    <p><strong>{skill['label']}</strong></p>
+    <div class="skill-meter"><div style="width: {round(skill['level'] * 100)}%;"></div></div>
+    """
+
+
+def contact_card(contact):
+    """Render a contact column for the static export"""
+    text = contact["text"]
+    if contact.get("url"):
+        text = f'<a href="{contact["url"]}" target="_blank" class="c-accent">{text}</a>'
+    return f"""
+    <div class="text-center">
+        <div class="icon-glow fs-icon-large">{contact['icon']}</div>
+        <h3>{contact['label']}</h3>
+        <p><strong>{text}</strong></p>
+    </div>
+    """
@@ -0,0 +1,383 @@
+"""
+Multi-tenant mode: per-tenant content bundles and size-bounded per-tenant caches in one process
+"""
+
+import copy
+import json
+import os
+import re
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+import content
+from content import BUNDLE_KEYS, SECTION_HEADERS, content_version, default_bundle, search_documents
+from hot_reload import DependencyGraph, diff_bundles, file_mtimes, load_module_bundle
+from resume import RESUME_PATH
+from search_index import SearchIndex, load_index
+from tag_index import build_tag_index
+from asset_pipeline import REPO_ROOT, SEARCH_INDEX_PATH
+
+TENANTS_DIR = Path(os.environ.get("PORTFOLIO_TENANTS_DIR", Path(__file__).resolve().parent.parent / "tenants"))
+BUNDLE_NAME = "bundle.json"
+DEFAULT_TENANT = "default"
+TENANT_ID_PATTERN = re.compile(r"^[a-z0-9][a-z0-9-]{0,62}$")
+
+MAX_TENANTS = 128
+TENANT_CACHE_BYTES = 4 * 1024 * 1024
+
+CONTENT_MODULE_PATH = Path(content.__file__).resolve()
+# What a bundle may leave out, with the values the pages fall back to; the types of these defaults are the
+# types a bundle must use
+PROFILE_DEFAULTS = {"name": "", "first_name": "", "last_name": "", "page_title": "Portfolio", "page_icon": "💼",
+                    "tagline": "", "intro": "", "about": "", "quote": "", "photo": ""}
+HEADER_DEFAULTS = {"icon": "", "title": "", "accent": "#64ffda"}
+RECORD_DEFAULTS = {
+    "skill_groups": {"title": "", "items": []},
+    "skill_levels": {"label": "", "level": 0.0, "column": 0},
+    "projects": {"title": "", "icon": "", "accent": "#64ffda", "headline": "", "summary": "", "tags": [],
+                 "features": [], "demo_url": ""},
+    "showcase": {"title": "", "accent": "#64ffda", "image": "", "caption": "", "items": []},
+    "experience": {"title": "", "accent": "#64ffda", "period": "", "location": "", "heading": "", "column": 0,
+                   "items": []},
+    "courses": {"title": "", "accent": "#64ffda", "issuer": "", "tags": [], "column": 0, "items": [],
+                "featured": False, "skills_acquired": [], "certificate_url": ""},
+    "contacts": {"icon": "", "label": "", "text": "", "url": None},
+}
+# Page columns each collection is laid out in
+COLUMN_COUNTS = {"skill_levels": 4, "experience": 2, "courses": 2}
+# Records whose card is a link are dropped without a web URL to point it at
+LINK_FIELDS = {"projects": "demo_url", "courses": "certificate_url"}
+WEB_URL_PATTERN = re.compile(r"^https?://[^\s\"'<>]+$")
+# Tenant colours end up in <style> blocks and style attributes, so only plain colour values are accepted:
+# hex, rgb()/rgba()/hsl()/hsla() with simple arguments, or a named colour
+COLOR_PATTERN = re.compile(r"^(#(?:[0-9a-fA-F]{3,4}|[0-9a-fA-F]{6}|[0-9a-fA-F]{8})"
+                           r"|(?:rgba?|hsla?)\([0-9a-z.%\s,/+-]*\)|[a-zA-Z]{3,20})$")
+# Search document id prefix per content collection
+SEARCH_PREFIXES = {"skill_groups": "skill", "projects": "project", "experience": "experience", "courses": "course"}
+
+
+def tenant_id_from(params):
+    """Pick the tenant from the ?tenant= query parameter, falling back to the built-in portfolio"""
+    tenant_id = (params.get("tenant") or DEFAULT_TENANT).strip().lower()
+    return tenant_id if TENANT_ID_PATTERN.match(tenant_id) else DEFAULT_TENANT
+
+
+def clean_value(value, default):
+    """A bundle value if it has the default's type (lists keep only their strings), else the default"""
+    if isinstance(default, bool):
+        return value if isinstance(value, bool) else default
+    if isinstance(default, float):
+        return float(value) if isinstance(value, (int, float)) and not isinstance(value, bool) else default
+    if isinstance(default, int):
+        return value if isinstance(value, int) and not isinstance(value, bool) else default
+    if isinstance(default, list):
+        return [item for item in value if isinstance(item, str)] if isinstance(value, list) else default
+    if default is None:
+        return value if isinstance(value, str) and WEB_URL_PATTERN.match(value) else None
+    return value if isinstance(value, type(default)) else default
+
+
+def is_color(value):
+    """Whether a theme or accent value is a plain CSS colour"""
+    return isinstance(value, str) and COLOR_PATTERN.match(value.strip()) is not None
+
+
+def clean_record(record, defaults):
+    """A bundle record with every field the pages read, missing or mistyped ones set to their defaults"""
+    cleaned = {key: clean_value(record.get(key, default), default) for key, default in defaults.items()}
+    if "accent" in cleaned and not is_color(cleaned["accent"]):
+        cleaned["accent"] = defaults["accent"]
+    return cleaned
+
+
+def clean_collection(key, records):
+    """A bundle collection's valid records, with ids, defaults and in-range columns filled in"""
+    cleaned = []
+    for index, record in enumerate(records if isinstance(records, list) else []):
+        if not isinstance(record, dict):
+            continue
+        item = {"id": str(record.get("id") or index), **clean_record(record, RECORD_DEFAULTS[key])}
+        if key in LINK_FIELDS and not WEB_URL_PATTERN.match(item[LINK_FIELDS[key]]):
+            continue
+        if key in COLUMN_COUNTS:
+            item["column"] = min(max(item["column"], 0), COLUMN_COUNTS[key] - 1)
+        if key == "skill_levels":
+            item["level"] = min(max(item["level"], 0.0), 1.0)
+        cleaned.append(item)
+    return cleaned
+
+
+def load_bundle(tenant_id, tenants_dir=TENANTS_DIR):
+    """Load a tenant's bundle.json, resolving its image paths inside the tenant directory
+
+    Bundles are validated here, so pages can index any field: records that are not objects or lack a link
+    their card needs are dropped, and missing or mistyped fields get defaults.
+    """
+    tenant_dir = Path(tenants_dir) / tenant_id
+    data = json.loads((tenant_dir / BUNDLE_NAME).read_text(encoding="utf-8"))
+    if not isinstance(data, dict) or not isinstance(data.get("profile"), dict):
+        raise ValueError(f"{tenant_dir / BUNDLE_NAME} needs a profile object")
+
+    bundle = {key: clean_collection(key, data.get(key)) for key in BUNDLE_KEYS if key in RECORD_DEFAULTS}
+    bundle["profile"] = clean_record(data["profile"], PROFILE_DEFAULTS)
+    overrides = data.get("section_headers") if isinstance(data.get("section_headers"), dict) else {}
+    bundle["section_headers"] = {}
+    for key, header in SECTION_HEADERS.items():
+        override = overrides.get(key) if isinstance(overrides.get(key), dict) else {}
+        bundle["section_headers"][key] = clean_record({**header, **override}, HEADER_DEFAULTS)
+
+    # Images are named relative to the tenant directory and must stay inside it
+    for item in [bundle["profile"]] + bundle["showcase"]:
+        key = "photo" if item is bundle["profile"] else "image"
+        if item.get(key):
+            path = (tenant_dir / item[key]).resolve()
+            item[key] = str(path) if path.is_relative_to(tenant_dir.resolve()) else ""
+
+    return bundle, data.get("theme") if isinstance(data.get("theme"), dict) else {}
+
+
+def image_paths(bundle):
+    """Every image path a bundle references, as written in the bundle"""
+    paths = [bundle["profile"].get("photo")] + [item.get("image") for item in bundle["showcase"]]
+    return [path for path in paths if path]
+
+
+def content_files(tenant_id, bundle, tenants_dir=TENANTS_DIR):
+    """Map each file a tenant's page is built from to the record key its changes invalidate"""
+    if tenant_id == DEFAULT_TENANT:
+        files = {str(CONTENT_MODULE_PATH): "file:content", str(RESUME_PATH): "file:resume"}
+    else:
+        files = {str(Path(tenants_dir) / tenant_id / BUNDLE_NAME): "file:content"}
+    for path in image_paths(bundle):
+        files[str(Path(path) if Path(path).is_absolute() else REPO_ROOT / path)] = f"file:{path}"
+    return files
+
+
+def theme_css(theme):
+    """Render a tenant's theme overrides, layered on top of the shared stylesheet; non-colour values are dropped"""
+    theme = {key: value.strip() for key, value in theme.items() if is_color(value)}
+    rules = []
+    if theme.get("background"):
+        rules.append(f".stApp, .main {{ background: {theme['background']} !important; }}")
+    if theme.get("text"):
+        rules.append(f".main p, .main li {{ color: {theme['text']}; }}")
+    if theme.get("accent"):
+        rules.append(f".holographic-text, .neon-subtitle {{ color: {theme['accent']}; "
+                     f"-webkit-text-fill-color: {theme['accent']}; }}")
+        rules.append(f".cyber-divider {{ background: {theme['accent']}; }}")
+    return "\n".join(rules)
+
+
+class BoundedCache:
+    """LRU cache bounded by the total size of its str/bytes values"""
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        # Reentrant and public, so a hot reload can swap content and invalidate entries as one step
+        self.lock = threading.RLock()
+
+    def get(self, key):
+        """Return a cached value (refreshing its recency), or None"""
+        with self.lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, value, is_current=None):
+        """Store a value unless it alone exceeds the bound, evicting least recently used entries
+
+        is_current is checked under the lock; when it returns False the value was computed from content
+        replaced meanwhile, and it is returned without being stored.
+        """
+        size = len(value)
+        if size > self.max_bytes:
+            return value
+        with self.lock:
+            if is_current is not None and not is_current():
+                return value
+            if key in self._entries:
+                self.size -= self._entries.pop(key)[1]
+            self._entries[key] = (value, size)
+            self.size += size
+            while self.size > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self.size -= evicted_size
+        return value
+
+    def get_or_set(self, key, compute, is_current=None):
+        """Return the cached value for key, computing and storing it (if still current) on a miss"""
+        value = self.get(key)
+        return value if value is not None else self.put(key, compute(), is_current)
+
+    def discard(self, key):
+        """Drop one entry if present"""
+        with self.lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self.size -= entry[1]
+
+    def clear(self):
+        """Drop every entry"""
+        with self.lock:
+            self._entries.clear()
+            self.size = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class TenantRegistry:
+    """Loads tenants on first request and keeps at most max_tenants, each with its own bounded cache"""
+
+    def __init__(self, tenants_dir=TENANTS_DIR, max_tenants=MAX_TENANTS, cache_bytes=TENANT_CACHE_BYTES):
+        self.tenants_dir = Path(tenants_dir)
+        self.max_tenants = max_tenants
+        self.cache_bytes = cache_bytes
+        self._tenants = OrderedDict()
+        self._lock = threading.Lock()
+
+    def load(self, tenant_id):
+        """Build the tenant record for an id, or None when no such bundle exists"""
+        if tenant_id == DEFAULT_TENANT:
+            bundle, theme = default_bundle(), {}
+        else:
+            try:
+                bundle, theme = load_bundle(tenant_id, self.tenants_dir)
+            except (OSError, ValueError, KeyError):
+                return None
+        files = content_files(tenant_id, bundle, self.tenants_dir)
+        return {
+            "id": tenant_id,
+            "bundle": bundle,
+            "theme": theme,
+            "version": content_version(bundle, with_resume=tenant_id == DEFAULT_TENANT),
+            "cache": BoundedCache(self.cache_bytes),
+            # Which cache entries were rendered from which records, for targeted invalidation
+            "graph": DependencyGraph(),
+            "files": files,
+            "mtimes": file_mtimes(files),
+            "search": None,
+            "tags": None,
+            # Images changed since the hashed assets were built are served from disk instead
+            "stale_images": set(),
+        }
+
+    def peek(self, tenant_id):
+        """Return a loaded tenant without loading it or refreshing its recency"""
+        with self._lock:
+            return self._tenants.get(tenant_id)
+
+    def read_bundle(self, tenant_id):
+        """Read a tenant's content files again"""
+        if tenant_id == DEFAULT_TENANT:
+            return load_module_bundle(CONTENT_MODULE_PATH), {}
+        return load_bundle(tenant_id, self.tenants_dir)
+
+    def reload(self, tenant_id, changed_paths):
+        """Apply changed content files, invalidating only what depends on the changed records"""
+        tenant = self.peek(tenant_id)
+        old_bundle = tenant["bundle"]
+        file_keys = {tenant["files"][path] for path in changed_paths if path in tenant["files"]}
+        if "file:content" in file_keys:
+            bundle, theme = self.read_bundle(tenant_id)
+        else:
+            bundle, theme = old_bundle, tenant["theme"]
+
+        changed = diff_bundles(old_bundle, bundle) | file_keys
+
+        is_default = tenant_id == DEFAULT_TENANT
+        search = tenant["search"]
+        if search is not None:
+            search = self.update_search_index(search, bundle, changed, is_default)
+        tags = tenant["tags"]
+        if any(key.startswith(("projects:", "courses:")) for key in changed):
+            tags = None
+        stale_images = tenant["stale_images"] | {key[len("file:"):] for key in file_keys
+                                                  if key[len("file:"):] in image_paths(bundle)}
+
+        files = content_files(tenant_id, bundle, self.tenants_dir)
+        # Swapped and invalidated under the cache lock: a rerun that read the old content either stored
+        # its HTML before this (and it is dropped here) or finds the version changed and does not store it
+        with tenant["cache"].lock:
+            # One update so a concurrent rerun sees either the old content or the new, never a mix
+            tenant.update({
+                "bundle": bundle,
+                "theme": theme,
+                "version": content_version(bundle, with_resume=is_default),
+                "files": files,
+                "mtimes": file_mtimes(files),
+                "search": search,
+                "tags": tags,
+                "stale_images": stale_images,
+            })
+            for key in tenant["graph"].invalidate(changed):
+                tenant["cache"].discard(key)
+        return changed
+
+    @staticmethod
+    def update_search_index(index, bundle, changed, with_resume):
+        """Re-index only the documents of changed records, on a copy that is swapped in whole"""
+        index = copy.deepcopy(index)
+        documents = {doc["id"]: doc for doc in search_documents(bundle, with_resume=with_resume)}
+
+        doc_ids = set()
+        for key in changed:
+            collection, _, record_id = key.partition(":")
+            if collection in SEARCH_PREFIXES:
+                doc_ids.add(f"{SEARCH_PREFIXES[collection]}:{record_id}")
+        if "file:resume" in changed:
+            doc_ids |= {doc["id"] for doc in index.documents if doc is not None and doc["id"].startswith("resume:")}
+            doc_ids |= {doc_id for doc_id in documents if doc_id.startswith("resume:")}
+
+        for doc_id in doc_ids:
+            index.remove(doc_id)
+            if doc_id in documents:
+                index.add(documents[doc_id])
+        return index
+
+    def search_index(self, tenant):
+        """The tenant's search index, built on first use and then updated incrementally"""
+        if tenant["search"] is None:
+            if tenant["id"] == DEFAULT_TENANT:
+                tenant["search"] = load_index(SEARCH_INDEX_PATH)
+            else:
+                tenant["search"] = SearchIndex(search_documents(tenant["bundle"]))
+        return tenant["search"]
+
+    def tag_index(self, tenant):
+        """The tenant's tag bitmap index, rebuilt only after its projects or courses change"""
+        if tenant["tags"] is None:
+            tenant["tags"] = build_tag_index(tenant["bundle"])
+        return tenant["tags"]
+
+    def get(self, tenant_id):
+        """Return a tenant, loading it and evicting the least recently used tenant if needed"""
+        with self._lock:
+            tenant = self._tenants.get(tenant_id)
+            if tenant is not None:
+                self._tenants.move_to_end(tenant_id)
+                return tenant
+
+        tenant = self.load(tenant_id)
+        if tenant is None:
+            return None
+
+        with self._lock:
+            tenant = self._tenants.setdefault(tenant_id, tenant)
+            while len(self._tenants) > self.max_tenants:
+                self._tenants.popitem(last=False)
+        return tenant
+
+    def tenant_ids(self):
+        """Ids of the tenants currently loaded"""
+        with self._lock:
+            return list(self._tenants)